@@ -0,0 +1,63 @@
+"""add boss attendance tables
+
+Revision ID: 3f9c1e7a2b84
+Revises: 64347b60c565
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c1e7a2b84'
+down_revision: Union[str, Sequence[str], None] = '64347b60c565'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "boss_poll_archives",
+        sa.Column("poll_type", sa.String(), nullable=False),
+        sa.Column("channel_id", sa.String(), nullable=False),
+        sa.Column("poll_date", sa.Date(), nullable=False),
+        sa.Column("message_id", sa.String(), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("poll_type", "channel_id", "poll_date", name="pk_boss_poll_archive"),
+    )
+    op.create_index(
+        "ix_boss_poll_archive_channel_date",
+        "boss_poll_archives",
+        ["channel_id", "poll_date"],
+    )
+    op.create_table(
+        "boss_attendance",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("poll_type", sa.String(), nullable=False),
+        sa.Column("channel_id", sa.String(), nullable=False),
+        sa.Column("poll_date", sa.Date(), nullable=False),
+        sa.Column("boss", sa.String(), nullable=False),
+        sa.Column("member", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "poll_type", "channel_id", "poll_date", "boss", "member",
+            name="uq_boss_attendance_identity",
+        ),
+    )
+    op.create_index(
+        "ix_boss_attendance_member_date",
+        "boss_attendance",
+        ["member", "channel_id", "poll_date"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_boss_attendance_member_date", table_name="boss_attendance")
+    op.drop_table("boss_attendance")
+    op.drop_index("ix_boss_poll_archive_channel_date", table_name="boss_poll_archives")
+    op.drop_table("boss_poll_archives")
@@ -0,0 +1,42 @@
+"""add market_prices table
+
+Revision ID: 8d2e4b6c1a97
+Revises: 3f9c1e7a2b84
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2e4b6c1a97'
+down_revision: Union[str, Sequence[str], None] = '3f9c1e7a2b84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "market_prices",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("item_id", sa.Integer(), nullable=False),
+        sa.Column("fetched_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("lowest_sell_price", sa.Float(), nullable=False),
+        sa.Column("average_price", sa.Float(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_market_price_item_time",
+        "market_prices",
+        ["item_id", "fetched_at"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_market_price_item_time", table_name="market_prices")
+    op.drop_table("market_prices")
@@ -0,0 +1,32 @@
+"""add clan_logs keyset pagination indexes
+
+Revision ID: e4b81f3a6c52
+Revises: c5a7e2d94f18
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b81f3a6c52'
+down_revision: Union[str, Sequence[str], None] = 'c5a7e2d94f18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_clan_log_time", "clan_logs", ["timestamp", "id"])
+    op.create_index("ix_clan_log_type_time", "clan_logs", ["log_type", "timestamp", "id"])
+    op.create_index("ix_clan_log_member_time", "clan_logs", ["member_username", "timestamp", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_clan_log_member_time", table_name="clan_logs")
+    op.drop_index("ix_clan_log_type_time", table_name="clan_logs")
+    op.drop_index("ix_clan_log_time", table_name="clan_logs")
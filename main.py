@@ -8,9 +8,14 @@ logging.basicConfig(level=logging.INFO)
 
 from src.discord_client import *
 from src.commands.boss import *
+from src.commands.boss_attendance import *
 from src.commands.boss_summary import *
+from src.commands.forecast import *
 from src.commands.keys import *
 from src.commands.market_food import *
+from src.commands.market_history import *
+from src.commands.market_value import *
+from src.commands.price_alerts import *
 
 TOKEN: str = os.getenv("TOKEN") or ""
 
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark the autocomplete index against the old per-keystroke substring scan.
+
+Types each query one character at a time, the way Discord sends autocomplete
+requests, and reports per-keystroke latency on a synthetic catalog.
+
+Usage:
+    uv run python scripts/bench_autocomplete.py
+    uv run python scripts/bench_autocomplete.py 10000
+"""
+
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tasks.autocomplete import AutocompleteIndex
+
+DEFAULT_SIZE = 5000
+DISCORD_DEADLINE_MS = 3000
+
+PREFIXES = ["cooked", "raw", "enchanted", "ancient", "gilded", "refined", "broken", "lucky"]
+NOUNS = ["trout", "salmon", "plank", "bar", "arrow", "potion", "ring", "amulet", "scroll", "ore"]
+SUFFIXES = ["", "of power", "of haste", "of the deep", "fragment", "bundle"]
+
+
+def build_catalog(size: int, rng: random.Random) -> list[str]:
+    names = set()
+    while len(names) < size:
+        parts = [rng.choice(PREFIXES), rng.choice(NOUNS), rng.choice(SUFFIXES), str(rng.randint(1, 99))]
+        names.add(" ".join(part for part in parts if part))
+    return sorted(names)
+
+
+def linear_scan(names: list[str], current: str) -> list[str]:
+    """The old autocomplete: lowercase and substring-check every name."""
+    return [name for name in names if current.lower() in name.lower()][:25]
+
+
+def keystroke_latencies(search, queries: list[str]) -> list[float]:
+    latencies = []
+    for query in queries:
+        for end in range(1, len(query) + 1):
+            start = time.perf_counter()
+            search(query[:end])
+            latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def report(label: str, latencies: list[float]) -> None:
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{label:>10}: mean {statistics.mean(latencies):.3f} ms, "
+        f"p99 {p99:.3f} ms, max {latencies[-1]:.3f} ms"
+    )
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE
+    rng = random.Random(42)
+    names = build_catalog(size, rng)
+
+    start = time.perf_counter()
+    index = AutocompleteIndex((name.title(), name) for name in names)
+    print(f"built index over {size} names in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    queries = rng.sample(names, 200)
+    # Typos: drop one character from the middle of some queries
+    queries += [q[: len(q) // 2] + q[len(q) // 2 + 1 :] for q in rng.sample(names, 50)]
+
+    index_latencies = keystroke_latencies(index.search, queries)
+    scan_latencies = keystroke_latencies(lambda q: linear_scan(names, q), queries)
+    report("index", index_latencies)
+    report("scan", scan_latencies)
+    print(f"{len(index_latencies)} keystrokes, Discord deadline {DISCORD_DEADLINE_MS} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Pareto-frontier sweep against the old pairwise dominance check.
+
+Checks that both return the same items (including on the real food table) and
+times them on random catalogs of increasing size.
+
+Usage:
+    uv run python scripts/bench_pareto.py
+    uv run python scripts/bench_pareto.py 1000 5000 20000
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tasks.pareto import pareto_frontier
+
+FOOD_HEALING_VALUES = {
+    "cooked_piranha": 2, "cooked_perch": 3, "cooked_mackerel": 4, "cooked_cod": 6,
+    "cooked_trout": 7, "cooked_salmon": 8, "cooked_carp": 10, "cooked_zander": 12,
+    "cooked_pufferfish": 14, "cooked_anglerfish": 16, "cooked_tuna": 17,
+    "cooked_bloodmoon_eel": 24, "cooked_meat": 4, "cooked_giant_meat": 8,
+    "cooked_quality_meat": 12, "cooked_superior_meat": 18, "cooked_apex_meat": 20,
+    "potato_soup": 5, "meat_burger": 7, "cod_soup": 10, "blueberry_pie": 11,
+    "salmon_salad": 14, "porcini_soup": 17, "stew": 19, "power_pizza": 22,
+}
+
+DEFAULT_SIZES = [100, 1000, 5000, 20000]
+PAIRWISE_LIMIT = 5000  # the quadratic check gets too slow to time beyond this
+
+
+def pairwise_frontier(items: list[tuple[int, float]]) -> list[tuple[int, float]]:
+    """The original O(n^2) check from market_food (since replaced by market_value.score_category)."""
+    non_dominated = []
+    for i, (value_i, cost_i) in enumerate(items):
+        if not any(
+            i != j and value_j >= value_i and cost_j < cost_i
+            for j, (value_j, cost_j) in enumerate(items)
+        ):
+            non_dominated.append((value_i, cost_i))
+    return non_dominated
+
+
+def sweep_frontier(items: list[tuple[int, float]]) -> list[tuple[int, float]]:
+    return pareto_frontier(items, value=lambda x: x[0], costs=[lambda x: x[1]])
+
+
+def random_catalog(size: int, rng: random.Random) -> list[tuple[int, float]]:
+    # Small integer values and rounded costs so ties actually occur
+    return [(rng.randint(1, 200), round(rng.uniform(1, 500), 1)) for _ in range(size)]
+
+
+def timed(fn, items) -> tuple[list, float]:
+    start = time.perf_counter()
+    result = fn(items)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    rng = random.Random(42)
+
+    # Same frontier on the food table for a few random price maps
+    for _ in range(100):
+        foods = [
+            (healing, round(rng.uniform(5, 400), 0) / healing)
+            for healing in FOOD_HEALING_VALUES.values()
+        ]
+        assert sweep_frontier(foods) == pairwise_frontier(foods), foods
+    print("food table: sweep matches pairwise check on 100 price maps")
+
+    print(f"{'items':>8} {'frontier':>9} {'sweep ms':>10} {'pairwise ms':>12}")
+    for size in sizes:
+        items = random_catalog(size, rng)
+        frontier, sweep_ms = timed(sweep_frontier, items)
+        if size <= PAIRWISE_LIMIT:
+            expected, pairwise_ms = timed(pairwise_frontier, items)
+            assert frontier == expected, f"mismatch at {size} items"
+            pairwise_text = f"{pairwise_ms:.1f}"
+        else:
+            pairwise_text = "skipped"
+        print(f"{size:>8} {len(frontier):>9} {sweep_ms:>10.1f} {pairwise_text:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Benchmark clan log ingestion and outbox queries under each SQLite profile.
+
+Each profile gets a fresh database file with the clan_logs schema, then:
+
+- ingest: batches of 10 rows, each an INSERT ... ON CONFLICT DO NOTHING per
+  row and one commit, like recent_fetch_clanlog
+- outbox: fetch the 10 oldest unsent rows and mark them sent, like
+  send_messages
+- mixed: ingest in one thread while another runs outbox reads, counting
+  "database is locked" errors
+
+Usage:
+    uv run python scripts/bench_sqlite_profiles.py
+    uv run python scripts/bench_sqlite_profiles.py 2000   # ingest batches
+"""
+
+import importlib.util
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Load the profiles module by path: importing it through the src.db package
+# would run src/db/__init__.py, which needs SQLAlchemy and builds the engine
+_PROFILES_PATH = Path(__file__).parent.parent / "src" / "db" / "sqlite_profiles.py"
+_spec = importlib.util.spec_from_file_location("sqlite_profiles", _PROFILES_PATH)
+sqlite_profiles = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(sqlite_profiles)
+
+SQLITE_PROFILES = sqlite_profiles.SQLITE_PROFILES
+apply_sqlite_profile = sqlite_profiles.apply_sqlite_profile
+
+DEFAULT_BATCHES = 1000
+BATCH_SIZE = 10
+MIXED_SECONDS = 3.0
+
+SCHEMA = """
+CREATE TABLE clan_logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    clan_name VARCHAR NOT NULL,
+    member_username VARCHAR NOT NULL,
+    message VARCHAR NOT NULL,
+    timestamp VARCHAR NOT NULL,
+    message_sent BOOLEAN NOT NULL DEFAULT 0,
+    log_type VARCHAR NOT NULL,
+    CONSTRAINT uq_clan_log_identity UNIQUE (clan_name, member_username, message, timestamp)
+);
+CREATE INDEX ix_clan_log_time ON clan_logs (timestamp, id);
+CREATE INDEX ix_clan_log_type_time ON clan_logs (log_type, timestamp, id);
+CREATE INDEX ix_clan_log_member_time ON clan_logs (member_username, timestamp, id);
+"""
+
+INSERT = """
+INSERT INTO clan_logs (clan_name, member_username, message, timestamp, message_sent, log_type)
+VALUES (?, ?, ?, ?, 0, ?)
+ON CONFLICT (clan_name, member_username, message, timestamp) DO NOTHING
+"""
+
+SELECT_PENDING = "SELECT id FROM clan_logs WHERE message_sent = 0 ORDER BY timestamp ASC LIMIT 10"
+
+
+def connect(path: Path, pragmas: dict) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, check_same_thread=False)
+    apply_sqlite_profile(conn, pragmas)
+    return conn
+
+
+def rows(start: int, count: int) -> list[tuple]:
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        (
+            "KlutzCo",
+            f"member{n % 40}",
+            f"member{n % 40} added {n}x Gold.",
+            (base + timedelta(seconds=n)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "vault_deposit",
+        )
+        for n in range(start, start + count)
+    ]
+
+
+def ingest(conn: sqlite3.Connection, batches: int, offset: int = 0) -> int:
+    """Insert batches of rows, one commit per batch. Returns locked errors."""
+    locked = 0
+    for batch in range(batches):
+        try:
+            for row in rows(offset + batch * BATCH_SIZE, BATCH_SIZE):
+                conn.execute(INSERT, row)
+            conn.commit()
+        except sqlite3.OperationalError:
+            conn.rollback()
+            locked += 1
+    return locked
+
+
+def drain_outbox(conn: sqlite3.Connection) -> int:
+    """Send pending rows 10 at a time until none are left. Returns cycles."""
+    cycles = 0
+    while True:
+        ids = [row[0] for row in conn.execute(SELECT_PENDING)]
+        if not ids:
+            return cycles
+        conn.execute(f"UPDATE clan_logs SET message_sent = 1 WHERE id IN ({','.join('?' * len(ids))})", ids)
+        conn.commit()
+        cycles += 1
+
+
+def mixed(path: Path, pragmas: dict, seconds: float) -> tuple[int, int, int]:
+    """Writer and reader in parallel. Returns (write batches, reads, locked errors)."""
+    stop = threading.Event()
+    counts = {"reads": 0, "locked": 0}
+
+    def reader() -> None:
+        conn = connect(path, pragmas)
+        while not stop.is_set():
+            try:
+                # Hold a read transaction across two queries, like a session does
+                conn.execute("BEGIN")
+                conn.execute(SELECT_PENDING).fetchall()
+                conn.execute("SELECT count(*) FROM clan_logs WHERE message_sent = 0").fetchone()
+                conn.execute("COMMIT")
+                counts["reads"] += 1
+            except sqlite3.OperationalError:
+                conn.rollback()
+                counts["locked"] += 1
+        conn.close()
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+
+    writer = connect(path, pragmas)
+    batches = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        counts["locked"] += ingest(writer, 1, offset=10_000_000 + batches * BATCH_SIZE)
+        batches += 1
+    writer.close()
+
+    stop.set()
+    thread.join()
+    return batches, counts["reads"], counts["locked"]
+
+
+def bench_profile(name: str, pragmas: dict, batches: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        conn = connect(path, pragmas)
+        conn.executescript(SCHEMA)
+
+        start = time.perf_counter()
+        ingest(conn, batches)
+        ingest_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cycles = drain_outbox(conn)
+        outbox_s = time.perf_counter() - start
+        conn.close()
+
+        write_batches, reads, locked = mixed(path, pragmas, MIXED_SECONDS)
+
+    print(
+        f"{name:>8} {batches * BATCH_SIZE / ingest_s:>12.0f} {batches / ingest_s:>11.0f} "
+        f"{cycles / outbox_s:>11.0f} {write_batches / MIXED_SECONDS:>13.0f} "
+        f"{reads / MIXED_SECONDS:>12.0f} {locked:>7}"
+    )
+
+
+def main() -> None:
+    batches = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BATCHES
+    print(f"{batches} ingest batches of {BATCH_SIZE} rows, {MIXED_SECONDS:.0f}s mixed run")
+    print(
+        f"{'profile':>8} {'ingest r/s':>12} {'commits/s':>11} {'outbox c/s':>11} "
+        f"{'mixed wr b/s':>13} {'mixed rd/s':>12} {'locked':>7}"
+    )
+    for name, pragmas in SQLITE_PROFILES.items():
+        bench_profile(name, pragmas, batches)
+
+
+if __name__ == "__main__":
+    main()
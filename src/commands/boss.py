@@ -1,8 +1,27 @@
 from src.discord_client import *
-from src.models import BossEntry,ALL_BOSSES
+from src.models import BossEntry,BOSSES_BY_NAME
+from src.tasks.autocomplete import AutocompleteIndex
+from src.tasks.static_embeds import render_static_embeds
 
-# Build the mapping from key -> BossEntry based on the 'key' field
-BOSSES_INFORMATION = {entry.name: entry for entry in ALL_BOSSES}
+# Mapping from name -> BossEntry, straight from the boss registry
+BOSSES_INFORMATION = BOSSES_BY_NAME
+BOSS_INDEX = AutocompleteIndex((key.capitalize(), key) for key in BOSSES_INFORMATION)
+
+
+def _render_boss_embed(entry: BossEntry) -> discord.Embed:
+    embed = discord.Embed()
+    embed.title = entry.name.capitalize()
+    embed.description = f"""
+    Key needed: **{entry.key.capitalize()}**
+    Attack style: 🛡️{entry.attack_style}
+    Attack style weakness: ⚔️{entry.attack_weakness}"""
+    embed.url = "https://wiki.idleclans.com/index.php/" + entry.wiki
+    embed.color = entry.trim_color
+    return embed
+
+
+# Rendered once; shared between calls, never modify
+BOSS_EMBEDS = render_static_embeds(BOSSES_INFORMATION.values(), lambda entry: entry.name, _render_boss_embed)
 
 
 @tree.command(name="boss", description="Find a boss information by its name")
@@ -18,28 +37,18 @@ async def boss(
     just_for_me: bool = False,
 ) -> None:
     logging.info(f"[boss] Processing boss command for boss: {name} from user: {interaction.user} in guild: {interaction.guild}")
-    embed = discord.Embed()
-    entry = BOSSES_INFORMATION.get(name.lower())
-    if entry is None:
+    embed = BOSS_EMBEDS.get(name.lower())
+    if embed is None:
         await interaction.response.send_message(f"Unknown boss: {name}", ephemeral=just_for_me)
         return
-    embed.title = name.capitalize()
-    embed.description = f"""
-    Key needed: **{entry.key.capitalize()}**
-    Attack style: 🛡️{entry.attack_style}
-    Attack style weakness: ⚔️{entry.attack_weakness}"""
-    embed.url = "https://wiki.idleclans.com/index.php/" + entry.wiki
-    embed.color = entry.trim_color
-    await interaction.response.send_message(embeds=[embed], ephemeral=just_for_me)
+    await interaction.response.send_message(embed=embed, ephemeral=just_for_me)
 
 @boss.autocomplete("name")
 async def boss_autocomplete(
     interaction: discord.Interaction,
     current: str,
 ) -> list[discord.app_commands.Choice]:
-    choices = [
-        discord.app_commands.Choice(name=key.capitalize(), value=key)
-        for key in BOSSES_INFORMATION.keys()
-        if current.lower() in key.lower()
-    ]
-    return choices[:25]
\ No newline at end of file
+    return [
+        discord.app_commands.Choice(name=label, value=value)
+        for label, value in BOSS_INDEX.search(current)
+    ]
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""Boss attendance command - participation rates and streaks from archived polls."""
+
+import logging
+import os
+
+import discord
+from discord import app_commands
+
+from src.discord_client import tree
+from src.tasks.boss_attendance import AttendanceStats, get_attendance_stats
+from src.tasks.boss_scheduler import DEFAULT_CHANNEL
+from src.tasks.boss_summary import MEMBER_TO_DISCORD
+from src.tasks.utils import find_channels
+
+MAX_DAYS = 365
+
+
+def _format_rate(attended: int, total: int) -> str:
+    if total == 0:
+        return "no polls"
+    return f"{attended}/{total} ({attended / total:.0%})"
+
+
+def _format_attendance_embed(stats: AttendanceStats) -> discord.Embed:
+    """Create Discord embed for a member's boss attendance.
+
+    Args:
+        stats: Attendance stats to display
+
+    Returns:
+        Discord embed with formatted attendance
+    """
+    display_name = MEMBER_TO_DISCORD.get(stats.member, stats.member)
+    embed = discord.Embed(
+        title=f"Boss attendance - {display_name}",
+        description=f"Archived polls from the last {stats.days} days",
+        color=0x9B59B6,  # Purple
+    )
+    embed.add_field(
+        name="Daily polls", value=_format_rate(stats.daily_attended, stats.daily_polls), inline=True
+    )
+    embed.add_field(
+        name="Weekly polls", value=_format_rate(stats.weekly_attended, stats.weekly_polls), inline=True
+    )
+    embed.add_field(
+        name="Streak",
+        value=f"{stats.current_streak} current, {stats.longest_streak} best",
+        inline=True,
+    )
+
+    if stats.boss_counts:
+        lines = [
+            f"{boss}: {_format_rate(count, stats.daily_polls)}"
+            for boss, count in sorted(stats.boss_counts.items(), key=lambda x: -x[1])
+        ]
+        embed.add_field(name="Daily sign-ups per boss", value="\n".join(lines), inline=False)
+
+    return embed
+
+
+@tree.command(
+    name="boss-attendance",
+    description="Show a member's boss poll participation rates and streaks",
+)
+@app_commands.describe(
+    member="The clan member to look up",
+    days="How many days of history to include (default: 30)",
+    just_for_me="Only show the results to me (default: visible to everyone)",
+)
+async def boss_attendance(
+    interaction: discord.Interaction,
+    member: str,
+    days: app_commands.Range[int, 1, MAX_DAYS] = 30,
+    just_for_me: bool = False,
+):
+    """Show boss poll attendance for a clan member.
+
+    Args:
+        interaction: Discord interaction
+        member: Game username of the member
+        days: Size of the history window in days
+        just_for_me: Whether to show results only to the user
+    """
+    logging.info(f"[boss-attendance] Processing attendance for {member} ({days}d) from user: {interaction.user}")
+    if member not in MEMBER_TO_DISCORD:
+        await interaction.response.send_message(f"Unknown member: {member}", ephemeral=True)
+        return
+
+    # Use the poll channel the command is run in, otherwise the first configured one
+    channel_spec = os.getenv("BOSS_POLL_CHANNEL", DEFAULT_CHANNEL)
+    channels = find_channels(interaction.client, channel_spec)
+    if not channels:
+        await interaction.response.send_message(f"Poll channel {channel_spec} not found.", ephemeral=True)
+        return
+    channel = next((c for c in channels if c.id == interaction.channel_id), channels[0])
+
+    await interaction.response.defer(ephemeral=just_for_me)
+    try:
+        stats = await get_attendance_stats(member, str(channel.id), days)
+    except Exception as e:
+        logging.error("[boss-attendance] failed to load stats: %s", e, exc_info=True)
+        await interaction.followup.send("❌ Failed to load attendance history.", ephemeral=True)
+        return
+
+    await interaction.followup.send(embed=_format_attendance_embed(stats), ephemeral=just_for_me)
+
+
+@boss_attendance.autocomplete("member")
+async def boss_attendance_member_autocomplete(
+    interaction: discord.Interaction,
+    current: str,
+) -> list[app_commands.Choice]:
+    choices = [
+        app_commands.Choice(name=MEMBER_TO_DISCORD[name], value=name)
+        for name in MEMBER_TO_DISCORD
+        if current.lower() in name.lower() or current.lower() in MEMBER_TO_DISCORD[name].lower()
+    ]
+    return choices[:25]
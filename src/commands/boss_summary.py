@@ -17,12 +17,17 @@ from src.discord_client import tree
 async def boss_summary(interaction: discord.Interaction):
     """Manually regenerate boss summary (ephemeral confirmation)."""
     # Import here to avoid circular dependency
-    from src.tasks.boss_summary import _regenerate_boss_summary
+    from src.tasks.boss_summary import submit_boss_summary
+    from src.tasks.job_queue import wait_for_job
 
     await interaction.response.defer(ephemeral=True)
 
     try:
-        await _regenerate_boss_summary(interaction.client)
+        # Joins a regeneration that is already running instead of starting another
+        job, _ = submit_boss_summary(interaction.client)
+        await wait_for_job(job)
+        if job.status == "failed":
+            raise RuntimeError(job.error)
         await interaction.followup.send(
             "✅ Boss summary has been regenerated!",
             ephemeral=True
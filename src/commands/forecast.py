@@ -0,0 +1,114 @@
+"""Forecast command - projects time to the next level from recent XP rates."""
+
+import logging
+
+import discord
+from discord import app_commands
+
+from src.discord_client import tree
+from src.tasks.xp_fetcher import PLAYER_NAMES
+from src.tasks.xp_tracker import MAX_LEVEL, SKILL_NAMES, Forecast, get_forecast
+
+
+def _format_duration(hours: float) -> str:
+    """Format a duration in hours as a compact days/hours string."""
+    days, rem_hours = divmod(round(hours), 24)
+    if days:
+        return f"{days}d {rem_hours}h"
+    return f"{rem_hours}h"
+
+
+def _format_forecast_embed(forecast: Forecast) -> discord.Embed:
+    """Create Discord embed for a level forecast.
+
+    Args:
+        forecast: Forecast to display
+
+    Returns:
+        Discord embed with the formatted forecast
+    """
+    embed = discord.Embed(
+        title=f"{forecast.player_name} - {forecast.skill.capitalize()} {forecast.level}",
+        color=0x3498DB,  # Blue
+    )
+    embed.add_field(name="Current XP", value=f"{forecast.xp:,}", inline=True)
+    embed.add_field(name="XP/hour", value=f"{forecast.xp_per_hour:,.0f}", inline=True)
+
+    if forecast.next_level_xp is None:
+        embed.description = f"Already at max level ({MAX_LEVEL})."
+    else:
+        remaining = forecast.next_level_xp - forecast.xp
+        embed.add_field(name=f"XP to {forecast.level + 1}", value=f"{remaining:,}", inline=True)
+        if forecast.eta is None:
+            embed.description = "No XP gained recently, cannot project the next level."
+        else:
+            hours = forecast.eta.total_seconds() / 3600
+            embed.description = f"Level {forecast.level + 1} in about **{_format_duration(hours)}**."
+
+    embed.set_footer(text=f"Based on the last {_format_duration(forecast.window_hours)} of snapshots")
+    return embed
+
+
+@tree.command(
+    name="forecast",
+    description="Project how long until a player's next level in a skill",
+)
+@app_commands.describe(
+    player="The player to forecast",
+    skill="The skill to forecast",
+    just_for_me="Only show the results to me (default: visible to everyone)",
+)
+async def forecast(
+    interaction: discord.Interaction,
+    player: str,
+    skill: str,
+    just_for_me: bool = False,
+):
+    """Show the time-to-next-level forecast for a player skill.
+
+    Args:
+        interaction: Discord interaction
+        player: Player name
+        skill: Skill name
+        just_for_me: Whether to show results only to the user
+    """
+    logging.info(f"[forecast] Processing forecast for {player}/{skill} from user: {interaction.user}")
+    skill = skill.lower()
+    if player not in PLAYER_NAMES or skill not in SKILL_NAMES:
+        await interaction.response.send_message(f"Unknown player or skill: {player} / {skill}", ephemeral=True)
+        return
+
+    result = get_forecast(player, skill)
+    if result is None:
+        await interaction.response.send_message(
+            f"No XP history yet for {player} in {skill.capitalize()}.", ephemeral=True
+        )
+        return
+
+    await interaction.response.send_message(embed=_format_forecast_embed(result), ephemeral=just_for_me)
+
+
+@forecast.autocomplete("player")
+async def forecast_player_autocomplete(
+    interaction: discord.Interaction,
+    current: str,
+) -> list[app_commands.Choice]:
+    choices = [
+        app_commands.Choice(name=name, value=name)
+        for name in PLAYER_NAMES
+        if current.lower() in name.lower()
+    ]
+    return choices[:25]
+
+
+@forecast.autocomplete("skill")
+async def forecast_skill_autocomplete(
+    interaction: discord.Interaction,
+    current: str,
+) -> list[app_commands.Choice]:
+    choices = [
+        app_commands.Choice(name=skill.capitalize(), value=skill)
+        for skill in SKILL_NAMES
+        if current.lower() in skill
+    ]
+    return choices[:25]
@@ -1,8 +1,27 @@
 from src.discord_client import *
-from src.models import BossEntry,ALL_BOSSES
+from src.models import BossEntry,BOSSES_BY_KEY
+from src.tasks.autocomplete import AutocompleteIndex
+from src.tasks.static_embeds import render_static_embeds
 
-# Build the mapping from key -> BossEntry based on the 'key' field
-KEYS_INFORMATION = {entry.key: entry for entry in ALL_BOSSES}
+# Mapping from key -> BossEntry, straight from the boss registry
+KEYS_INFORMATION = BOSSES_BY_KEY
+KEY_INDEX = AutocompleteIndex((key.capitalize(), key) for key in KEYS_INFORMATION)
+
+
+def _render_key_embed(entry: BossEntry) -> discord.Embed:
+    embed = discord.Embed()
+    embed.title = entry.key.capitalize() + " key"
+    embed.description = f"""
+**{entry.name.capitalize()}**
+Attack style: 🛡️{entry.attack_style}
+Attack style weakness: ⚔️{entry.attack_weakness}"""
+    embed.url = "https://wiki.idleclans.com/index.php/" + entry.wiki
+    embed.color = entry.trim_color
+    return embed
+
+
+# Rendered once; shared between calls, never modify
+KEY_EMBEDS = render_static_embeds(KEYS_INFORMATION.values(), lambda entry: entry.key, _render_key_embed)
 
 
 @tree.command(name="keys", description="Find a boss information by its key")
@@ -19,19 +38,11 @@ async def key(
 ) -> None:
     logging.info(
         f"[keys] Processing key command for key: {name} from user: {interaction.user} in guild: {interaction.guild}")
-    embed = discord.Embed()
-    key = KEYS_INFORMATION.get(name.lower())
-    if key is None:
+    embed = KEY_EMBEDS.get(name.lower())
+    if embed is None:
         await interaction.response.send_message(f"Unknown key: {name}", ephemeral=just_for_me)
         return
-    embed.title = name.capitalize() + " key"
-    embed.description = f"""
-**{key.name.capitalize()}**
-Attack style: 🛡️{key.attack_style}
-Attack style weakness: ⚔️{key.attack_weakness}"""
-    embed.url = "https://wiki.idleclans.com/index.php/" + key.wiki
-    embed.color = key.trim_color
-    await interaction.response.send_message(embeds=[embed], ephemeral=just_for_me)
+    await interaction.response.send_message(embed=embed, ephemeral=just_for_me)
 
 
 @key.autocomplete("name")
@@ -39,9 +50,7 @@ async def key_autocomplete(
         interaction: discord.Interaction,
         current: str,
 ) -> list[discord.app_commands.Choice]:
-    choices = [
-        discord.app_commands.Choice(name=key.capitalize(), value=key)
-        for key in KEYS_INFORMATION.keys()
-        if current.lower() in key.lower()
+    return [
+        discord.app_commands.Choice(name=label, value=value)
+        for label, value in KEY_INDEX.search(current)
     ]
-    return choices[:25]
@@ -0,0 +1,110 @@
+"""Market history command - price trend and averages from stored snapshots."""
+
+import logging
+
+import discord
+from discord import app_commands
+
+from src.discord_client import tree
+from src.tasks.item_catalog import ITEM_ID_MAPPING, ITEM_INDEX
+from src.tasks.market_history import PriceHistory, get_price_history
+
+MAX_DAYS = 90
+
+
+def _display_name(name_id: str) -> str:
+    return name_id.replace("_", " ").title()
+
+
+def _format_price(price: float | None) -> str:
+    if price is None:
+        return "n/a"
+    return f"{price:,.1f}"
+
+
+def _format_history_embed(name_id: str, history: PriceHistory) -> discord.Embed:
+    """Create Discord embed for an item's price history.
+
+    Args:
+        name_id: Item name ID
+        history: Aggregated history to display
+
+    Returns:
+        Discord embed with the formatted history
+    """
+    embed = discord.Embed(
+        title=f"{_display_name(name_id)} - last {history.days} days",
+        color=0x2ECC71,  # Green
+    )
+    if history.latest_price is None:
+        embed.description = "No stored prices for this item yet."
+        return embed
+
+    if history.change_percent is not None:
+        arrow = "📈" if history.change_percent > 0 else "📉" if history.change_percent < 0 else "➡️"
+        embed.description = f"{arrow} **{history.change_percent:+.1f}%** over the window"
+
+    embed.add_field(name="Current", value=_format_price(history.latest_price), inline=True)
+    embed.add_field(
+        name="Time-weighted avg", value=_format_price(history.time_weighted_average), inline=True
+    )
+    embed.add_field(
+        name="Market avg", value=_format_price(history.latest_average_price), inline=True
+    )
+    embed.add_field(name="Low", value=_format_price(history.min_price), inline=True)
+    embed.add_field(name="High", value=_format_price(history.max_price), inline=True)
+    embed.add_field(name="Changes", value=str(history.changes), inline=True)
+
+    embed.set_footer(text="Lowest sell prices, stored when they change")
+    return embed
+
+
+@tree.command(
+    name="market-history",
+    description="Show the price trend of a market item",
+)
+@app_commands.describe(
+    item="The item to look up",
+    days="How many days of history to include (default: 7)",
+    just_for_me="Only show the results to me (default: visible to everyone)",
+)
+async def market_history(
+    interaction: discord.Interaction,
+    item: str,
+    days: app_commands.Range[int, 1, MAX_DAYS] = 7,
+    just_for_me: bool = False,
+):
+    """Show the price history of a market item.
+
+    Args:
+        interaction: Discord interaction
+        item: Item name ID
+        days: Size of the history window in days
+        just_for_me: Whether to show results only to the user
+    """
+    logging.info(f"[market-history] Processing history for {item} ({days}d) from user: {interaction.user}")
+    item_id = ITEM_ID_MAPPING.get(item)
+    if item_id is None:
+        await interaction.response.send_message(f"Unknown item: {item}", ephemeral=True)
+        return
+
+    await interaction.response.defer(ephemeral=just_for_me)
+    try:
+        history = await get_price_history(item_id, days)
+    except Exception as e:
+        logging.error("[market-history] failed to load history: %s", e, exc_info=True)
+        await interaction.followup.send("❌ Failed to load price history.", ephemeral=True)
+        return
+
+    await interaction.followup.send(embed=_format_history_embed(item, history), ephemeral=just_for_me)
+
+
+@market_history.autocomplete("item")
+async def market_history_item_autocomplete(
+    interaction: discord.Interaction,
+    current: str,
+) -> list[app_commands.Choice]:
+    return [
+        app_commands.Choice(name=label, value=value)
+        for label, value in ITEM_INDEX.search(current)
+    ]
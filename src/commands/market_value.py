@@ -0,0 +1,104 @@
+"""Market value command - ranks any catalog category by market price per unit of value."""
+
+import logging
+
+import discord
+from discord import app_commands
+
+from src.discord_client import tree
+from src.tasks.item_catalog import CATEGORIES, Category
+from src.tasks.market_prices import get_market_prices, get_price_cache_stats
+from src.tasks.market_value import ValueResult, score_category
+
+
+def _format_value_embed(category: Category, results: list[ValueResult]) -> discord.Embed:
+    """Create Discord embed for a scored category.
+
+    Args:
+        category: Category that was scored
+        results: Non-dominated results to display
+
+    Returns:
+        Discord embed with formatted values
+    """
+    embed = discord.Embed(
+        title=f"Market Values - {category.title}",
+        description=f"Showing {len(results)} economically viable items based on current market prices",
+        color=0x00FF00,  # Green
+    )
+
+    # Embeds hold at most 25 fields
+    for result in results[:25]:
+        item_name = result.name.replace("_", " ").title()
+        field_name = f"{result.value:g} {category.value_label} - {item_name}"
+        field_value = f"{result.price:.0f} g, {result.cost_per_value:.1f} g/{category.value_label}"
+        embed.add_field(name=field_name, value=field_value, inline=True)
+
+    age = get_price_cache_stats().age_seconds
+    age_text = f" · prices {age:.0f}s old" if age is not None else ""
+    embed.set_footer(text=f"Data from Idle Clans market API{age_text}")
+
+    return embed
+
+
+@tree.command(
+    name="market-value",
+    description="Show the most cost-effective items of a category based on current market prices",
+)
+@app_commands.describe(
+    category="The item category to rank",
+    just_for_me="Only show the results to me (default: visible to everyone)",
+)
+async def market_value(
+    interaction: discord.Interaction,
+    category: str,
+    just_for_me: bool = False,
+):
+    """Show cost-effective items of a catalog category.
+
+    Args:
+        interaction: Discord interaction
+        category: Catalog category name
+        just_for_me: Whether to show results only to the user
+    """
+    logging.info(f"[market-value] Processing {category} from user: {interaction.user}")
+    category_info = CATEGORIES.get(category.lower())
+    if category_info is None:
+        await interaction.response.send_message(f"Unknown category: {category}", ephemeral=True)
+        return
+
+    await interaction.response.defer(ephemeral=just_for_me)
+    try:
+        price_map = await get_market_prices()
+    except Exception as e:
+        logging.error("[market-value] failed to fetch market prices: %s", e)
+        await interaction.followup.send(
+            "❌ Failed to fetch market data. The API may be temporarily unavailable. Please try again later.",
+            ephemeral=True,
+        )
+        return
+
+    results = score_category(category_info.name, price_map)
+    if not results:
+        await interaction.followup.send(
+            f"⚠️ No {category_info.title.lower()} items found with valid market prices. Try again later.",
+            ephemeral=just_for_me,
+        )
+        return
+
+    await interaction.followup.send(
+        embed=_format_value_embed(category_info, results), ephemeral=just_for_me
+    )
+
+
+@market_value.autocomplete("category")
+async def market_value_category_autocomplete(
+    interaction: discord.Interaction,
+    current: str,
+) -> list[app_commands.Choice]:
+    choices = [
+        app_commands.Choice(name=category.title, value=name)
+        for name, category in CATEGORIES.items()
+        if current.lower() in name or current.lower() in category.title.lower()
+    ]
+    return choices[:25]
@@ -0,0 +1,139 @@
+"""Price alert commands - get a DM when a market item drops below a price."""
+
+import logging
+
+import discord
+from discord import app_commands
+
+from src.discord_client import tree
+from src.tasks.item_catalog import ITEM_ID_MAPPING, ITEM_INDEX
+from src.tasks.market_prices import get_market_prices
+from src.tasks.price_alerts import (
+    ITEM_NAMES,
+    add_price_alert,
+    list_price_alerts,
+    remove_price_alert,
+)
+
+MAX_ALERTS_PER_USER = 25
+
+
+def _display_name(name_id: str) -> str:
+    return name_id.replace("_", " ").title()
+
+
+def _item_display_name(item_id: int) -> str:
+    return _display_name(ITEM_NAMES.get(item_id, str(item_id)))
+
+
+@tree.command(
+    name="price-alert",
+    description="Get a DM when a market item drops below a price",
+)
+@app_commands.describe(
+    item="The item to watch",
+    below="Notify me when the lowest sell price drops below this (gold)",
+)
+async def price_alert(
+    interaction: discord.Interaction,
+    item: str,
+    below: app_commands.Range[float, 0.1],
+):
+    """Subscribe the user to a one-shot price alert.
+
+    Args:
+        interaction: Discord interaction
+        item: Item name ID
+        below: Price threshold in gold
+    """
+    logging.info(f"[price-alert] Adding alert for {item} < {below} from user: {interaction.user}")
+    item_id = ITEM_ID_MAPPING.get(item)
+    if item_id is None:
+        await interaction.response.send_message(f"Unknown item: {item}", ephemeral=True)
+        return
+
+    user_id = str(interaction.user.id)
+    if len(list_price_alerts(user_id)) >= MAX_ALERTS_PER_USER:
+        await interaction.response.send_message(
+            f"You already have {MAX_ALERTS_PER_USER} alerts. Remove one with /price-alert-remove first.",
+            ephemeral=True,
+        )
+        return
+
+    await interaction.response.defer(ephemeral=True)
+    try:
+        price = (await get_market_prices()).get(item_id)
+        if price is not None and price < below:
+            await interaction.followup.send(
+                f"{_display_name(item)} is already at {price:,.0f} g, below {below:,.0f} g.",
+                ephemeral=True,
+            )
+            return
+        alert = await add_price_alert(user_id, item_id, below)
+    except Exception as e:
+        logging.error("[price-alert] failed to add alert: %s", e, exc_info=True)
+        await interaction.followup.send("❌ Failed to save the alert. Please try again later.", ephemeral=True)
+        return
+
+    await interaction.followup.send(
+        f"🔔 Alert #{alert.alert_id}: I'll DM you when {_display_name(item)} drops below {below:,.0f} g.",
+        ephemeral=True,
+    )
+
+
+@price_alert.autocomplete("item")
+async def price_alert_item_autocomplete(
+    interaction: discord.Interaction,
+    current: str,
+) -> list[app_commands.Choice]:
+    return [
+        app_commands.Choice(name=label, value=value)
+        for label, value in ITEM_INDEX.search(current)
+    ]
+
+
+@tree.command(
+    name="price-alerts",
+    description="List your active market price alerts",
+)
+async def price_alerts(interaction: discord.Interaction):
+    """List the user's active price alerts.
+
+    Args:
+        interaction: Discord interaction
+    """
+    alerts = list_price_alerts(str(interaction.user.id))
+    if not alerts:
+        await interaction.response.send_message("You have no active price alerts.", ephemeral=True)
+        return
+
+    lines = [
+        f"#{alert.alert_id} - {_item_display_name(alert.item_id)} below {alert.threshold:,.0f} g"
+        for alert in alerts
+    ]
+    await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
+
+@tree.command(
+    name="price-alert-remove",
+    description="Remove one of your market price alerts",
+)
+@app_commands.describe(alert_id="The alert number shown by /price-alerts")
+async def price_alert_remove(interaction: discord.Interaction, alert_id: int):
+    """Remove one of the user's price alerts.
+
+    Args:
+        interaction: Discord interaction
+        alert_id: ID of the alert to remove
+    """
+    try:
+        removed = await remove_price_alert(str(interaction.user.id), alert_id)
+    except Exception as e:
+        logging.error("[price-alert-remove] failed to remove alert %d: %s", alert_id, e, exc_info=True)
+        await interaction.response.send_message("❌ Failed to remove the alert.", ephemeral=True)
+        return
+
+    if removed:
+        await interaction.response.send_message(f"Removed alert #{alert_id}.", ephemeral=True)
+    else:
+        await interaction.response.send_message(f"You have no alert #{alert_id}.", ephemeral=True)
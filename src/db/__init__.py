@@ -1,16 +1,37 @@
 from .base import Base
-from .engine import async_session, engine, init_db
-from .models import ClanLog, ClanLogType, MessageType, PlayerXpSnapshot, ScheduledMessage, parse_log_type
+from .engine import async_session, engine, init_db, last_db_ping, ping_db
+from .models import (
+    BossAttendance,
+    BossPollArchive,
+    ClanLog,
+    ClanLogType,
+    MarketPrice,
+    MessageType,
+    PlayerXpSnapshot,
+    PriceAlert,
+    ScheduledMessage,
+    parse_log_type,
+)
+from .upsert import bulk_insert, insert_ignore, upsert
 
 __all__ = [
     "Base",
     "engine",
     "async_session",
     "init_db",
+    "last_db_ping",
+    "ping_db",
+    "BossAttendance",
+    "BossPollArchive",
     "ClanLog",
     "ClanLogType",
+    "MarketPrice",
     "MessageType",
     "PlayerXpSnapshot",
+    "PriceAlert",
     "ScheduledMessage",
     "parse_log_type",
+    "bulk_insert",
+    "insert_ignore",
+    "upsert",
 ]
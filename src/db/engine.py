@@ -1,7 +1,12 @@
 import logging
 import os
+import time
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event, make_url, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from .sqlite_profiles import apply_sqlite_profile, get_sqlite_profile
 
 
 def _get_url() -> str:
@@ -12,7 +17,40 @@ def _get_url() -> str:
     return url
 
 
-engine = create_async_engine(_get_url(), echo=False) if _get_url() else None
+# SQLite has a single writer, so a few connections cover the concurrent
+# readers. A server gets a larger pool that is health-checked and recycled
+# before idle connections get dropped on the other end.
+_POOL_SETTINGS: dict[str, dict] = {
+    "sqlite": {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": 5,
+        "max_overflow": 5,
+    },
+    "postgresql": {
+        "pool_size": 10,
+        "max_overflow": 10,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+        "connect_args": {"server_settings": {"application_name": "idle-clans-helper"}},
+    },
+}
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    engine = create_async_engine(url, echo=False, **_POOL_SETTINGS.get(make_url(url).get_backend_name(), {}))
+    if engine.dialect.name == "sqlite":
+        profile, pragmas = get_sqlite_profile()
+        logging.info("SQLite profile: %s", profile)
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _apply_profile(dbapi_connection, connection_record) -> None:
+            apply_sqlite_profile(dbapi_connection, pragmas)
+
+    return engine
+
+
+engine = _create_engine(_get_url()) if _get_url() else None
 
 async_session = (
     async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
@@ -21,9 +59,29 @@ async_session = (
 )
 
 
-async def init_db() -> None:
-    """Verify database connectivity at startup. Schema is managed by Alembic."""
+# Round-trip time of the last successful ping_db, in seconds
+_last_ping_seconds: float | None = None
+
+
+async def ping_db() -> float:
+    """Run a trivial statement and return how long the round trip took, in seconds."""
+    global _last_ping_seconds
+
     if engine is None:
         raise RuntimeError("DATABASE_URL is not set")
-    async with engine.begin() as conn:
-        await conn.run_sync(lambda c: None)
+    start = time.perf_counter()
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    _last_ping_seconds = time.perf_counter() - start
+    return _last_ping_seconds
+
+
+def last_db_ping() -> float | None:
+    """Round-trip time of the last successful ping_db, or None if none succeeded yet."""
+    return _last_ping_seconds
+
+
+async def init_db() -> None:
+    """Verify database connectivity at startup. Schema is managed by Alembic."""
+    seconds = await ping_db()
+    logging.info("Database ping took %.1f ms", seconds * 1000)
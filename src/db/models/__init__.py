@@ -4,17 +4,27 @@ This package contains all SQLAlchemy ORM models organized by domain.
 All models are imported here and re-exported for convenience.
 """
 
+from .boss_attendance import BossAttendance, BossPollArchive
 from .clanlog import ClanLog, ClanLogType, parse_log_type
+from .market_price import MarketPrice
 from .player_xp_snapshot import PlayerXpSnapshot
+from .price_alert import PriceAlert
 from .scheduledmessage import MessageType, ScheduledMessage
 
 __all__ = [
+    # Boss attendance models
+    "BossAttendance",
+    "BossPollArchive",
     # Clan log models
     "ClanLog",
     "ClanLogType",
     "parse_log_type",
+    # Market price models
+    "MarketPrice",
     # Player XP snapshot models
     "PlayerXpSnapshot",
+    # Price alert models
+    "PriceAlert",
     # Scheduled message models
     "MessageType",
     "ScheduledMessage",
@@ -0,0 +1,44 @@
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, Index, PrimaryKeyConstraint, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..base import Base
+
+
+class BossPollArchive(Base):
+    """One archived (rolled-over) boss poll, including polls nobody answered."""
+
+    __tablename__ = "boss_poll_archives"
+
+    poll_type: Mapped[str] = mapped_column(nullable=False)
+    channel_id: Mapped[str] = mapped_column(nullable=False)
+    poll_date: Mapped[date] = mapped_column(Date, nullable=False)
+    message_id: Mapped[str] = mapped_column(nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        PrimaryKeyConstraint("poll_type", "channel_id", "poll_date", name="pk_boss_poll_archive"),
+        Index("ix_boss_poll_archive_channel_date", "channel_id", "poll_date"),
+    )
+
+
+class BossAttendance(Base):
+    """Final participation of one member for one boss on an archived poll."""
+
+    __tablename__ = "boss_attendance"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    poll_type: Mapped[str] = mapped_column(nullable=False)
+    channel_id: Mapped[str] = mapped_column(nullable=False)
+    poll_date: Mapped[date] = mapped_column(Date, nullable=False)
+    boss: Mapped[str] = mapped_column(nullable=False)
+    member: Mapped[str] = mapped_column(nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "poll_type", "channel_id", "poll_date", "boss", "member",
+            name="uq_boss_attendance_identity",
+        ),
+        Index("ix_boss_attendance_member_date", "member", "channel_id", "poll_date"),
+    )
@@ -2,7 +2,7 @@ import re
 from datetime import datetime, timezone
 from enum import StrEnum
 
-from sqlalchemy import String, UniqueConstraint
+from sqlalchemy import Index, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.types import TypeDecorator
 
@@ -82,4 +82,9 @@ class ClanLog(Base):
             "clan_name", "member_username", "message", "timestamp",
             name="uq_clan_log_identity",
         ),
+        # Keyset pagination of the clan log API: (timestamp, id) order,
+        # optionally narrowed to one log type or member first
+        Index("ix_clan_log_time", "timestamp", "id"),
+        Index("ix_clan_log_type_time", "log_type", "timestamp", "id"),
+        Index("ix_clan_log_member_time", "member_username", "timestamp", "id"),
     )
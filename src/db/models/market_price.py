@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..base import Base
+
+
+class MarketPrice(Base):
+    """A market price observation, only stored when it differs from the previous one."""
+
+    __tablename__ = "market_prices"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    item_id: Mapped[int] = mapped_column(nullable=False)
+    fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    lowest_sell_price: Mapped[float] = mapped_column(Float, nullable=False)
+    average_price: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    __table_args__ = (
+        Index("ix_market_price_item_time", "item_id", "fetched_at"),
+    )
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..base import Base
+
+
+class PriceAlert(Base):
+    """A member's one-shot request to be notified when an item drops below a price."""
+
+    __tablename__ = "price_alerts"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    user_id: Mapped[str] = mapped_column(nullable=False)
+    item_id: Mapped[int] = mapped_column(nullable=False)
+    threshold: Mapped[float] = mapped_column(Float, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_price_alert_user", "user_id"),
+    )
@@ -0,0 +1,59 @@
+"""SQLite pragma profiles, applied to every new connection.
+
+The profile is picked with the SQLITE_PROFILE env var:
+
+- "tuned" (default): WAL so readers don't block the writer, synchronous=NORMAL
+  (fsync at checkpoints rather than every commit; a power loss can drop the
+  last commits but never corrupts the file), a busy timeout instead of
+  immediate "database is locked" errors, memory-mapped reads, a 64 MiB page
+  cache and in-memory temp tables.
+- "durable": the same, but with synchronous=FULL so every commit is fsynced.
+- "default": SQLite's own defaults (rollback journal, synchronous=FULL).
+
+Only depends on the standard library so scripts/bench_sqlite_profiles.py can
+load this file directly (bypassing the src.db package and its SQLAlchemy
+engine) and apply the same profiles to a plain sqlite3 connection.
+"""
+
+import logging
+import os
+
+DEFAULT_PROFILE = "tuned"
+
+_TUNED = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,  # ms
+    "mmap_size": 256 * 1024 * 1024,  # bytes
+    "cache_size": -64 * 1024,  # negative means KiB
+    "temp_store": "MEMORY",
+}
+
+SQLITE_PROFILES: dict[str, dict[str, str | int]] = {
+    "default": {},
+    "tuned": _TUNED,
+    "durable": {**_TUNED, "synchronous": "FULL"},
+}
+
+
+def get_sqlite_profile(name: str | None = None) -> tuple[str, dict[str, str | int]]:
+    """Resolve a profile by name, falling back to SQLITE_PROFILE and then the default.
+
+    Returns:
+        Tuple of (profile name, pragmas)
+    """
+    name = (name or os.getenv("SQLITE_PROFILE") or DEFAULT_PROFILE).lower()
+    if name not in SQLITE_PROFILES:
+        logging.warning("[db] unknown SQLITE_PROFILE %r, using %s", name, DEFAULT_PROFILE)
+        name = DEFAULT_PROFILE
+    return name, SQLITE_PROFILES[name]
+
+
+def apply_sqlite_profile(dbapi_connection, pragmas: dict[str, str | int]) -> None:
+    """Run the pragmas on a DB-API connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma, value in pragmas.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+    finally:
+        cursor.close()
@@ -0,0 +1,93 @@
+"""Dialect-neutral INSERT helpers.
+
+SQLite and PostgreSQL both support INSERT ... ON CONFLICT, but SQLAlchemy only
+exposes it through each dialect's own insert(). These helpers build it for the
+configured engine, so task code never imports a dialect and works unchanged
+on either backend.
+"""
+
+from collections.abc import Sequence
+
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .engine import engine
+
+# Smaller batches aren't worth the extra round trips of a COPY
+COPY_THRESHOLD = 1000
+
+_DIALECT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def _dialect_insert(model):
+    name = engine.dialect.name if engine is not None else "sqlite"
+    try:
+        return _DIALECT_INSERTS[name](model)
+    except KeyError:
+        raise NotImplementedError(f"INSERT ... ON CONFLICT is not supported on {name}") from None
+
+
+def insert_ignore(model, conflict_columns: Sequence[str]):
+    """INSERT that skips rows conflicting with an existing row.
+
+    Add .values() for one or many rows, or execute it with a list of row dicts.
+
+    Args:
+        model: ORM model to insert into
+        conflict_columns: Columns of the unique constraint that decides a conflict
+    """
+    return _dialect_insert(model).on_conflict_do_nothing(index_elements=list(conflict_columns))
+
+
+def upsert(model, conflict_columns: Sequence[str], update_columns: Sequence[str]):
+    """INSERT that overwrites an existing row's update_columns with the new values.
+
+    Args:
+        model: ORM model to insert into
+        conflict_columns: Columns of the unique constraint that decides a conflict
+        update_columns: Columns taken from the new row when it conflicts
+    """
+    stmt = _dialect_insert(model)
+    return stmt.on_conflict_do_update(
+        index_elements=list(conflict_columns),
+        set_={column: stmt.excluded[column] for column in update_columns},
+    )
+
+
+async def bulk_insert(db: AsyncSession, model, rows: list[dict]) -> None:
+    """Insert rows that can't conflict, in the session's transaction.
+
+    On PostgreSQL, batches of COPY_THRESHOLD rows or more are loaded with COPY;
+    otherwise this is a single executemany INSERT.
+    """
+    if not rows:
+        return
+    if db.bind.dialect.name == "postgresql" and len(rows) >= COPY_THRESHOLD:
+        await _copy_rows(db, model, rows)
+    else:
+        await db.execute(insert(model), rows)
+
+
+async def _copy_rows(db: AsyncSession, model, rows: list[dict]) -> None:
+    table = model.__table__
+    columns = list(rows[0])
+    # COPY skips SQLAlchemy's parameter handling, so apply column types by hand
+    dialect = db.bind.dialect
+    processors = [table.c[column].type.bind_processor(dialect) for column in columns]
+    records = [
+        tuple(
+            processor(row[column]) if processor else row[column]
+            for column, processor in zip(columns, processors)
+        )
+        for row in rows
+    ]
+
+    connection = await db.connection()
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        table.name, records=records, columns=columns, schema_name=table.schema
+    )
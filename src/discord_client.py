@@ -1,21 +1,50 @@
 import discord
 import logging
+from datetime import timedelta
 
-from src.db import init_db
+from src.db import engine, init_db
+from src.health import start_loop_lag_monitor, watch_loop
 from src.http_server import start_http_server
+from src.metrics import instrument_discord_http, instrument_engine, observe_command
 from src.tasks.boss_scheduler import create_boss_scheduler
-from src.tasks.boss_summary import create_boss_summary_scheduler
+from src.tasks.boss_summary import (
+    create_boss_summary_scheduler,
+    schedule_summary_refresh,
+    seed_poll_reactions,
+)
 from src.tasks.clanlog_fetcher import bulk_fetch_clanlog, recent_fetch_clanlog
+from src.tasks.market_history import snapshot_market_prices
+from src.tasks.message_handles import (
+    apply_bulk_message_delete,
+    apply_message_delete,
+    apply_message_edit,
+    prime_message_handles,
+)
 from src.tasks.message_sender import create_message_sender
-from src.tasks.xp_fetcher import fetch_player_xp
+from src.tasks.poll_reactions import apply_reaction_add, apply_reaction_clear, apply_reaction_remove
+from src.tasks.price_alerts import load_price_alerts, register_price_alert_notifier
+from src.tasks.scheduled_message_ops import list_scheduled_messages, load_scheduled_messages
+from src.tasks.xp_fetcher import create_xp_fetcher, load_xp_history
 
 
 client = discord.Client(intents=discord.Intents.default())
 tree = discord.app_commands.CommandTree(client)
+instrument_engine(engine)
+instrument_discord_http(client)
 
 send_messages = create_message_sender(client)
 post_boss_poll = create_boss_scheduler(client)
 post_boss_summary = create_boss_summary_scheduler(client)
+fetch_player_xp = create_xp_fetcher(client)
+register_price_alert_notifier(client)
+
+watch_loop("bulk_fetch_clanlog", bulk_fetch_clanlog, grace=timedelta(minutes=30))
+watch_loop("recent_fetch_clanlog", recent_fetch_clanlog)
+watch_loop("send_messages", send_messages)
+watch_loop("post_boss_poll", post_boss_poll, grace=timedelta(minutes=15))
+watch_loop("post_boss_summary", post_boss_summary, grace=timedelta(minutes=15))
+watch_loop("fetch_player_xp", fetch_player_xp, grace=timedelta(minutes=30))
+watch_loop("snapshot_market_prices", snapshot_market_prices)
 
 
 @bulk_fetch_clanlog.error
@@ -48,11 +77,25 @@ async def fetch_player_xp_error(error: Exception) -> None:
     logging.error("[fetch_player_xp] task error: %s", error, exc_info=error)
 
 
+@snapshot_market_prices.error
+async def snapshot_market_prices_error(error: Exception) -> None:
+    logging.error("[snapshot_market_prices] task error: %s", error, exc_info=error)
+
+
 @client.event
 async def on_ready() -> None:
     logging.info(f"Logged in as {client.user}")
+    start_loop_lag_monitor()
     await init_db()
     logging.info("Database connection verified")
+    try:
+        await load_scheduled_messages()
+    except Exception as e:
+        # Retried lazily by the first read that needs the records
+        logging.error("[on_ready] failed to load scheduled messages: %s", e, exc_info=True)
+    prime_message_handles(client, list_scheduled_messages())
+    await load_xp_history()
+    await load_price_alerts()
 
     if not bulk_fetch_clanlog.is_running():
         bulk_fetch_clanlog.start()
@@ -66,8 +109,13 @@ async def on_ready() -> None:
         post_boss_summary.start()
     if not fetch_player_xp.is_running():
         fetch_player_xp.start()
+    if not snapshot_market_prices.is_running():
+        snapshot_market_prices.start()
     logging.info("Background tasks started")
 
+    await seed_poll_reactions(client)
+    logging.info("Poll reaction state seeded")
+
     await start_http_server(client)
 
     await tree.sync()
@@ -76,8 +124,55 @@ async def on_ready() -> None:
     logging.info([k.name for k in tree.walk_commands()])
 
 
+@client.event
+async def on_raw_reaction_add(payload: discord.RawReactionActionEvent) -> None:
+    if apply_reaction_add(payload):
+        schedule_summary_refresh(client, payload.channel_id)
+
+
+@client.event
+async def on_raw_reaction_remove(payload: discord.RawReactionActionEvent) -> None:
+    if apply_reaction_remove(payload):
+        schedule_summary_refresh(client, payload.channel_id)
+
+
+@client.event
+async def on_raw_reaction_clear(payload: discord.RawReactionClearEvent) -> None:
+    if apply_reaction_clear(payload.message_id):
+        schedule_summary_refresh(client, payload.channel_id)
+
+
+@client.event
+async def on_raw_reaction_clear_emoji(payload: discord.RawReactionClearEmojiEvent) -> None:
+    if apply_reaction_clear(payload.message_id, str(payload.emoji)):
+        schedule_summary_refresh(client, payload.channel_id)
+
+
+@client.event
+async def on_raw_message_edit(payload: discord.RawMessageUpdateEvent) -> None:
+    apply_message_edit(payload)
+
+
+@client.event
+async def on_raw_message_delete(payload: discord.RawMessageDeleteEvent) -> None:
+    apply_message_delete(payload)
+
+
+@client.event
+async def on_raw_bulk_message_delete(payload: discord.RawBulkMessageDeleteEvent) -> None:
+    apply_bulk_message_delete(payload)
+
+
+@client.event
+async def on_app_command_completion(
+    interaction: discord.Interaction, command: discord.app_commands.Command
+) -> None:
+    observe_command(interaction, command.qualified_name)
+
+
 @tree.error
 async def on_app_command_error(interaction: discord.Interaction, error: discord.app_commands.AppCommandError) -> None:
+    observe_command(interaction, interaction.command.qualified_name if interaction.command else "unknown", failed=True)
     logging.error("[command] error in %s: %s", interaction.command.name if interaction.command else "unknown", error, exc_info=error)
     if not interaction.response.is_done():
         await interaction.response.send_message("An error occurred while processing your command.", ephemeral=True)
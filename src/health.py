@@ -0,0 +1,236 @@
+"""Liveness and readiness of the bot, served on GET /healthz and GET /readyz.
+
+Every background loop records a heartbeat when an iteration starts and
+when it finishes (see track_task). Loop bodies that catch their own errors to
+keep the loop alive call report_task_failure, so the iteration still counts
+as failed. Loops registered with watch_loop are checked against their own
+schedule:
+
+- overdue: the next iteration should have started more than the grace period
+  ago, which is what a hanging body looks like
+- failing: no successful iteration for two intervals plus the grace period
+- stopped: the loop died on an unhandled error (the .error handlers only log)
+- not started: the bot is ready but the loop was never started
+
+Liveness also covers event loop lag, sampled by a background monitor, so a
+watchdog can restart a bot that is wedged rather than merely slow.
+Readiness additionally requires the Discord connection and a database ping.
+"""
+
+import asyncio
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import discord
+from discord.ext import tasks
+
+from src.db import last_db_ping, ping_db
+
+DEFAULT_GRACE = timedelta(minutes=5)
+
+LOOP_LAG_INTERVAL = 1.0  # seconds between lag samples
+LOOP_LAG_LIMIT = 5.0  # seconds of lag that count as wedged
+
+DB_PING_TIMEOUT = 5.0
+
+
+@dataclass
+class TaskHeartbeat:
+    """Progress of one background loop."""
+
+    first_started: datetime | None = None
+    last_started: datetime | None = None
+    last_success: datetime | None = None
+    last_error: str | None = None
+    last_error_at: datetime | None = None
+    running: bool = False
+
+
+_heartbeats: dict[str, TaskHeartbeat] = {}
+_watched: dict[str, tuple[tasks.Loop, timedelta]] = {}
+
+# Name of the tracked loop whose iteration is running in the current task
+_current_task: ContextVar[str | None] = ContextVar("current_task", default=None)
+
+_loop_lag: float | None = None
+_loop_lag_task: asyncio.Task | None = None
+
+
+def _heartbeat(name: str) -> TaskHeartbeat:
+    heartbeat = _heartbeats.get(name)
+    if heartbeat is None:
+        heartbeat = _heartbeats[name] = TaskHeartbeat()
+    return heartbeat
+
+
+def record_task_start(name: str) -> None:
+    heartbeat = _heartbeat(name)
+    heartbeat.last_started = datetime.now(timezone.utc)
+    heartbeat.first_started = heartbeat.first_started or heartbeat.last_started
+    heartbeat.running = True
+    _current_task.set(name)
+
+
+def record_task_success(name: str) -> bool:
+    """Finish an iteration that returned normally.
+
+    Returns:
+        False if the body reported a failure during this iteration, in which
+        case it doesn't count as a success
+    """
+    heartbeat = _heartbeat(name)
+    heartbeat.running = False
+    if heartbeat.last_error_at and heartbeat.last_started and heartbeat.last_error_at >= heartbeat.last_started:
+        return False
+    heartbeat.last_success = datetime.now(timezone.utc)
+    return True
+
+
+def record_task_failure(name: str, error: BaseException) -> None:
+    heartbeat = _heartbeat(name)
+    heartbeat.last_error = str(error) or type(error).__name__
+    heartbeat.last_error_at = datetime.now(timezone.utc)
+    heartbeat.running = False
+
+
+def report_task_failure(error: BaseException) -> None:
+    """Mark the running loop iteration as failed without stopping the loop.
+
+    For loop bodies that catch and log their own errors so the loop survives.
+    Does nothing outside a tracked iteration.
+    """
+    name = _current_task.get()
+    if name is None:
+        return
+    heartbeat = _heartbeat(name)
+    heartbeat.last_error = str(error) or type(error).__name__
+    heartbeat.last_error_at = datetime.now(timezone.utc)
+
+
+def watch_loop(name: str, loop: tasks.Loop, grace: timedelta = DEFAULT_GRACE) -> None:
+    """Include a loop in liveness checks.
+
+    Args:
+        name: Task name, the same one passed to track_task
+        loop: The loop to check
+        grace: How long past its scheduled start an iteration may be before the loop is overdue
+    """
+    _watched[name] = (loop, grace)
+
+
+def _iso(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+def _interval(loop: tasks.Loop) -> timedelta:
+    """Longest time between two scheduled iterations of a loop."""
+    if loop.time:
+        minutes = sorted(t.hour * 60 + t.minute for t in loop.time)
+        gaps = [b - a for a, b in zip(minutes, minutes[1:])] + [minutes[0] + 24 * 60 - minutes[-1]]
+        return timedelta(minutes=max(gaps))
+    return timedelta(hours=loop.hours or 0, minutes=loop.minutes or 0, seconds=loop.seconds or 0)
+
+
+def _task_status(name: str, loop: tasks.Loop, grace: timedelta, now: datetime) -> dict:
+    heartbeat = _heartbeat(name)
+    next_iteration = loop.next_iteration if loop.is_running() else None
+    # Since when the loop should have had a successful iteration
+    last_good = heartbeat.last_success or heartbeat.first_started
+
+    if loop.failed():
+        status = "stopped"
+    elif not loop.is_running():
+        status = "not started"
+    elif next_iteration is not None and now > next_iteration + grace:
+        status = "overdue"
+    elif last_good is not None and now > last_good + 2 * _interval(loop) + grace:
+        status = "failing"
+    else:
+        status = "ok"
+
+    return {
+        "status": status,
+        "running": heartbeat.running,
+        "last_started": _iso(heartbeat.last_started),
+        "last_success": _iso(heartbeat.last_success),
+        "last_error": heartbeat.last_error,
+        "last_error_at": _iso(heartbeat.last_error_at),
+        "next_iteration": _iso(next_iteration),
+    }
+
+
+async def _monitor_loop_lag() -> None:
+    global _loop_lag
+
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(LOOP_LAG_INTERVAL)
+        _loop_lag = max(loop.time() - start - LOOP_LAG_INTERVAL, 0.0)
+
+
+def start_loop_lag_monitor() -> None:
+    """Start sampling event loop lag, once."""
+    global _loop_lag_task
+
+    if _loop_lag_task is None or _loop_lag_task.done():
+        _loop_lag_task = asyncio.create_task(_monitor_loop_lag())
+
+
+def health_report(client: discord.Client) -> tuple[bool, dict]:
+    """Liveness: every watched loop on schedule and succeeding, and the event loop responsive.
+
+    Loops start in on_ready, so "not started" only counts once the client is ready.
+
+    Returns:
+        Tuple of (healthy, JSON-serializable report)
+    """
+    now = datetime.now(timezone.utc)
+    task_report = {name: _task_status(name, loop, grace, now) for name, (loop, grace) in _watched.items()}
+    bad_statuses = {"stopped", "overdue", "failing"}
+    if client.is_ready():
+        bad_statuses.add("not started")
+    unhealthy = [name for name, task in task_report.items() if task["status"] in bad_statuses]
+
+    lag_ok = _loop_lag is None or _loop_lag < LOOP_LAG_LIMIT
+    healthy = not unhealthy and lag_ok
+
+    db_ping = last_db_ping()
+    return healthy, {
+        "status": "ok" if healthy else "unhealthy",
+        "unhealthy_tasks": unhealthy,
+        "event_loop_lag_ms": round(_loop_lag * 1000, 1) if _loop_lag is not None else None,
+        "db_ping_ms": round(db_ping * 1000, 1) if db_ping is not None else None,
+        "tasks": task_report,
+    }
+
+
+async def readiness_report(client: discord.Client) -> tuple[bool, dict]:
+    """Readiness: connected to Discord and the database answers.
+
+    Returns:
+        Tuple of (ready, JSON-serializable report)
+    """
+    discord_ready = client.is_ready()
+
+    db_error = None
+    db_ping = None
+    start = time.perf_counter()
+    try:
+        db_ping = await asyncio.wait_for(ping_db(), timeout=DB_PING_TIMEOUT)
+    except asyncio.TimeoutError:
+        db_error = f"no answer after {DB_PING_TIMEOUT:.0f}s"
+    except Exception as e:
+        db_error = str(e) or type(e).__name__
+        logging.warning("[health] database ping failed after %.1f s: %s", time.perf_counter() - start, e)
+
+    ready = discord_ready and db_error is None
+    return ready, {
+        "status": "ready" if ready else "not ready",
+        "discord_ready": discord_ready,
+        "db_ping_ms": round(db_ping * 1000, 1) if db_ping is not None else None,
+        "db_error": db_error,
+    }
@@ -1,20 +1,61 @@
 """Lightweight HTTP server for triggering bot actions from the host.
 
 Endpoints:
-  POST /boss-poll?type=daily|weekly|both
-  POST /boss-summary
+  POST /boss-poll?type=daily|weekly|both  -> 202 with a job ID
+  POST /boss-summary                      -> 202 with a job ID
+  GET  /jobs/{job_id}                     -> job status
+  GET  /clan-logs                         -> clan log history as NDJSON
+  GET  /clan-logs/stream                  -> new clan logs as server-sent events
+  GET  /healthz                           -> 200 when live, 503 when wedged
+  GET  /readyz                            -> 200 when Discord and the DB are up
+  GET  /metrics (Prometheus text format)
+
+Actions run as jobs in the background. Posting the same action again while
+it is still queued or running returns the existing job instead of a new one.
+
+GET /clan-logs streams one JSON object per line in (timestamp, id) order.
+Query parameters, all optional:
+  type=<log type>      repeatable, e.g. type=vault_deposit&type=vault_withdrawal
+  member=<username>    exact member name
+  since=<ISO time>     inclusive; naive times are UTC
+  until=<ISO time>     exclusive
+  limit=<n>            stop after n rows
+  after=<cursor>       resume after the row whose "cursor" field this is
+
+GET /clan-logs/stream sends each clan log as it is stored, as an event with
+the row ID as its id. Reconnecting with a Last-Event-ID header (or
+?last_event_id=) first replays everything stored after that row. A client
+that falls too far behind is disconnected and should reconnect the same way.
 
 Requires the HTTP_SECRET env var to be set. Pass it as:
   Authorization: Bearer <secret>
 """
 
 import asyncio
+import json
 import logging
 import os
+from datetime import datetime, timezone
 
 import discord
 from aiohttp import web
 
+from src.db import ClanLog, ClanLogType
+from src.health import health_report, readiness_report
+from src.metrics import render_metrics
+from src.tasks.clanlog_export import (
+    ClanLogFilter,
+    clan_log_to_dict,
+    decode_cursor,
+    iter_clan_log_pages,
+    iter_clan_logs_after_id,
+)
+from src.tasks.clanlog_stream import subscribe_clan_logs
+from src.tasks.job_queue import Job, get_job
+
+SSE_KEEPALIVE_SECONDS = 15
+SSE_RETRY_MS = 5000
+
 
 def _check_auth(request: web.Request) -> bool:
     secret = os.getenv("HTTP_SECRET")
@@ -24,6 +65,27 @@ def _check_auth(request: web.Request) -> bool:
     return auth == f"Bearer {secret}"
 
 
+def _job_accepted(job: Job, created: bool) -> web.Response:
+    return web.json_response(
+        {**job.to_dict(), "deduplicated": not created},
+        status=202,
+        headers={"Location": f"/jobs/{job.job_id}"},
+    )
+
+
+def _parse_time(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _sse_event(log: ClanLog) -> str:
+    return f"id: {log.id}\nevent: clan_log\ndata: {json.dumps(clan_log_to_dict(log))}\n\n"
+
+
 def create_http_server(client: discord.Client) -> web.Application:
     app = web.Application()
 
@@ -38,20 +100,15 @@ def create_http_server(client: discord.Client) -> web.Application:
         if not client.is_ready():
             return web.Response(status=503, text="Bot not ready")
 
-        from src.tasks.boss_scheduler import _post_boss_poll
+        from src.tasks.boss_scheduler import submit_boss_polls
 
-        try:
-            if poll_type in ("weekly", "both"):
-                await _post_boss_poll(client, is_weekly=True)
-            if poll_type == "both":
-                await asyncio.sleep(1)
-            if poll_type in ("daily", "both"):
-                await _post_boss_poll(client, is_weekly=False)
-            logging.info("[http_server] boss poll (%s) triggered via HTTP", poll_type)
-            return web.Response(text=f"Boss poll ({poll_type}) posted")
-        except Exception as e:
-            logging.error("[http_server] boss poll failed: %s", e, exc_info=True)
-            return web.Response(status=500, text=str(e))
+        job, created = submit_boss_polls(
+            client,
+            include_weekly=poll_type in ("weekly", "both"),
+            include_daily=poll_type in ("daily", "both"),
+        )
+        logging.info("[http_server] boss poll (%s) queued via HTTP as job %s", poll_type, job.job_id)
+        return _job_accepted(job, created)
 
     async def boss_summary(request: web.Request) -> web.Response:
         if not _check_auth(request):
@@ -60,18 +117,143 @@ def create_http_server(client: discord.Client) -> web.Application:
         if not client.is_ready():
             return web.Response(status=503, text="Bot not ready")
 
-        from src.tasks.boss_summary import _regenerate_boss_summary
+        from src.tasks.boss_summary import submit_boss_summary
+
+        job, created = submit_boss_summary(client)
+        logging.info("[http_server] boss summary queued via HTTP as job %s", job.job_id)
+        return _job_accepted(job, created)
+
+    async def job_status(request: web.Request) -> web.Response:
+        if not _check_auth(request):
+            return web.Response(status=401, text="Unauthorized")
+
+        job = get_job(request.match_info["job_id"])
+        if job is None:
+            return web.Response(status=404, text="Unknown job")
+        return web.json_response(job.to_dict())
+
+    async def clan_logs(request: web.Request) -> web.StreamResponse:
+        if not _check_auth(request):
+            return web.Response(status=401, text="Unauthorized")
+
+        query = request.rel_url.query
+        log_types = tuple(query.getall("type", ()))
+        valid_types = {t.value for t in ClanLogType}
+        unknown = [t for t in log_types if t not in valid_types]
+        if unknown:
+            return web.Response(status=400, text=f"unknown type: {', '.join(unknown)}")
 
         try:
-            await _regenerate_boss_summary(client)
-            logging.info("[http_server] boss summary triggered via HTTP")
-            return web.Response(text="Boss summary regenerated")
-        except Exception as e:
-            logging.error("[http_server] boss summary failed: %s", e, exc_info=True)
-            return web.Response(status=500, text=str(e))
+            since = _parse_time(query.get("since"))
+            until = _parse_time(query.get("until"))
+        except ValueError:
+            return web.Response(status=400, text="since and until must be ISO 8601 times")
+
+        after = query.get("after") or None
+        if after:
+            try:
+                decode_cursor(after)
+            except ValueError:
+                return web.Response(status=400, text="invalid cursor")
+
+        limit = None
+        if "limit" in query:
+            try:
+                limit = int(query["limit"])
+            except ValueError:
+                limit = 0
+            if limit <= 0:
+                return web.Response(status=400, text="limit must be a positive integer")
+
+        filters = ClanLogFilter(
+            log_types=log_types,
+            member=query.get("member") or None,
+            since=since,
+            until=until,
+        )
+
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+
+        rows = 0
+        async for page in iter_clan_log_pages(filters, after=after, limit=limit):
+            chunk = "".join(json.dumps(clan_log_to_dict(log)) + "\n" for log in page)
+            await response.write(chunk.encode())
+            rows += len(page)
+        await response.write_eof()
+
+        logging.info("[http_server] streamed %d clan logs", rows)
+        return response
+
+    async def clan_log_stream(request: web.Request) -> web.StreamResponse:
+        if not _check_auth(request):
+            return web.Response(status=401, text="Unauthorized")
+
+        raw_last_id = request.headers.get("Last-Event-ID") or request.rel_url.query.get("last_event_id")
+        last_id = None
+        if raw_last_id:
+            try:
+                last_id = int(raw_last_id)
+            except ValueError:
+                return web.Response(status=400, text="Last-Event-ID must be a clan log ID")
+
+        response = web.StreamResponse(
+            headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"},
+        )
+        await response.prepare(request)
+        await response.write(f"retry: {SSE_RETRY_MS}\n\n".encode())
+
+        # Subscribe before replaying so nothing stored meanwhile is missed;
+        # live rows the replay already covered are skipped by ID
+        with subscribe_clan_logs() as subscriber:
+            if last_id is not None:
+                async for page in iter_clan_logs_after_id(last_id):
+                    await response.write("".join(_sse_event(log) for log in page).encode())
+                    last_id = page[-1].id
+
+            while not (subscriber.dropped and subscriber.queue.empty()):
+                try:
+                    log = await asyncio.wait_for(subscriber.queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    await response.write(b": keepalive\n\n")
+                    continue
+                if last_id is not None and log.id <= last_id:
+                    continue
+                await response.write(_sse_event(log).encode())
+                last_id = log.id
+
+        return response
+
+    async def healthz(request: web.Request) -> web.Response:
+        if not _check_auth(request):
+            return web.Response(status=401, text="Unauthorized")
+
+        healthy, report = health_report(client)
+        return web.json_response(report, status=200 if healthy else 503)
+
+    async def readyz(request: web.Request) -> web.Response:
+        if not _check_auth(request):
+            return web.Response(status=401, text="Unauthorized")
+
+        ready, report = await readiness_report(client)
+        return web.json_response(report, status=200 if ready else 503)
+
+    async def metrics(request: web.Request) -> web.Response:
+        if not _check_auth(request):
+            return web.Response(status=401, text="Unauthorized")
+
+        body = await render_metrics()
+        return web.Response(text=body, content_type="text/plain", charset="utf-8")
 
     app.router.add_post("/boss-poll", boss_poll)
     app.router.add_post("/boss-summary", boss_summary)
+    app.router.add_get("/jobs/{job_id}", job_status)
+    app.router.add_get("/clan-logs", clan_logs)
+    app.router.add_get("/clan-logs/stream", clan_log_stream)
+    app.router.add_get("/healthz", healthz)
+    app.router.add_get("/readyz", readyz)
+    app.router.add_get("/metrics", metrics)
 
     return app
 
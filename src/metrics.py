@@ -0,0 +1,293 @@
+"""In-process metrics, exported in Prometheus text format on GET /metrics.
+
+Recording is a dict lookup and an addition, so it is cheap enough for hot
+paths. Values that are expensive to compute (like the outbox depth) are not
+tracked continuously; their owners register a collector that refreshes a
+gauge only when /metrics is scraped.
+"""
+
+import bisect
+import functools
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+import aiohttp
+import discord
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.health import record_task_failure, record_task_start, record_task_success
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        _registry.append(self)
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Monotonic count per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = ()) -> None:
+        super().__init__(name, help_text, labels)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def render(self) -> list[str]:
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labels, key)} {value}"
+            for key, value in self._values.items()
+        ]
+
+
+class Gauge(_Metric):
+    """Last set value per label set."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = ()) -> None:
+        super().__init__(name, help_text, labels)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, *label_values: str, value: float) -> None:
+        self._values[label_values] = value
+
+    def render(self) -> list[str]:
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labels, key)} {value}"
+            for key, value in self._values.items()
+        ]
+
+
+class Histogram(_Metric):
+    """Bucketed observations per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labels)
+        self.buckets = buckets
+        # label values -> [count per bucket (last one is +Inf), sum]
+        self._series: dict[tuple[str, ...], list] = {}
+
+    def observe(self, *label_values: str, value: float) -> None:
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        for key, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                labels = _format_labels(self.labels, key, f'le="{le}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {cumulative}")
+        return lines
+
+
+_registry: list[_Metric] = []
+_collectors: list[Callable[[], Awaitable[None]]] = []
+
+
+# Background tasks
+TASK_RUNS = Counter("bot_task_runs_total", "Background task iterations", ("task",))
+TASK_FAILURES = Counter("bot_task_failures_total", "Background task iterations that raised", ("task",))
+TASK_SECONDS = Histogram("bot_task_run_seconds", "Background task iteration duration", ("task",))
+TASK_LAST_SUCCESS = Gauge(
+    "bot_task_last_success_timestamp_seconds", "Unix time of the last successful iteration", ("task",)
+)
+
+# Idle Clans API
+API_SECONDS = Histogram("idleclans_api_request_seconds", "Idle Clans API request latency", ("endpoint",))
+API_RESPONSES = Counter(
+    "idleclans_api_responses_total", "Idle Clans API responses by status", ("endpoint", "status")
+)
+
+# Database
+DB_QUERY_SECONDS = Histogram("db_query_seconds", "Database statement execution time", ("statement",))
+
+# Clan log outbox (stored messages not yet posted to Discord)
+OUTBOX_DEPTH = Gauge("clanlog_outbox_depth", "Clan log messages waiting to be sent")
+OUTBOX_OLDEST_AGE = Gauge("clanlog_outbox_oldest_age_seconds", "Age of the oldest unsent clan log message")
+
+# Discord API
+DISCORD_REQUESTS = Counter(
+    "discord_api_requests_total", "Discord REST calls by route and outcome", ("method", "route", "status")
+)
+DISCORD_SECONDS = Histogram("discord_api_request_seconds", "Discord REST call latency", ("method", "route"))
+
+# Slash commands
+COMMAND_SECONDS = Histogram(
+    "slash_command_seconds", "Time from invocation to command completion", ("command",)
+)
+COMMAND_ERRORS = Counter("slash_command_errors_total", "Slash commands that raised", ("command",))
+
+
+def register_collector(collector: Callable[[], Awaitable[None]]) -> None:
+    """Run collector before every scrape, to refresh gauges that are costly to track live."""
+    _collectors.append(collector)
+
+
+async def render_metrics() -> str:
+    """Run the collectors and render every metric in Prometheus text format."""
+    for collector in _collectors:
+        try:
+            await collector()
+        except Exception as e:
+            logging.warning("[metrics] collector %s failed: %s", collector.__name__, e)
+
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def track_task(name: str):
+    """Record runs, failures, duration and last success of a loop body.
+
+    Apply it below @tasks.loop so every iteration is measured. Iterations also
+    count as heartbeats for the /healthz task checks.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            TASK_RUNS.inc(name)
+            record_task_start(name)
+            start = time.perf_counter()
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                TASK_FAILURES.inc(name)
+                record_task_failure(name, e)
+                raise
+            finally:
+                TASK_SECONDS.observe(name, value=time.perf_counter() - start)
+            if record_task_success(name):
+                TASK_LAST_SUCCESS.set(name, value=time.time())
+            else:
+                # The body caught its own error and reported it
+                TASK_FAILURES.inc(name)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+@functools.cache
+def api_trace(endpoint: str) -> aiohttp.TraceConfig:
+    """TraceConfig that records latency and status of Idle Clans API calls.
+
+    Pass it as ClientSession(trace_configs=[api_trace("name")]).
+    """
+
+    async def on_start(session, context, params) -> None:
+        context.start = time.perf_counter()
+
+    async def on_end(session, context, params) -> None:
+        API_SECONDS.observe(endpoint, value=time.perf_counter() - context.start)
+        API_RESPONSES.inc(endpoint, str(params.response.status))
+
+    async def on_exception(session, context, params) -> None:
+        API_SECONDS.observe(endpoint, value=time.perf_counter() - context.start)
+        API_RESPONSES.inc(endpoint, "error")
+
+    trace = aiohttp.TraceConfig()
+    trace.on_request_start.append(on_start)
+    trace.on_request_end.append(on_end)
+    trace.on_request_exception.append(on_exception)
+    trace.freeze()
+    return trace
+
+
+def instrument_engine(engine: AsyncEngine | None) -> None:
+    """Time every statement executed through the engine."""
+    if engine is None:
+        return
+
+    def before(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    def after(conn, cursor, statement, parameters, context, executemany) -> None:
+        starts = conn.info.get("query_start")
+        if starts:
+            verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+            DB_QUERY_SECONDS.observe(verb, value=time.perf_counter() - starts.pop())
+
+    def on_error(context) -> None:
+        # The statement failed, so after_cursor_execute won't pop its start time
+        starts = context.connection.info.get("query_start") if context.connection else None
+        if starts:
+            starts.pop()
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before)
+    event.listen(engine.sync_engine, "after_cursor_execute", after)
+    event.listen(engine.sync_engine, "handle_error", on_error)
+
+
+def instrument_discord_http(client: discord.Client) -> None:
+    """Count and time every Discord REST call by route template."""
+    original = client.http.request
+
+    async def request(route, **kwargs):
+        start = time.perf_counter()
+        status = "2xx"
+        try:
+            return await original(route, **kwargs)
+        except discord.HTTPException as e:
+            status = str(e.status)
+            raise
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            DISCORD_REQUESTS.inc(route.method, route.path, status)
+            DISCORD_SECONDS.observe(route.method, route.path, value=time.perf_counter() - start)
+
+    client.http.request = request
+
+
+def observe_command(interaction: discord.Interaction, command_name: str, failed: bool = False) -> None:
+    """Record a finished slash command, measured from when the user invoked it."""
+    seconds = (discord.utils.utcnow() - interaction.created_at).total_seconds()
+    COMMAND_SECONDS.observe(command_name, value=seconds)
+    if failed:
+        COMMAND_ERRORS.inc(command_name)
@@ -1,26 +1,66 @@
-from .bossEntry import BossEntry
+from .bossEntry import BossCadence, BossEntry
 import discord
 
-__all__ = ["BossEntry"]
+__all__ = [
+    "BossCadence",
+    "BossEntry",
+    "ALL_BOSSES",
+    "BOSSES_BY_NAME",
+    "BOSSES_BY_KEY",
+    "BOSSES_BY_EMOJI",
+    "BOSSES_BY_CADENCE",
+    "POLL_ORDER",
+    "DAILY_BOSSES",
+    "WEEKLY_BOSSES",
+]
 
 # Define list of BossEntry objects so other code can import the list if needed
 ALL_BOSSES = [
     BossEntry(name="zeus", attack_style="Magic", attack_weakness="Archery", wiki="Zeus",
-              trim_color=discord.Color.gold(), key="godly"),
+              trim_color=discord.Color.gold(), key="godly",
+              display_name="Zeus", emoji="⚡", cadence="daily"),
     BossEntry(name="medusa", attack_style="Archery", attack_weakness="Slash", wiki="Medusa",
-              trim_color=discord.Color.light_grey(), key="stone"),
+              trim_color=discord.Color.light_grey(), key="stone",
+              display_name="Medusa", emoji="🐍", cadence="daily"),
     BossEntry(name="hades", attack_style="Magic", attack_weakness="Stab", wiki="Hades",
-              trim_color=discord.Color.blue(), key="underworld"),
+              trim_color=discord.Color.blue(), key="underworld",
+              display_name="Hades", emoji="😈", cadence="daily"),
     BossEntry(name="griffin", attack_style="Melee", attack_weakness="Crush", wiki="Griffin",
-              trim_color=discord.Color.dark_gold(), key="mountain"),
+              trim_color=discord.Color.dark_gold(), key="mountain",
+              display_name="Griffin", emoji="🐔", cadence="daily"),
     BossEntry(name="devil", attack_style="Melee", attack_weakness="Pound", wiki="Devil",
-              trim_color=discord.Color.red(), key="burning"),
+              trim_color=discord.Color.red(), key="burning",
+              display_name="Devil", emoji="👹", cadence="daily"),
     BossEntry(name="chimera", attack_style="Melee", attack_weakness="Magic", wiki="Chimera",
-              trim_color=discord.Color.green(), key="mutated"),
+              trim_color=discord.Color.green(), key="mutated",
+              display_name="Chimera", emoji="🦁", cadence="daily"),
     BossEntry(name="sobek", attack_style="Archery", attack_weakness="None", wiki="Sobek",
-              trim_color=discord.Color.green(), key="ancient"),
+              trim_color=discord.Color.green(), key="ancient",
+              display_name="Sobek", emoji="🐊", cadence="weekly"),
     BossEntry(name="kronos", attack_style="Archery,Magic,Melee", attack_weakness="Differs(Archery,Magic,Melee)", wiki="Kronos",
-              trim_color=discord.Color.green(), key="krono's book"),
+              trim_color=discord.Color.green(), key="krono's book",
+              display_name="Kronos", emoji="⏳", cadence="weekly"),
+    # Polls (and archived attendance) have always spelled it "Messines"
     BossEntry(name="mesines", attack_style="Melee/Magic", attack_weakness="Archery", wiki="Mesines",
-              trim_color=discord.Color.green(), key="otherworldly"),
-]
\ No newline at end of file
+              trim_color=discord.Color.green(), key="otherworldly",
+              display_name="Messines", emoji="🐉", cadence="weekly"),
+]
+
+# Indexes over ALL_BOSSES
+BOSSES_BY_NAME = {entry.name: entry for entry in ALL_BOSSES}
+BOSSES_BY_KEY = {entry.key: entry for entry in ALL_BOSSES}
+BOSSES_BY_EMOJI = {entry.emoji: entry for entry in ALL_BOSSES}
+
+# The order bosses are listed in on the polls
+POLL_ORDER = tuple(
+    BOSSES_BY_NAME[name]
+    for name in ("griffin", "hades", "devil", "zeus", "chimera", "medusa", "kronos", "sobek", "mesines")
+)
+
+# Bosses per cadence, in poll order
+BOSSES_BY_CADENCE: dict[BossCadence, tuple[BossEntry, ...]] = {
+    cadence: tuple(entry for entry in POLL_ORDER if entry.cadence == cadence)
+    for cadence in ("daily", "weekly")
+}
+DAILY_BOSSES = BOSSES_BY_CADENCE["daily"]
+WEEKLY_BOSSES = BOSSES_BY_CADENCE["weekly"]
\ No newline at end of file
@@ -1,11 +1,20 @@
+from dataclasses import dataclass
+from typing import Literal
+
+BossCadence = Literal["daily", "weekly"]
+
+
+@dataclass(frozen=True, slots=True)
 class BossEntry:
-    def __init__(self, name: str, attack_style: str, attack_weakness: str, wiki: str, trim_color: int, key: str):
-        self.name = name
-        self.attack_style = attack_style
-        self.attack_weakness = attack_weakness
-        self.wiki = wiki
-        self.trim_color = trim_color
-        self.key = key
+    name: str  # lookup name used by /boss
+    attack_style: str
+    attack_weakness: str
+    wiki: str
+    trim_color: int
+    key: str
+    display_name: str  # name shown in polls, summaries and attendance history
+    emoji: str  # poll reaction
+    cadence: BossCadence  # daily bosses are on both polls, weekly ones only on the weekly poll
 
     def get_description(self) -> str:
         return f"**{self.name}**\nAttack style: 🛡️{self.attack_style}\nAttack style weakness: ⚔️{self.attack_weakness}"
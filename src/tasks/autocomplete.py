@@ -0,0 +1,143 @@
+"""Ranked autocomplete index shared by the slash commands.
+
+Built once from (label, value) pairs. A query is answered in ranked tiers:
+
+1. the label starts with the query (prefix trie)
+2. a later word of the label starts with the query (word-start trie)
+3. the label contains the query
+4. if nothing matched yet, labels sharing enough trigrams with the query
+   (typos)
+
+Within a tier shorter labels come first. Each trie node keeps at most
+MAX_CHOICES entries, already in rank order, so a lookup costs the length of
+the query rather than the size of the catalog.
+"""
+
+import math
+import re
+from collections.abc import Iterable
+
+MAX_CHOICES = 25  # Discord's limit on autocomplete choices
+FUZZY_THRESHOLD = 0.5  # share of the query's trigrams a fuzzy match must have
+
+_WORD_START = re.compile(r"[\s_\-]+(?=\w)")
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class _TrieNode:
+    __slots__ = ("children", "entries")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.entries: list[int] = []
+
+
+class AutocompleteIndex:
+    """Prefix, word-start, substring and trigram matching over a fixed set of labels."""
+
+    def __init__(self, entries: Iterable[tuple[str, str]]) -> None:
+        """Build the index.
+
+        Args:
+            entries: (label shown to the user, value sent back) pairs
+        """
+        self._entries = list(entries)
+        self._keys = [label.lower() for label, _ in self._entries]
+        self._prefix_root = _TrieNode()
+        self._word_root = _TrieNode()
+        self._label_trigrams = [_trigrams(key) for key in self._keys]
+        self._postings: dict[str, list[int]] = {}
+
+        # Insert shortest labels first so every node's list is in rank order
+        ranked = sorted(range(len(self._entries)), key=lambda i: (len(self._keys[i]), self._keys[i]))
+        self._rank = {i: position for position, i in enumerate(ranked)}
+        for i in ranked:
+            key = self._keys[i]
+            self._insert(self._prefix_root, key, i)
+            for match in _WORD_START.finditer(key):
+                self._insert(self._word_root, key[match.end() :], i)
+            for trigram in self._label_trigrams[i]:
+                self._postings.setdefault(trigram, []).append(i)
+
+    @staticmethod
+    def _insert(root: _TrieNode, key: str, index: int) -> None:
+        node = root
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+            if len(node.entries) < MAX_CHOICES and index not in node.entries:
+                node.entries.append(index)
+
+    @staticmethod
+    def _lookup(root: _TrieNode, query: str) -> list[int]:
+        node = root
+        for char in query:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.entries
+
+    def _substring_matches(self, query: str) -> list[int]:
+        if len(query) < 3:
+            candidates = range(len(self._keys))
+        else:
+            # Any label containing the query contains all of its trigrams,
+            # so scanning the rarest one's posting list is enough
+            candidates = min(
+                (self._postings.get(trigram, []) for trigram in _trigrams(query)), key=len
+            )
+        matches = [i for i in candidates if query in self._keys[i]]
+        return sorted(matches, key=self._rank.__getitem__)
+
+    def _fuzzy_matches(self, query: str) -> list[int]:
+        query_trigrams = _trigrams(query)
+        if not query_trigrams:
+            return []
+
+        needed = math.ceil(FUZZY_THRESHOLD * len(query_trigrams))
+        # A match shares at least `needed` trigrams, so it must appear in one of
+        # the rarest len - needed + 1 posting lists; only those are scanned
+        rarest = sorted(query_trigrams, key=lambda t: len(self._postings.get(t, [])))
+        candidates = {
+            i
+            for trigram in rarest[: len(rarest) - needed + 1]
+            for i in self._postings.get(trigram, [])
+        }
+        shared = {i: len(query_trigrams & self._label_trigrams[i]) for i in candidates}
+        matches = [i for i, count in shared.items() if count >= needed]
+        return sorted(matches, key=lambda i: (-shared[i], self._rank[i]))
+
+    def search(self, query: str, limit: int = MAX_CHOICES) -> list[tuple[str, str]]:
+        """Return up to limit (label, value) pairs, best matches first.
+
+        Args:
+            query: What the user has typed so far
+            limit: Maximum number of results
+
+        Returns:
+            Ranked (label, value) pairs; the first entries when query is empty
+        """
+        query = query.strip().lower()
+        if not query:
+            return self._entries[:limit]
+
+        results: list[int] = []
+        seen: set[int] = set()
+        tiers = (
+            lambda: self._lookup(self._prefix_root, query),
+            lambda: self._lookup(self._word_root, query),
+            lambda: self._substring_matches(query),
+            # Fuzzy matching is the typo fallback, only used when nothing matched
+            lambda: [] if results else self._fuzzy_matches(query),
+        )
+        # Later tiers are only computed when earlier ones leave room
+        for tier in tiers:
+            for i in tier():
+                if i not in seen:
+                    seen.add(i)
+                    results.append(i)
+                    if len(results) >= limit:
+                        return [self._entries[i] for i in results]
+        return [self._entries[i] for i in results]
@@ -0,0 +1,180 @@
+"""Boss poll participation history.
+
+When a daily or weekly poll is replaced, its final participation is archived
+per boss and member. Attendance stats (participation rates and streaks) come
+from indexed range queries over a bounded window and are cached until the next
+poll is archived.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import discord
+from sqlalchemy import select
+
+from src.db import BossAttendance, BossPollArchive, MessageType, async_session, insert_ignore
+from src.tasks.boss_constants import POLL_EMOJIS, POLL_OPTION_NAMES
+from src.tasks.boss_summary import DISCORDID_TO_MEMBER
+from src.tasks.message_handles import fetch_full_message
+from src.tasks.poll_reactions import get_poll_reactions, is_tracked, seed_poll
+
+@dataclass
+class AttendanceStats:
+    """Participation of one member over a window of archived polls."""
+
+    member: str
+    days: int
+    daily_polls: int
+    daily_attended: int
+    current_streak: int  # consecutive most recent daily polls answered
+    longest_streak: int
+    weekly_polls: int
+    weekly_attended: int
+    boss_counts: dict[str, int]  # boss -> daily polls where the member signed up for it
+
+
+# (member, channel ID, days) -> stats, cleared whenever a poll is archived
+_stats_cache: dict[tuple[str, str, int], AttendanceStats] = {}
+
+
+async def archive_poll(
+    channel: discord.TextChannel, message_type: MessageType, message_id: str
+) -> None:
+    """Store the final participation of a poll that is about to be replaced.
+
+    Args:
+        channel: Channel where the poll was posted
+        message_type: Type of poll (DAILY or WEEKLY)
+        message_id: Discord message ID of the poll
+    """
+    try:
+        poll_id = int(message_id)
+        if is_tracked(poll_id):
+            reactions = get_poll_reactions(poll_id)
+        else:
+            message = await fetch_full_message(channel, poll_id)
+            reactions = await seed_poll(message, POLL_EMOJIS[message_type])
+
+        channel_id_str = str(channel.id)
+        poll_date = discord.utils.snowflake_time(poll_id).date()
+        rows = [
+            {
+                "poll_type": message_type,
+                "channel_id": channel_id_str,
+                "poll_date": poll_date,
+                "boss": POLL_OPTION_NAMES[emoji],
+                "member": DISCORDID_TO_MEMBER[user_id],
+            }
+            for emoji, user_ids in reactions.items()
+            if emoji in POLL_OPTION_NAMES
+            for user_id in user_ids
+            if user_id in DISCORDID_TO_MEMBER
+        ]
+
+        async with async_session() as db:
+            await db.execute(
+                insert_ignore(BossPollArchive, ["poll_type", "channel_id", "poll_date"])
+                .values(
+                    poll_type=message_type,
+                    channel_id=channel_id_str,
+                    poll_date=poll_date,
+                    message_id=message_id,
+                    archived_at=datetime.now(timezone.utc),
+                )
+            )
+            if rows:
+                await db.execute(
+                    insert_ignore(BossAttendance, ["poll_type", "channel_id", "poll_date", "boss", "member"]),
+                    rows,
+                )
+            await db.commit()
+
+        _stats_cache.clear()
+        logging.info(
+            "[boss_attendance] archived %s poll %s (%s) with %d sign-ups",
+            message_type,
+            message_id,
+            poll_date,
+            len(rows),
+        )
+    except discord.NotFound:
+        logging.warning(
+            "[boss_attendance] %s poll %s not found, nothing to archive",
+            message_type,
+            message_id,
+        )
+    except Exception as e:
+        logging.error(
+            "[boss_attendance] failed to archive %s poll %s: %s",
+            message_type,
+            message_id,
+            e,
+            exc_info=True,
+        )
+
+
+async def get_attendance_stats(member: str, channel_id: str, days: int) -> AttendanceStats:
+    """Get participation rates and streaks for a member.
+
+    Args:
+        member: Game username of the member
+        channel_id: Discord channel ID where the polls are posted
+        days: Size of the window, in days, ending today
+
+    Returns:
+        AttendanceStats for the window
+    """
+    key = (member, channel_id, days)
+    cached = _stats_cache.get(key)
+    if cached is not None:
+        return cached
+
+    since = datetime.now(timezone.utc).date() - timedelta(days=days)
+    async with async_session() as db:
+        polls = (
+            await db.execute(
+                select(BossPollArchive.poll_type, BossPollArchive.poll_date).where(
+                    BossPollArchive.channel_id == channel_id,
+                    BossPollArchive.poll_date >= since,
+                )
+            )
+        ).all()
+        signups = (
+            await db.execute(
+                select(BossAttendance.poll_type, BossAttendance.poll_date, BossAttendance.boss).where(
+                    BossAttendance.member == member,
+                    BossAttendance.channel_id == channel_id,
+                    BossAttendance.poll_date >= since,
+                )
+            )
+        ).all()
+
+    daily_dates = sorted(d for t, d in polls if t == MessageType.DAILY)
+    weekly_dates = {d for t, d in polls if t == MessageType.WEEKLY}
+    attended_daily = {d for t, d, _ in signups if t == MessageType.DAILY}
+    attended_weekly = {d for t, d, _ in signups if t == MessageType.WEEKLY}
+
+    boss_counts: dict[str, int] = {}
+    for poll_type, _, boss in signups:
+        if poll_type == MessageType.DAILY:
+            boss_counts[boss] = boss_counts.get(boss, 0) + 1
+
+    streak = longest = 0
+    for poll_date in daily_dates:
+        streak = streak + 1 if poll_date in attended_daily else 0
+        longest = max(longest, streak)
+
+    stats = AttendanceStats(
+        member=member,
+        days=days,
+        daily_polls=len(daily_dates),
+        daily_attended=len(attended_daily),
+        current_streak=streak,
+        longest_streak=longest,
+        weekly_polls=len(weekly_dates),
+        weekly_attended=len(attended_weekly),
+        boss_counts=boss_counts,
+    )
+    _stats_cache[key] = stats
+    return stats
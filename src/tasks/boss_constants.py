@@ -1,10 +1,29 @@
-"""Shared boss data constants for scheduler and summary tasks."""
+"""Shared boss poll constants for scheduler, summary and attendance tasks.
 
-BOSS_EMOJIS = ["🐔", "😈", "👹", "⚡", "🦁", "🐍"]
-BOSS_NAMES = ["Griffin", "Hades", "Devil", "Zeus", "Chimera", "Medusa"]
+Boss data itself lives in the registry in src.models; this module only adds
+the gem quest option and the poll layouts derived from the registry.
+"""
 
-WEEKLY_BOSS_EMOJIS = ["⏳", "🐊", "🐉"]
-WEEKLY_BOSS_NAMES = ["Kronos", "Sobek", "Messines"]
+from src.db import MessageType
+from src.models import DAILY_BOSSES, WEEKLY_BOSSES
 
 GEM_EMOJI = "💎"
 GEM_NAME = "Gem Quest"
+
+# Reactions seeded on each poll, in display order
+DAILY_POLL_EMOJIS = tuple(boss.emoji for boss in DAILY_BOSSES)
+WEEKLY_POLL_EMOJIS = DAILY_POLL_EMOJIS + tuple(boss.emoji for boss in WEEKLY_BOSSES) + (GEM_EMOJI,)
+POLL_EMOJIS = {MessageType.DAILY: DAILY_POLL_EMOJIS, MessageType.WEEKLY: WEEKLY_POLL_EMOJIS}
+
+# Any poll reaction emoji -> the name recorded for it in summaries and attendance
+POLL_OPTION_NAMES = {
+    **{boss.emoji: boss.display_name for boss in DAILY_BOSSES + WEEKLY_BOSSES},
+    GEM_EMOJI: GEM_NAME,
+}
+
+# Job queue resource shared by everything that replaces or edits poll and
+# summary messages, so those jobs never interleave
+BOSS_MESSAGES_RESOURCE = "boss-messages"
+
+# Width used to align names in the summary
+MAX_OPTION_NAME_LENGTH = max(len(name) for name in POLL_OPTION_NAMES.values())
@@ -2,31 +2,38 @@
 
 Posts daily and weekly boss quest polls at midnight UTC. On Mondays, posts both
 weekly poll (first) and daily poll (second). On other days, posts only daily poll.
+Message IDs are recorded as soon as each poll is sent; reactions are added afterwards.
 """
 
 import asyncio
 import datetime
 import logging
 import os
+import time
 from zoneinfo import ZoneInfo
 
 import discord
 from discord.ext import tasks
 
 from src.db import MessageType
+from src.metrics import track_task
+from src.models import DAILY_BOSSES, WEEKLY_BOSSES
 from src.tasks.scheduled_message_ops import (
-    delete_scheduled_message,
     get_scheduled_message,
     upsert_scheduled_message,
+    write_scheduled_messages,
 )
 from src.tasks.boss_constants import (
-    BOSS_EMOJIS,
-    BOSS_NAMES,
+    BOSS_MESSAGES_RESOURCE,
+    DAILY_POLL_EMOJIS,
     GEM_EMOJI,
-    WEEKLY_BOSS_EMOJIS,
-    WEEKLY_BOSS_NAMES,
+    WEEKLY_POLL_EMOJIS,
 )
-from src.tasks.utils import find_channel_by_name
+from src.tasks.boss_attendance import archive_poll
+from src.tasks.job_queue import Job, submit_job, wait_for_job
+from src.tasks.message_handles import forget_message, get_message_handle, remember_message
+from src.tasks.poll_reactions import track_poll, untrack_poll
+from src.tasks.utils import find_channels
 
 DEFAULT_CHANNEL = "tactical-dispatch"
 
@@ -65,20 +72,17 @@ def _build_boss_poll_message(is_weekly: bool) -> tuple[str, list[str]]:
         title = f"What are your **daily boss quests today ({date_str})?**"
 
     # Build boss list with emojis
-    boss_lines = [f"{emoji} {name}" for emoji, name in zip(BOSS_EMOJIS, BOSS_NAMES)]
+    boss_lines = [f"{boss.emoji} {boss.display_name}" for boss in DAILY_BOSSES]
 
     # Add weekly bosses and gem quest for weekly polls
     if is_weekly:
-        boss_lines += [f"{emoji} {name}" for emoji, name in zip(WEEKLY_BOSS_EMOJIS, WEEKLY_BOSS_NAMES)]
+        boss_lines += [f"{boss.emoji} {boss.display_name}" for boss in WEEKLY_BOSSES]
         boss_lines.append(f"{GEM_EMOJI} Gem quest")
 
     message = f"{title}\n\n" + "\n".join(boss_lines)
 
-    # Build emoji list for reactions
-    emojis = BOSS_EMOJIS.copy()
-    if is_weekly:
-        emojis += WEEKLY_BOSS_EMOJIS
-        emojis.append(GEM_EMOJI)
+    # Emoji list for reactions
+    emojis = list(WEEKLY_POLL_EMOJIS if is_weekly else DAILY_POLL_EMOJIS)
 
     return message, emojis
 
@@ -87,23 +91,33 @@ async def _delete_previous_message(
     client: discord.Client,
     channel: discord.TextChannel,
     message_type: MessageType,
-) -> None:
+) -> bool:
     """Delete previous scheduled message if exists.
 
+    The database record is left for the caller to clear, so that all record
+    changes of a publish cycle are written in one transaction.
+
     Args:
         client: Discord client instance
         channel: Channel where message was posted
         message_type: Type of message to delete
+
+    Returns:
+        True if there was a previous message record
     """
     try:
         # Get previous message ID from database
         prev_message_id = await get_scheduled_message(message_type, str(channel.id))
 
         if prev_message_id:
+            # Keep the final participation before the poll disappears
+            if message_type != MessageType.BOSS_SUMMARY:
+                await archive_poll(channel, message_type, prev_message_id)
+            untrack_poll(int(prev_message_id))
             try:
-                # Fetch and delete the message
-                prev_message = await channel.fetch_message(int(prev_message_id))
-                await prev_message.delete()
+                # Delete through the cached handle, no fetch needed
+                await get_message_handle(channel, int(prev_message_id)).delete()
+                forget_message(int(prev_message_id))
                 logging.info(
                     "[boss_scheduler] deleted previous %s message %s",
                     message_type,
@@ -122,110 +136,260 @@ async def _delete_previous_message(
                     e,
                 )
 
-            # Always clean up database record, whether deletion succeeded or not
-            await delete_scheduled_message(message_type, str(channel.id))
+        return bool(prev_message_id)
     except Exception as e:
         logging.error(
             "[boss_scheduler] error during message deletion: %s", e, exc_info=True
         )
+        return False
 
 
-async def _post_boss_poll(
-    client: discord.Client,
+async def _send_poll(
+    channel: discord.TextChannel,
     is_weekly: bool,
-) -> None:
-    """Post a boss poll message with deletion of previous message.
+) -> tuple[discord.Message, list[str]] | None:
+    """Send a boss poll message and record it right away.
+
+    The message ID is stored as soon as the send succeeds so the summary and
+    reaction tracking can pick the poll up while reactions are still being added.
 
     Args:
-        client: Discord client instance
+        channel: Channel to post the poll in
         is_weekly: True for weekly poll, False for daily poll
+
+    Returns:
+        Tuple of (message, emoji_list), or None if the send failed
     """
     message_type = MessageType.WEEKLY if is_weekly else MessageType.DAILY
     poll_name = "weekly" if is_weekly else "daily"
 
-    try:
-        # Get channel
-        channel_name = os.getenv("BOSS_POLL_CHANNEL", DEFAULT_CHANNEL)
-        channel = find_channel_by_name(client, channel_name)
-
-        if channel is None:
-            logging.warning(
-                "[boss_scheduler] channel %s not found, cannot post %s poll",
-                channel_name,
+    # Build message content
+    message_content, emojis = _build_boss_poll_message(is_weekly)
+
+    # Send message with retry logic
+    message = None
+    backoff = 0.5  # Start with 500ms delay
+
+    for attempt in range(1, 4):
+        try:
+            message = await channel.send(message_content)
+            logging.info(
+                "[boss_scheduler] posted %s poll message %s",
                 poll_name,
+                message.id,
             )
-            return
+            break
+        except discord.HTTPException as e:
+            if attempt < 3:
+                logging.warning(
+                    "[boss_scheduler] attempt %d to post %s poll failed: %s, retrying...",
+                    attempt,
+                    poll_name,
+                    e,
+                )
+                await asyncio.sleep(backoff)
+                backoff *= 2
+            else:
+                logging.error(
+                    "[boss_scheduler] all attempts to post %s poll failed: %s",
+                    poll_name,
+                    e,
+                )
+                return None
+
+    if message is None:
+        logging.error("[boss_scheduler] failed to post %s poll", poll_name)
+        return None
 
-        # Delete previous message
-        await _delete_previous_message(client, channel, message_type)
+    # Track reactions from gateway events before any user can react
+    track_poll(message.id, emojis)
+    remember_message(message)
 
-        # We remove the summary every time to ensure it doesn't get out of sync with the polls, but we only want to delete the summary once per day (not for weekly polls) to avoid deleting it twice on Mondays.
-        if not is_weekly:
-            await _delete_previous_message(client, channel, MessageType.BOSS_SUMMARY)
+    # Store message ID in database
+    await upsert_scheduled_message(message_type, str(channel.id), str(message.id))
+
+    return message, emojis
 
-        # Convert channel ID to string for database storage
-        channel_id_str = str(channel.id)
 
-        # Build message content
-        message_content, emojis = _build_boss_poll_message(is_weekly)
+async def _seed_reactions(message: discord.Message, emojis: list[str]) -> None:
+    """Add the poll's emoji reactions in order.
 
-        # Send message with retry logic
-        message = None
-        backoff = 0.5  # Start with 500ms delay
+    discord.py already waits on the reaction route's rate-limit bucket (and
+    retries 429s), so no fixed sleep is needed between reactions. Other
+    failures are retried with a short backoff.
 
+    Args:
+        message: Poll message to react to
+        emojis: Emojis to add, in display order
+    """
+    for emoji in emojis:
+        backoff = 0.5
         for attempt in range(1, 4):
             try:
-                message = await channel.send(message_content)
-                logging.info(
-                    "[boss_scheduler] posted %s poll message %s",
-                    poll_name,
-                    message.id,
-                )
+                await message.add_reaction(emoji)
                 break
             except discord.HTTPException as e:
-                if attempt < 3:
-                    logging.warning(
-                        "[boss_scheduler] attempt %d to post %s poll failed: %s, retrying...",
-                        attempt,
-                        poll_name,
-                        e,
-                    )
+                if attempt < 3 and e.status >= 500:
                     await asyncio.sleep(backoff)
                     backoff *= 2
-                else:
-                    logging.error(
-                        "[boss_scheduler] all attempts to post %s poll failed: %s",
-                        poll_name,
-                        e,
-                    )
-                    return
-
-        if message is None:
-            logging.error("[boss_scheduler] failed to post %s poll", poll_name)
-            return
-
-        # Add emoji reactions sequentially
-        for emoji in emojis:
-            try:
-                await message.add_reaction(emoji)
-                await asyncio.sleep(0.15)  # Rate limit prevention
-            except discord.HTTPException as e:
+                    continue
                 logging.error(
                     "[boss_scheduler] failed to add reaction %s: %s", emoji, e
                 )
+                break
 
-        # Store message ID in database
-        await upsert_scheduled_message(message_type, channel_id_str, str(message.id))
+
+async def _publish_polls(
+    client: discord.Client,
+    channel: discord.TextChannel,
+    include_weekly: bool,
+    include_daily: bool,
+    poll_names: str,
+) -> None:
+    """Run the delete/post/react pipeline for one channel.
+
+    Previous messages are removed concurrently, then the polls are sent in
+    display order (weekly above daily), then both get their reactions at the
+    same time. Reactions in one channel share a Discord rate-limit bucket, which
+    discord.py serializes for us.
+
+    Args:
+        client: Discord client instance
+        channel: Channel to publish in
+        include_weekly: Whether to post the weekly poll
+        include_daily: Whether to post the daily poll
+        poll_names: Human-readable list of polls for logging
+    """
+    start = time.perf_counter()
+
+    try:
+        # Delete previous messages. We remove the summary with the daily poll
+        # to ensure it doesn't get out of sync with the polls, but only once
+        # per day (not for weekly polls) to avoid deleting it twice on Mondays.
+        to_delete = []
+        if include_weekly:
+            to_delete.append(MessageType.WEEKLY)
+        if include_daily:
+            to_delete += [MessageType.DAILY, MessageType.BOSS_SUMMARY]
+        had_previous = await asyncio.gather(
+            *(_delete_previous_message(client, channel, message_type) for message_type in to_delete)
+        )
+
+        # Always clean up the records, whether deletion succeeded or not
+        try:
+            await write_scheduled_messages(
+                deletes=[
+                    (message_type, str(channel.id))
+                    for message_type, had in zip(to_delete, had_previous)
+                    if had
+                ]
+            )
+        except Exception as e:
+            # The upserts below overwrite the poll records anyway
+            logging.error("[boss_scheduler] failed to clear previous message records: %s", e, exc_info=True)
+
+        # Send in display order so the weekly poll sits above the daily one
+        posted = []
+        if include_weekly:
+            posted.append(await _send_poll(channel, is_weekly=True))
+        if include_daily:
+            posted.append(await _send_poll(channel, is_weekly=False))
+
+        await asyncio.gather(
+            *(_seed_reactions(message, emojis) for message, emojis in filter(None, posted))
+        )
+
+        logging.info(
+            "[boss_scheduler] published %s poll in #%s (%s) in %.0f ms",
+            poll_names,
+            channel.name,
+            channel.guild.name,
+            (time.perf_counter() - start) * 1000,
+        )
 
     except Exception as e:
         logging.error(
-            "[boss_scheduler] unexpected error posting %s poll: %s",
-            poll_name,
+            "[boss_scheduler] unexpected error posting %s poll in #%s (%s): %s",
+            poll_names,
+            channel.name,
+            channel.guild.name,
             e,
             exc_info=True,
         )
 
 
+async def _post_boss_polls(
+    client: discord.Client,
+    include_weekly: bool,
+    include_daily: bool = True,
+) -> None:
+    """Post the requested boss polls to every configured channel.
+
+    BOSS_POLL_CHANNEL holds a comma-separated list of channel names or IDs.
+    Each channel runs its own pipeline concurrently, so a failing or slow
+    channel doesn't hold up the others.
+
+    Args:
+        client: Discord client instance
+        include_weekly: Whether to post the weekly poll
+        include_daily: Whether to post the daily poll
+    """
+    start = time.perf_counter()
+    poll_names = ", ".join(
+        name for name, included in (("weekly", include_weekly), ("daily", include_daily)) if included
+    )
+
+    channel_spec = os.getenv("BOSS_POLL_CHANNEL", DEFAULT_CHANNEL)
+    channels = find_channels(client, channel_spec)
+
+    if not channels:
+        logging.warning(
+            "[boss_scheduler] no channel found for %s, cannot post %s poll",
+            channel_spec,
+            poll_names,
+        )
+        return
+
+    await asyncio.gather(
+        *(
+            _publish_polls(client, channel, include_weekly, include_daily, poll_names)
+            for channel in channels
+        )
+    )
+    logging.info(
+        "[boss_scheduler] published %s poll to %d channel(s) in %.0f ms",
+        poll_names,
+        len(channels),
+        (time.perf_counter() - start) * 1000,
+    )
+
+
+def submit_boss_polls(
+    client: discord.Client,
+    include_weekly: bool,
+    include_daily: bool = True,
+) -> tuple[Job, bool]:
+    """Queue posting of boss polls as a job.
+
+    An identical request that is still queued or running is reused, and poll
+    jobs never overlap with each other or with summary jobs.
+
+    Args:
+        client: Discord client instance
+        include_weekly: Whether to post the weekly poll
+        include_daily: Whether to post the daily poll
+
+    Returns:
+        Tuple of (job, created); created is False if an in-flight job was reused
+    """
+    return submit_job(
+        "boss-poll",
+        {"weekly": str(include_weekly).lower(), "daily": str(include_daily).lower()},
+        lambda: _post_boss_polls(client, include_weekly, include_daily),
+        resource=BOSS_MESSAGES_RESOURCE,
+    )
+
+
 def create_boss_scheduler(client: discord.Client) -> tasks.Loop:
     """Create boss poll scheduler task that runs at midnight UTC.
 
@@ -237,20 +401,16 @@ def create_boss_scheduler(client: discord.Client) -> tasks.Loop:
     """
 
     @tasks.loop(time=datetime.time(hour=0, minute=0, tzinfo=ZoneInfo("UTC")))
+    @track_task("post_boss_poll")
     async def post_boss_poll():
         """Post daily boss poll at midnight UTC, plus weekly on Mondays."""
         try:
             now = datetime.datetime.now(ZoneInfo("UTC"))
             is_monday = now.weekday() == 0  # Monday = 0
 
-            # On Mondays, post weekly first, then daily
-            if is_monday:
-                await _post_boss_poll(client, is_weekly=True)
-                # Small delay between messages
-                await asyncio.sleep(1)
-
-            # Always post daily (including on Mondays)
-            await _post_boss_poll(client, is_weekly=False)
+            # On Mondays, post weekly and daily together (weekly shown first)
+            job, _ = submit_boss_polls(client, include_weekly=is_monday)
+            await wait_for_job(job)
 
         except Exception as e:
             logging.error("[boss_scheduler] unexpected error: %s", e, exc_info=True)
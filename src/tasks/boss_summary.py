@@ -2,12 +2,16 @@
 
 Posts and updates a daily summary of boss fight participation based on poll reactions.
 Collects reactions from daily and weekly boss poll messages, formats participant lists,
-and updates the summary message in-place.
+and updates the summary message in-place. Between scheduled runs, poll reaction
+changes trigger a debounced refresh of the posted summary.
 """
 
+import asyncio
 import datetime
+import hashlib
 import logging
 import os
+import time
 from dataclasses import dataclass
 from zoneinfo import ZoneInfo
 
@@ -15,20 +19,24 @@ import discord
 from discord.ext import tasks
 
 from src.db import MessageType
+from src.metrics import track_task
+from src.models import DAILY_BOSSES, WEEKLY_BOSSES
 from src.tasks.scheduled_message_ops import (
     delete_scheduled_message,
     get_scheduled_message,
     upsert_scheduled_message,
 )
 from src.tasks.boss_constants import (
-    BOSS_EMOJIS,
-    BOSS_NAMES,
+    BOSS_MESSAGES_RESOURCE,
     GEM_EMOJI,
     GEM_NAME,
-    WEEKLY_BOSS_EMOJIS,
-    WEEKLY_BOSS_NAMES,
+    MAX_OPTION_NAME_LENGTH,
+    POLL_EMOJIS,
 )
-from src.tasks.utils import find_channel_by_name
+from src.tasks.job_queue import Job, submit_job, wait_for_job
+from src.tasks.message_handles import fetch_full_message, get_message_handle, remember_message
+from src.tasks.poll_reactions import get_poll_reactions, is_tracked, seed_poll
+from src.tasks.utils import find_channels
 
 # Member mapping (Discord username → Display name)
 MEMBER_TO_DISCORD = {
@@ -55,6 +63,14 @@ DISCORDID_TO_MEMBER = {
 
 DEFAULT_CHANNEL = "tactical-dispatch"
 DEFAULT_TIME = "9:30"
+DEFAULT_DEBOUNCE_SECONDS = 30
+
+# channel ID -> (summary message ID, hash of the content last posted to it)
+_last_summary_hash: dict[str, tuple[str, str]] = {}
+
+# channel ID -> debounced refresh task / channels with changes awaiting a refresh
+_refresh_tasks: dict[int, asyncio.Task] = {}
+_refresh_pending: set[int] = set()
 
 
 @dataclass
@@ -68,7 +84,7 @@ class BossParticipation:
 async def _fetch_poll_message(
     channel: discord.TextChannel, message_type: MessageType
 ) -> discord.Message | None:
-    """Fetch a poll message from the database and Discord.
+    """Fetch a poll message, going to Discord only if it isn't cached.
 
     Args:
         channel: Channel where the poll was posted
@@ -85,7 +101,7 @@ async def _fetch_poll_message(
             )
             return None
 
-        message = await channel.fetch_message(int(message_id))
+        message = await fetch_full_message(channel, int(message_id))
         logging.info("[boss_summary] fetched %s poll message %s", message_type, message_id)
         return message
     except discord.NotFound:
@@ -110,31 +126,67 @@ async def _fetch_poll_message(
         return None
 
 
-async def _get_reactions_for_emoji(
-    message: discord.Message, emoji: str
-) -> set[int]:
-    """Get all user IDs who reacted with a specific emoji.
+async def _load_poll_reactions(
+    channel: discord.TextChannel, message_type: MessageType
+) -> dict[str, set[int]] | None:
+    """Get the reaction state of a poll, seeding it from REST on first use.
 
     Args:
-        message: Discord message to check reactions on
-        emoji: Emoji to filter by
+        channel: Channel where the poll was posted
+        message_type: Type of poll (DAILY or WEEKLY)
 
     Returns:
-        Set of user IDs who reacted with the emoji
+        Mapping of emoji to user IDs, or None if the poll doesn't exist
     """
-    user_ids = set()
-    for reaction in message.reactions:
-        if str(reaction.emoji) == emoji:
-            try:
-                async for user in reaction.users():
-                    if not user.bot:
-                        user_ids.add(user.id)
-            except discord.HTTPException as e:
-                logging.error(
-                    "[boss_summary] failed to fetch users for reaction %s: %s", emoji, e
-                )
-            break
-    return user_ids
+    message_id = await get_scheduled_message(message_type, str(channel.id))
+    if not message_id:
+        logging.info(
+            "[boss_summary] no %s poll message found in database", message_type
+        )
+        return None
+
+    if is_tracked(int(message_id)):
+        return get_poll_reactions(int(message_id))
+
+    message = await _fetch_poll_message(channel, message_type)
+    if message is None:
+        return None
+    return await seed_poll(message, POLL_EMOJIS[message_type])
+
+
+async def seed_poll_reactions(client: discord.Client) -> None:
+    """Seed reaction state for the current polls once at startup.
+
+    Args:
+        client: Discord client instance
+    """
+    channel_spec = os.getenv("BOSS_SUMMARY_CHANNEL", DEFAULT_CHANNEL)
+    channels = find_channels(client, channel_spec)
+    if not channels:
+        logging.warning(
+            "[boss_summary] no channel found for %s, cannot seed poll reactions", channel_spec
+        )
+        return
+
+    async def seed(channel: discord.TextChannel, message_type: MessageType) -> None:
+        try:
+            await _load_poll_reactions(channel, message_type)
+        except Exception as e:
+            logging.error(
+                "[boss_summary] failed to seed %s poll reactions in #%s: %s",
+                message_type,
+                channel.name,
+                e,
+                exc_info=True,
+            )
+
+    await asyncio.gather(
+        *(
+            seed(channel, message_type)
+            for channel in channels
+            for message_type in (MessageType.DAILY, MessageType.WEEKLY)
+        )
+    )
 
 
 def _map_user_ids_to_names(user_ids: set[int], guild: discord.Guild) -> list[str]:
@@ -172,50 +224,58 @@ async def _collect_boss_data(
         Dictionary mapping boss names to BossParticipation objects
     """
     boss_data = {}
+    start = time.perf_counter()
 
-    # Fetch poll messages
-    daily_message = await _fetch_poll_message(channel, MessageType.DAILY)
-    weekly_message = await _fetch_poll_message(channel, MessageType.WEEKLY)
+    # Reaction state is kept current from gateway events, so this is normally
+    # in-memory; polls that still need seeding are fetched concurrently
+    daily_reactions, weekly_reactions = await asyncio.gather(
+        _load_poll_reactions(channel, MessageType.DAILY),
+        _load_poll_reactions(channel, MessageType.WEEKLY),
+    )
+    logging.info(
+        "[boss_summary] loaded poll reactions in %.0f ms",
+        (time.perf_counter() - start) * 1000,
+    )
 
-    if not daily_message and not weekly_message:
+    if daily_reactions is None and weekly_reactions is None:
         logging.warning(
             "[boss_summary] no poll messages found, summary will be empty"
         )
         return boss_data
 
     # Collect reactions for regular bosses
-    for emoji, name in zip(BOSS_EMOJIS, BOSS_NAMES):
+    for boss in DAILY_BOSSES:
         daily_user_ids = set()
         weekly_user_ids = set()
 
-        if daily_message:
-            daily_user_ids = await _get_reactions_for_emoji(daily_message, emoji)
+        if daily_reactions is not None:
+            daily_user_ids = daily_reactions.get(boss.emoji, set())
 
-        if weekly_message:
-            weekly_user_ids = await _get_reactions_for_emoji(weekly_message, emoji)
+        if weekly_reactions is not None:
+            weekly_user_ids = weekly_reactions.get(boss.emoji, set())
 
         # Convert user IDs to names
         daily_names = _map_user_ids_to_names(daily_user_ids, guild)
         weekly_names = _map_user_ids_to_names(weekly_user_ids, guild)
 
-        boss_data[name] = BossParticipation(
+        boss_data[boss.display_name] = BossParticipation(
             daily_users=set(daily_names), weekly_users=set(weekly_names)
         )
 
     # Collect reactions for Gem Quest (weekly only)
-    if weekly_message:
-        gem_user_ids = await _get_reactions_for_emoji(weekly_message, GEM_EMOJI)
+    if weekly_reactions is not None:
+        gem_user_ids = weekly_reactions.get(GEM_EMOJI, set())
         gem_names = _map_user_ids_to_names(gem_user_ids, guild)
         boss_data[GEM_NAME] = BossParticipation(
             daily_users=set(), weekly_users=set(gem_names)
         )
 
     # Collect reactions for weekly-only bosses (Kronos, Sobek, Messines)
-    if weekly_message:
-        for emoji, name in zip(WEEKLY_BOSS_EMOJIS, WEEKLY_BOSS_NAMES):
-            user_ids = await _get_reactions_for_emoji(weekly_message, emoji)
+    if weekly_reactions is not None:
+        for boss in WEEKLY_BOSSES:
+            user_ids = weekly_reactions.get(boss.emoji, set())
             names = _map_user_ids_to_names(user_ids, guild)
-            boss_data[name] = BossParticipation(
+            boss_data[boss.display_name] = BossParticipation(
                 daily_users=set(), weekly_users=set(names)
             )
 
@@ -234,12 +294,9 @@ def _format_summary_message(boss_data: dict[str, BossParticipation], skip_weekly
     """
     lines = ["Today's boss fight summaries:", ""]
 
-    # Find max boss name length for alignment
-    max_length = max(len(name) for name in BOSS_NAMES + WEEKLY_BOSS_NAMES + [GEM_NAME])
-
     # Format regular bosses
-    for emoji, name in zip(BOSS_EMOJIS, BOSS_NAMES):
-        participation = boss_data.get(name)
+    for boss in DAILY_BOSSES:
+        participation = boss_data.get(boss.display_name)
         if not participation:
             continue
 
@@ -257,35 +314,38 @@ def _format_summary_message(boss_data: dict[str, BossParticipation], skip_weekly
         if not users:
             continue
 
-        padded_name = name.ljust(max_length)
+        padded_name = boss.display_name.ljust(MAX_OPTION_NAME_LENGTH)
         user_list = " · ".join(users)
-        lines.append(f"{emoji} `{padded_name}:` {user_list}")
+        lines.append(f"{boss.emoji} `{padded_name}:` {user_list}")
 
     # Format Gem Quest with extra newline
     if GEM_NAME in boss_data:
         participation = boss_data[GEM_NAME]
         if participation.weekly_users:
             lines.append("")
-            padded_name = GEM_NAME.rjust(max_length)
+            padded_name = GEM_NAME.rjust(MAX_OPTION_NAME_LENGTH)
             user_list = " · ".join(sorted(participation.weekly_users))
             lines.append(f"{GEM_EMOJI} `{padded_name}:` {user_list}")
 
     # Weekly-only bosses shown only on Fridays
     if skip_weekly:
-        for emoji, name in zip(WEEKLY_BOSS_EMOJIS, WEEKLY_BOSS_NAMES):
-            participation = boss_data.get(name)
+        for boss in WEEKLY_BOSSES:
+            participation = boss_data.get(boss.display_name)
             if not participation or not participation.weekly_users:
                 continue
             lines.append("")
-            padded_name = name.ljust(max_length)
+            padded_name = boss.display_name.ljust(MAX_OPTION_NAME_LENGTH)
             user_list = " · ".join(sorted(participation.weekly_users))
-            lines.append(f"{emoji} `{padded_name}:` {user_list}")
+            lines.append(f"{boss.emoji} `{padded_name}:` {user_list}")
 
     return "\n".join(lines)
 
 
 async def _post_or_update_summary(
-    client: discord.Client, channel: discord.TextChannel, content: str
+    client: discord.Client,
+    channel: discord.TextChannel,
+    content: str,
+    create_if_missing: bool = True,
 ) -> None:
     """Post new summary or update existing summary message.
 
@@ -293,19 +353,32 @@ async def _post_or_update_summary(
         client: Discord client instance
         channel: Channel where summary is posted
         content: Message content to post/update
+        create_if_missing: Whether to post a new message if none exists yet
     """
     channel_id_str = str(channel.id)
+    content_hash = hashlib.sha256(content.encode()).hexdigest()
 
     # Try to get existing message ID
     existing_message_id = await get_scheduled_message(
         MessageType.BOSS_SUMMARY, channel_id_str
     )
 
+    stale_record = False
     if existing_message_id:
+        # Skip the edit entirely if the message already shows this content
+        if _last_summary_hash.get(channel_id_str) == (existing_message_id, content_hash):
+            logging.info(
+                "[boss_summary] summary message %s unchanged, skipping edit",
+                existing_message_id,
+            )
+            return
+
         # Try to edit existing message
         try:
-            message = await channel.fetch_message(int(existing_message_id))
-            await message.edit(content=content)
+            # Edit through the cached handle, no fetch needed
+            message = await get_message_handle(channel, int(existing_message_id)).edit(content=content)
+            remember_message(message)
+            _last_summary_hash[channel_id_str] = (existing_message_id, content_hash)
             logging.info(
                 "[boss_summary] updated existing summary message %s", existing_message_id
             )
@@ -315,47 +388,50 @@ async def _post_or_update_summary(
                 "[boss_summary] existing message %s not found, will post new message",
                 existing_message_id,
             )
-            # Clean up database record
-            await delete_scheduled_message(MessageType.BOSS_SUMMARY, channel_id_str)
+            stale_record = True
         except discord.HTTPException as e:
             logging.error(
                 "[boss_summary] failed to edit message %s: %s, will post new message",
                 existing_message_id,
                 e,
             )
-            # Clean up database record
+            stale_record = True
+
+    if not create_if_missing:
+        logging.info("[boss_summary] no summary message to update, skipping")
+        if stale_record:
             await delete_scheduled_message(MessageType.BOSS_SUMMARY, channel_id_str)
+        return
 
     # Post new message
     try:
         message = await channel.send(content)
+        remember_message(message)
+        _last_summary_hash[channel_id_str] = (str(message.id), content_hash)
         logging.info("[boss_summary] posted new summary message %s", message.id)
 
-        # Store message ID in database
+        # Store message ID in database (this also replaces any stale record)
         await upsert_scheduled_message(
             MessageType.BOSS_SUMMARY, channel_id_str, str(message.id)
         )
     except discord.HTTPException as e:
         logging.error("[boss_summary] failed to post summary message: %s", e)
+        # Clean up database record
+        if stale_record:
+            await delete_scheduled_message(MessageType.BOSS_SUMMARY, channel_id_str)
 
 
-async def _regenerate_boss_summary(client: discord.Client) -> None:
-    """Regenerate the boss fight participation summary.
+async def _regenerate_channel_summary(
+    client: discord.Client, channel: discord.TextChannel, create_if_missing: bool
+) -> None:
+    """Regenerate the summary for the polls of one channel.
 
     Args:
         client: Discord client instance
+        channel: Channel holding the polls and the summary
+        create_if_missing: Whether to post a new summary if none exists yet
     """
     try:
-        # Get channel
-        channel_name = os.getenv("BOSS_SUMMARY_CHANNEL", DEFAULT_CHANNEL)
-        channel = find_channel_by_name(client, channel_name)
-
-        if channel is None:
-            logging.warning(
-                "[boss_summary] channel %s not found, cannot post summary", channel_name
-            )
-            return
-
         # Get guild for member lookups
         guild = channel.guild
 
@@ -370,12 +446,107 @@ async def _regenerate_boss_summary(client: discord.Client) -> None:
         content = _format_summary_message(boss_data, is_friday)
 
         # Post or update summary
-        await _post_or_update_summary(client, channel, content)
+        await _post_or_update_summary(client, channel, content, create_if_missing)
 
     except Exception as e:
         logging.error(
-            "[boss_summary] unexpected error regenerating summary: %s", e, exc_info=True
+            "[boss_summary] unexpected error regenerating summary in #%s: %s",
+            channel.name,
+            e,
+            exc_info=True,
+        )
+
+
+async def _regenerate_boss_summary(
+    client: discord.Client,
+    create_if_missing: bool = True,
+    channel_id: int | None = None,
+) -> None:
+    """Regenerate the boss fight participation summary.
+
+    BOSS_SUMMARY_CHANNEL holds a comma-separated list of channel names or IDs;
+    each channel summarizes its own polls, concurrently with the others.
+
+    Args:
+        client: Discord client instance
+        create_if_missing: Whether to post a new summary if none exists yet
+        channel_id: Only regenerate the summary of this channel
+    """
+    channel_spec = os.getenv("BOSS_SUMMARY_CHANNEL", DEFAULT_CHANNEL)
+    channels = find_channels(client, channel_spec)
+    if channel_id is not None:
+        channels = [channel for channel in channels if channel.id == channel_id]
+
+    if not channels:
+        logging.warning(
+            "[boss_summary] no channel found for %s, cannot post summary", channel_spec
         )
+        return
+
+    await asyncio.gather(
+        *(_regenerate_channel_summary(client, channel, create_if_missing) for channel in channels)
+    )
+
+
+def submit_boss_summary(
+    client: discord.Client,
+    create_if_missing: bool = True,
+    channel_id: int | None = None,
+) -> tuple[Job, bool]:
+    """Queue a summary regeneration as a job.
+
+    An identical request that is still queued or running is reused, and
+    summary jobs never overlap with each other or with poll jobs.
+
+    Args:
+        client: Discord client instance
+        create_if_missing: Whether to post a new summary if none exists yet
+        channel_id: Only regenerate the summary of this channel
+
+    Returns:
+        Tuple of (job, created); created is False if an in-flight job was reused
+    """
+    return submit_job(
+        "boss-summary",
+        {
+            "create_if_missing": str(create_if_missing).lower(),
+            "channel": str(channel_id) if channel_id is not None else "all",
+        },
+        lambda: _regenerate_boss_summary(client, create_if_missing, channel_id),
+        resource=BOSS_MESSAGES_RESOURCE,
+    )
+
+
+async def _debounced_refresh(client: discord.Client, channel_id: int) -> None:
+    try:
+        delay = float(os.getenv("BOSS_SUMMARY_DEBOUNCE_SECONDS", DEFAULT_DEBOUNCE_SECONDS))
+    except ValueError:
+        delay = DEFAULT_DEBOUNCE_SECONDS
+
+    # Changes arriving while we sleep are absorbed into this refresh; changes
+    # arriving while the summary renders trigger one more round
+    while channel_id in _refresh_pending:
+        await asyncio.sleep(delay)
+        _refresh_pending.discard(channel_id)
+        job, _ = submit_boss_summary(client, create_if_missing=False, channel_id=channel_id)
+        await wait_for_job(job)
+
+
+def schedule_summary_refresh(client: discord.Client, channel_id: int) -> None:
+    """Request a live summary refresh after a poll reaction change.
+
+    Bursts of changes are coalesced into one refresh per debounce window
+    (BOSS_SUMMARY_DEBOUNCE_SECONDS). Only an already-posted summary is
+    updated; the scheduled run still decides when a new one is posted.
+
+    Args:
+        client: Discord client instance
+        channel_id: Channel whose poll changed
+    """
+    _refresh_pending.add(channel_id)
+    task = _refresh_tasks.get(channel_id)
+    if task is None or task.done():
+        _refresh_tasks[channel_id] = asyncio.create_task(_debounced_refresh(client, channel_id))
 
 
 def create_boss_summary_scheduler(client: discord.Client) -> tasks.Loop:
@@ -405,8 +576,10 @@ def create_boss_summary_scheduler(client: discord.Client) -> tasks.Loop:
         run_time = datetime.time(hour=hour, minute=minute, tzinfo=ZoneInfo("America/New_York"))
 
     @tasks.loop(time=run_time)
+    @track_task("post_boss_summary")
     async def post_boss_summary():
         """Post or update boss fight participation summary."""
-        await _regenerate_boss_summary(client)
+        job, _ = submit_boss_summary(client)
+        await wait_for_job(job)
 
     return post_boss_summary
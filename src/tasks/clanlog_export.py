@@ -0,0 +1,142 @@
+"""Read access to the stored clan log history.
+
+Rows are read in (timestamp, id) order with keyset pagination: every page is
+a short query for the next PAGE_SIZE rows after the last one seen, served by
+an index that leads with the filtered column. Pages are yielded one at a time
+so an export of the whole table never sits in memory, and no read
+transaction stays open while a slow client drains the response.
+
+Cursors are opaque strings naming the last row a client received; passing
+one back resumes the listing right after that row.
+"""
+
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from sqlalchemy import and_, or_, select
+
+from src.db import ClanLog, async_session
+
+PAGE_SIZE = 500
+
+_CURSOR_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+@dataclass(frozen=True)
+class ClanLogFilter:
+    """Which clan logs to read. Empty fields don't filter."""
+
+    log_types: tuple[str, ...] = ()
+    member: str | None = None
+    since: datetime | None = None  # inclusive
+    until: datetime | None = None  # exclusive
+
+
+def encode_cursor(log: ClanLog) -> str:
+    """Cursor that resumes a listing right after this row."""
+    return f"{log.timestamp.astimezone(timezone.utc).strftime(_CURSOR_TIME_FORMAT)}_{log.id}"
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Split a cursor into the (timestamp, id) of the row it names.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    timestamp, _, log_id = cursor.rpartition("_")
+    return (
+        datetime.strptime(timestamp, _CURSOR_TIME_FORMAT).replace(tzinfo=timezone.utc),
+        int(log_id),
+    )
+
+
+def clan_log_to_dict(log: ClanLog) -> dict:
+    """JSON-serializable form of a clan log row, including its cursor."""
+    return {
+        "id": log.id,
+        "clan_name": log.clan_name,
+        "member_username": log.member_username,
+        "message": log.message,
+        "timestamp": log.timestamp.astimezone(timezone.utc).strftime(_CURSOR_TIME_FORMAT),
+        "log_type": log.log_type,
+        "message_sent": log.message_sent,
+        "cursor": encode_cursor(log),
+    }
+
+
+async def iter_clan_log_pages(
+    filters: ClanLogFilter,
+    after: str | None = None,
+    limit: int | None = None,
+) -> AsyncIterator[list[ClanLog]]:
+    """Yield matching clan logs in (timestamp, id) order, one page at a time.
+
+    Args:
+        filters: Which logs to read
+        after: Cursor of the last row already received, if any
+        limit: Stop after this many rows (None reads to the end)
+
+    Raises:
+        ValueError: If after is not a valid cursor
+    """
+    conditions = []
+    if filters.log_types:
+        conditions.append(ClanLog.log_type.in_(filters.log_types))
+    if filters.member:
+        conditions.append(ClanLog.member_username == filters.member)
+    if filters.since:
+        conditions.append(ClanLog.timestamp >= filters.since)
+    if filters.until:
+        conditions.append(ClanLog.timestamp < filters.until)
+
+    position = decode_cursor(after) if after else None
+    remaining = limit
+
+    while remaining is None or remaining > 0:
+        stmt = select(ClanLog).where(*conditions)
+        if position is not None:
+            last_timestamp, last_id = position
+            # The first term is a plain range the index can seek to; the
+            # second breaks ties between rows sharing a timestamp
+            stmt = stmt.where(
+                ClanLog.timestamp >= last_timestamp,
+                or_(
+                    ClanLog.timestamp > last_timestamp,
+                    and_(ClanLog.timestamp == last_timestamp, ClanLog.id > last_id),
+                ),
+            )
+        page_size = PAGE_SIZE if remaining is None else min(PAGE_SIZE, remaining)
+        stmt = stmt.order_by(ClanLog.timestamp.asc(), ClanLog.id.asc()).limit(page_size)
+
+        async with async_session() as db:
+            page = list((await db.execute(stmt)).scalars().all())
+
+        if not page:
+            return
+        yield page
+
+        if len(page) < page_size:
+            return
+        if remaining is not None:
+            remaining -= len(page)
+        position = (page[-1].timestamp, page[-1].id)
+
+
+async def iter_clan_logs_after_id(last_id: int) -> AsyncIterator[list[ClanLog]]:
+    """Yield clan logs stored after the row with this id, in id order, one page at a time.
+
+    Row IDs only grow, so this is what a live feed missed since its last row.
+    """
+    while True:
+        stmt = select(ClanLog).where(ClanLog.id > last_id).order_by(ClanLog.id.asc()).limit(PAGE_SIZE)
+        async with async_session() as db:
+            page = list((await db.execute(stmt)).scalars().all())
+
+        if not page:
+            return
+        yield page
+
+        if len(page) < PAGE_SIZE:
+            return
+        last_id = page[-1].id
@@ -5,9 +5,11 @@ from datetime import datetime, timezone
 
 import aiohttp
 from discord.ext import tasks
-from sqlalchemy.dialects.sqlite import insert
 
-from src.db import async_session, ClanLog, ClanLogType, parse_log_type
+from src.db import async_session, ClanLog, ClanLogType, insert_ignore, parse_log_type
+from src.health import report_task_failure
+from src.metrics import api_trace, track_task
+from src.tasks.clanlog_stream import publish_clan_logs
 
 DEFAULT_CLAN_LOG_URL = "https://query.idleclans.com/api/Clan/logs/clan/KlutzCo"
 
@@ -57,7 +59,7 @@ async def fetch_and_store(url: str) -> None:
 
     for attempt in range(1, 4):
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with aiohttp.ClientSession(timeout=timeout, trace_configs=[api_trace("clan_log")]) as session:
                 async with session.get(url) as resp:
                     if resp.status < 200 or resp.status >= 300:
                         logging.warning("[clanlog] attempt %d returned status %d", attempt, resp.status)
@@ -79,37 +81,40 @@ async def fetch_and_store(url: str) -> None:
         try:
             parsed = _parse_messages(data)
 
-            inserted = 0
-            async with async_session() as db:
-                for msg in parsed:
-                    stmt = (
-                        insert(ClanLog)
-                        .values(**msg)
-                        .on_conflict_do_nothing(
-                            index_elements=["clan_name", "member_username", "message", "timestamp"],
-                        )
-                    )
+            inserted: list[ClanLog] = []
+            if parsed:
+                # One multi-row statement; RETURNING only yields the rows that were new
+                stmt = (
+                    insert_ignore(ClanLog, ["clan_name", "member_username", "message", "timestamp"])
+                    .values(parsed)
+                    .returning(*ClanLog.__table__.columns)
+                )
+                async with async_session() as db:
                     result = await db.execute(stmt)
-                    if result.rowcount:
-                        inserted += 1
-                await db.commit()
+                    inserted = [ClanLog(**row._mapping) for row in result]
+                    await db.commit()
 
-            logging.info("[clanlog] fetched %d messages from %s, inserted %d", len(parsed), url, inserted)
+            logging.info("[clanlog] fetched %d messages from %s, inserted %d", len(parsed), url, len(inserted))
+            publish_clan_logs(sorted(inserted, key=lambda log: log.id))
             return
         except Exception as e:
             logging.error("[clanlog] error parsing/storing messages: %s", e, exc_info=True)
+            report_task_failure(e)
             return
 
     logging.error("[clanlog] all attempts failed for %s", url)
+    report_task_failure(RuntimeError(f"all attempts failed for {url}"))
 
 
 @tasks.loop(hours=24)
+@track_task("bulk_fetch_clanlog")
 async def bulk_fetch_clanlog():
     base = _get_base_url()
     await fetch_and_store(f"{base}?limit=500")
 
 
 @tasks.loop(minutes=1)
+@track_task("recent_fetch_clanlog")
 async def recent_fetch_clanlog():
     base = _get_base_url()
     await fetch_and_store(f"{base}?limit=10")
@@ -0,0 +1,56 @@
+"""Live feed of newly stored clan logs, for the /clan-logs/stream SSE endpoint.
+
+fetch_and_store publishes every row it inserts. Each subscriber gets its own
+bounded queue; a subscriber that falls SUBSCRIBER_BUFFER rows behind is
+dropped instead of letting its queue grow. The stream handler then closes
+the response and the client reconnects with Last-Event-ID, catching up from
+the database.
+"""
+
+import asyncio
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from src.db import ClanLog
+
+SUBSCRIBER_BUFFER = 256
+
+
+@dataclass(eq=False)
+class Subscriber:
+    """One live feed consumer."""
+
+    queue: asyncio.Queue[ClanLog] = field(default_factory=lambda: asyncio.Queue(maxsize=SUBSCRIBER_BUFFER))
+    dropped: bool = False  # fell behind; its queue gets no more rows
+
+
+_subscribers: set[Subscriber] = set()
+
+
+@contextmanager
+def subscribe_clan_logs() -> Iterator[Subscriber]:
+    """Receive every clan log published while the context is open."""
+    subscriber = Subscriber()
+    _subscribers.add(subscriber)
+    try:
+        yield subscriber
+    finally:
+        _subscribers.discard(subscriber)
+
+
+def publish_clan_logs(logs: list[ClanLog]) -> None:
+    """Hand newly stored clan logs to every subscriber, in the given order."""
+    if not logs or not _subscribers:
+        return
+
+    for subscriber in list(_subscribers):
+        for log in logs:
+            try:
+                subscriber.queue.put_nowait(log)
+            except asyncio.QueueFull:
+                subscriber.dropped = True
+                _subscribers.discard(subscriber)
+                logging.warning("[clanlog_stream] subscriber fell %d rows behind, dropping it", SUBSCRIBER_BUFFER)
+                break
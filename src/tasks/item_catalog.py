@@ -0,0 +1,133 @@
+"""Market item catalog.
+
+Every rankable market item belongs to a category and carries one value
+attribute (healing for food, and so on). Commands score whole categories
+against the shared price map; adding a category only needs a Category entry
+and its items here.
+"""
+
+from dataclasses import dataclass
+
+from src.tasks.autocomplete import AutocompleteIndex
+
+
+@dataclass(frozen=True)
+class Category:
+    """A group of items ranked by the same value attribute."""
+
+    name: str
+    title: str
+    value_label: str  # unit of the value attribute, e.g. "HP"
+
+
+@dataclass(frozen=True)
+class CatalogItem:
+    """A market item and its value within its category."""
+
+    name_id: str
+    item_id: int
+    category: str
+    value: float
+
+
+@dataclass(frozen=True)
+class CategoryColumns:
+    """A category's items laid out column by column for batch scoring."""
+
+    name_ids: tuple[str, ...]
+    item_ids: tuple[int, ...]
+    values: tuple[float, ...]
+
+
+# Food items (name_id) and their healing values
+FOOD_HEALING_VALUES = {
+    "cooked_piranha": 2,
+    "cooked_perch": 3,
+    "cooked_mackerel": 4,
+    "cooked_cod": 6,
+    "cooked_trout": 7,
+    "cooked_salmon": 8,
+    "cooked_carp": 10,
+    "cooked_zander": 12,
+    "cooked_pufferfish": 14,
+    "cooked_anglerfish": 16,
+    "cooked_tuna": 17,
+    "cooked_bloodmoon_eel": 24,
+    "cooked_meat": 4,
+    "cooked_giant_meat": 8,
+    "cooked_quality_meat": 12,
+    "cooked_superior_meat": 18,
+    "cooked_apex_meat": 20,
+    "potato_soup": 5,
+    "meat_burger": 7,
+    "cod_soup": 10,
+    "blueberry_pie": 11,
+    "salmon_salad": 14,
+    "porcini_soup": 17,
+    "stew": 19,
+    "power_pizza": 22,
+}
+
+# Item ID mapping (name_id -> internal_id)
+ITEM_ID_MAPPING = {
+    "cooked_mackerel": 100,
+    "cooked_perch": 102,
+    "cooked_trout": 104,
+    "cooked_salmon": 105,
+    "cooked_carp": 106,
+    "cooked_meat": 114,
+    "cooked_giant_meat": 115,
+    "cooked_quality_meat": 116,
+    "cooked_superior_meat": 117,
+    "potato_soup": 140,
+    "meat_burger": 141,
+    "cod_soup": 143,
+    "blueberry_pie": 144,
+    "salmon_salad": 145,
+    "porcini_soup": 146,
+    "power_pizza": 148,
+    "cooked_anglerfish": 156,
+    "cooked_zander": 158,
+    "cooked_piranha": 160,
+    "cooked_pufferfish": 162,
+    "cooked_cod": 164,
+    "stew": 559,
+    "cooked_tuna": 562,
+    "cooked_bloodmoon_eel": 888,
+    "cooked_apex_meat": 906,
+}
+
+CATEGORIES = {
+    "food": Category(name="food", title="Food", value_label="HP"),
+}
+
+CATALOG: list[CatalogItem] = [
+    CatalogItem(name_id=name_id, item_id=ITEM_ID_MAPPING[name_id], category="food", value=healing)
+    for name_id, healing in FOOD_HEALING_VALUES.items()
+    if name_id in ITEM_ID_MAPPING
+]
+
+
+def _build_columns() -> dict[str, CategoryColumns]:
+    columns = {}
+    for category in CATEGORIES:
+        items = [item for item in CATALOG if item.category == category]
+        columns[category] = CategoryColumns(
+            name_ids=tuple(item.name_id for item in items),
+            item_ids=tuple(item.item_id for item in items),
+            values=tuple(item.value for item in items),
+        )
+    return columns
+
+
+_columns = _build_columns()
+
+# Item name autocomplete for every market command
+ITEM_INDEX = AutocompleteIndex(
+    (name_id.replace("_", " ").title(), name_id) for name_id in ITEM_ID_MAPPING
+)
+
+
+def get_category_columns(category: str) -> CategoryColumns | None:
+    """Return the column layout of a category, or None if it is unknown."""
+    return _columns.get(category)
@@ -0,0 +1,139 @@
+"""In-process job queue for long-running bot actions.
+
+HTTP triggers, scheduled loops and slash commands submit actions as jobs
+instead of running them inline:
+
+- an identical job (same action and parameters) that is still queued or
+  running is reused instead of starting a second one
+- jobs that touch the same resource run one at a time, in submission order
+- callers that don't need to wait (HTTP) get a job ID they can poll; others
+  await the job with wait_for_job
+
+Finished jobs are kept for status lookups until JOB_HISTORY newer ones have
+finished.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Literal
+
+JOB_HISTORY = 100
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+
+@dataclass
+class Job:
+    """A submitted action and its progress."""
+
+    job_id: str
+    action: str
+    params: dict[str, str]
+    resource: str
+    status: JobStatus = "queued"
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    error: str | None = None
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+    def to_dict(self) -> dict:
+        """JSON-serializable status of the job."""
+        return {
+            "job_id": self.job_id,
+            "action": self.action,
+            "params": self.params,
+            "status": self.status,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "error": self.error,
+        }
+
+
+_jobs: OrderedDict[str, Job] = OrderedDict()
+_inflight: dict[tuple, Job] = {}  # (action, params) -> queued or running job
+_locks: dict[str, asyncio.Lock] = {}
+
+
+def _job_key(action: str, params: dict[str, str]) -> tuple:
+    return (action, tuple(sorted(params.items())))
+
+
+def _prune_history() -> None:
+    finished = [job_id for job_id, job in _jobs.items() if job.finished_at is not None]
+    for job_id in finished[: max(len(finished) - JOB_HISTORY, 0)]:
+        del _jobs[job_id]
+
+
+async def _run(job: Job, func: Callable[[], Awaitable[None]]) -> None:
+    lock = _locks.setdefault(job.resource, asyncio.Lock())
+    try:
+        async with lock:
+            job.status = "running"
+            job.started_at = datetime.now(timezone.utc)
+            start = time.perf_counter()
+            await func()
+        job.status = "succeeded"
+        logging.info(
+            "[job_queue] %s %s (%s) finished in %.0f ms",
+            job.action,
+            job.params,
+            job.job_id,
+            (time.perf_counter() - start) * 1000,
+        )
+    except Exception as e:
+        job.status = "failed"
+        job.error = str(e) or type(e).__name__
+        logging.error("[job_queue] %s %s (%s) failed: %s", job.action, job.params, job.job_id, e, exc_info=True)
+    finally:
+        job.finished_at = datetime.now(timezone.utc)
+        _inflight.pop(_job_key(job.action, job.params), None)
+        _prune_history()
+
+
+def submit_job(
+    action: str,
+    params: dict[str, str],
+    func: Callable[[], Awaitable[None]],
+    resource: str,
+) -> tuple[Job, bool]:
+    """Queue an action, or return the identical one that is already in flight.
+
+    Args:
+        action: Name of the action, e.g. "boss-poll"
+        params: Parameters that make two submissions identical
+        func: Coroutine function that performs the action
+        resource: Jobs sharing a resource never run concurrently
+
+    Returns:
+        Tuple of (job, created); created is False for a de-duplicated submission
+    """
+    key = _job_key(action, params)
+    existing = _inflight.get(key)
+    if existing is not None:
+        logging.info("[job_queue] %s %s joined in-flight job %s", action, params, existing.job_id)
+        return existing, False
+
+    job = Job(job_id=uuid.uuid4().hex, action=action, params=params, resource=resource)
+    _jobs[job.job_id] = job
+    _inflight[key] = job
+    job.task = asyncio.create_task(_run(job, func))
+    return job, True
+
+
+async def wait_for_job(job: Job) -> Job:
+    """Wait until a job finishes. Cancelling the waiter doesn't cancel the job."""
+    await asyncio.shield(job.task)
+    return job
+
+
+def get_job(job_id: str) -> Job | None:
+    """Look up a queued, running or recently finished job."""
+    return _jobs.get(job_id)
@@ -0,0 +1,197 @@
+"""Market price history.
+
+Snapshots the shared price cache into the market_prices table on a schedule,
+only storing an item when its price changed since the last stored row. Trend
+queries read an indexed (item_id, fetched_at) range and their aggregates are
+cached until that item changes or the snapshot interval passes.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from discord.ext import tasks
+from sqlalchemy import func, select
+
+from src.db import MarketPrice, async_session, bulk_insert
+from src.health import report_task_failure
+from src.metrics import track_task
+from src.tasks.market_prices import get_average_prices, refresh_market_prices
+
+SNAPSHOT_MINUTES = 30
+
+
+@dataclass
+class PriceHistory:
+    """Aggregated price history of one item over a window."""
+
+    item_id: int
+    days: int
+    latest_price: float | None
+    latest_average_price: float | None
+    min_price: float | None
+    max_price: float | None
+    time_weighted_average: float | None
+    change_percent: float | None  # from the start of the window to now
+    changes: int  # stored price changes inside the window
+
+
+# item ID -> (lowest sell price, average price) of the last stored row
+_last_stored: dict[int, tuple[float, float | None]] = {}
+_last_stored_loaded = False
+
+# (item ID, days) -> (computed at, history), dropped when the item changes
+_history_cache: dict[tuple[int, int], tuple[float, PriceHistory]] = {}
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes even for timezone-aware columns
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+async def _load_last_stored() -> None:
+    global _last_stored_loaded
+
+    async with async_session() as db:
+        latest_ids = (
+            select(func.max(MarketPrice.id)).group_by(MarketPrice.item_id).scalar_subquery()
+        )
+        result = await db.execute(
+            select(MarketPrice.item_id, MarketPrice.lowest_sell_price, MarketPrice.average_price)
+            .where(MarketPrice.id.in_(latest_ids))
+        )
+        _last_stored.update(
+            {item_id: (price, average) for item_id, price, average in result.all()}
+        )
+    _last_stored_loaded = True
+    logging.info("[market_history] loaded last stored prices for %d items", len(_last_stored))
+
+
+async def snapshot_prices() -> int:
+    """Store every item whose price changed since its last stored row.
+
+    Returns:
+        Number of rows inserted
+    """
+    if not _last_stored_loaded:
+        await _load_last_stored()
+
+    prices = await refresh_market_prices()
+    averages = get_average_prices()
+    fetched_at = datetime.now(timezone.utc)
+
+    rows = []
+    for item_id, price in prices.items():
+        current = (price, averages.get(item_id))
+        if _last_stored.get(item_id) != current:
+            rows.append(
+                {
+                    "item_id": item_id,
+                    "fetched_at": fetched_at,
+                    "lowest_sell_price": price,
+                    "average_price": current[1],
+                }
+            )
+
+    if rows:
+        async with async_session() as db:
+            await bulk_insert(db, MarketPrice, rows)
+            await db.commit()
+
+        changed = {row["item_id"] for row in rows}
+        for row in rows:
+            _last_stored[row["item_id"]] = (row["lowest_sell_price"], row["average_price"])
+        for key in [key for key in _history_cache if key[0] in changed]:
+            del _history_cache[key]
+
+    logging.info(
+        "[market_history] stored %d changed prices out of %d items", len(rows), len(prices)
+    )
+    return len(rows)
+
+
+async def get_price_history(item_id: int, days: int) -> PriceHistory:
+    """Get trend and averages for an item from the stored history.
+
+    Args:
+        item_id: Market item ID
+        days: Size of the window, in days, ending now
+
+    Returns:
+        PriceHistory for the window
+    """
+    key = (item_id, days)
+    cached = _history_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < SNAPSHOT_MINUTES * 60:
+        return cached[1]
+
+    now = datetime.now(timezone.utc)
+    since = now - timedelta(days=days)
+    async with async_session() as db:
+        # The price in effect when the window starts, then every change inside it
+        before = (
+            await db.execute(
+                select(MarketPrice.fetched_at, MarketPrice.lowest_sell_price, MarketPrice.average_price)
+                .where(MarketPrice.item_id == item_id, MarketPrice.fetched_at < since)
+                .order_by(MarketPrice.fetched_at.desc())
+                .limit(1)
+            )
+        ).all()
+        inside = (
+            await db.execute(
+                select(MarketPrice.fetched_at, MarketPrice.lowest_sell_price, MarketPrice.average_price)
+                .where(MarketPrice.item_id == item_id, MarketPrice.fetched_at >= since)
+                .order_by(MarketPrice.fetched_at.asc())
+            )
+        ).all()
+
+    points = [(max(_as_utc(at), since), price, average) for at, price, average in before + inside]
+    history = PriceHistory(
+        item_id=item_id,
+        days=days,
+        latest_price=None,
+        latest_average_price=None,
+        min_price=None,
+        max_price=None,
+        time_weighted_average=None,
+        change_percent=None,
+        changes=len(inside),
+    )
+
+    if points:
+        weighted_sum = 0.0
+        total_seconds = 0.0
+        for (start, price, _), (end, _, _) in zip(points, points[1:] + [(now, None, None)]):
+            seconds = max((end - start).total_seconds(), 0.0)
+            weighted_sum += price * seconds
+            total_seconds += seconds
+
+        first_price = points[0][1]
+        prices = [price for _, price, _ in points]
+        history.latest_price = points[-1][1]
+        history.latest_average_price = points[-1][2]
+        history.min_price = min(prices)
+        history.max_price = max(prices)
+        history.time_weighted_average = (
+            weighted_sum / total_seconds if total_seconds > 0 else history.latest_price
+        )
+        if first_price:
+            history.change_percent = (history.latest_price - first_price) / first_price * 100
+
+    _history_cache[key] = (time.monotonic(), history)
+    return history
+
+
+@tasks.loop(minutes=SNAPSHOT_MINUTES)
+@track_task("snapshot_market_prices")
+async def snapshot_market_prices():
+    # Errors must not escape: an uncaught one stops the loop, and with it the
+    # price refreshes that alerts rely on
+    try:
+        await snapshot_prices()
+    except Exception as e:
+        logging.error("[market_history] failed to snapshot market prices: %s", e, exc_info=True)
+        report_task_failure(e)
@@ -0,0 +1,213 @@
+"""Shared market price cache.
+
+Prices come from the Idle Clans market API and are shared by every market
+command. A price map is fresh for PRICE_TTL_SECONDS; after that it is still
+served instantly (up to PRICE_MAX_STALE_SECONDS old) while one background
+refresh runs. Concurrent misses share a single in-flight request.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import aiohttp
+
+from src.metrics import api_trace
+
+MARKET_PRICES_URL = "https://query.idleclans.com/api/PlayerMarket/items/prices/latest?includeAveragePrice=true"
+AVERAGE_PRICE_FIELD = "averagePrice"  # returned because of includeAveragePrice=true
+
+PRICE_TTL_SECONDS = 60
+PRICE_MAX_STALE_SECONDS = 600
+
+
+@dataclass
+class PriceCacheStats:
+    """Snapshot of the price cache counters."""
+
+    hits: int
+    stale_hits: int
+    misses: int
+    refreshes: int
+    refresh_failures: int
+    age_seconds: float | None  # None until the first successful fetch
+    item_count: int
+
+
+_prices: dict[int, float] = {}
+_average_prices: dict[int, float] = {}
+_fetched_at: float | None = None  # time.monotonic() of the last successful fetch
+_inflight: asyncio.Task | None = None
+_counters = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "refresh_failures": 0}
+
+# Called with (previous prices, new prices) after every successful refresh
+_refresh_listeners: list[Callable[[dict[int, float], dict[int, float]], None]] = []
+
+
+async def _fetch_market_prices() -> tuple[dict[int, float], dict[int, float]]:
+    """Fetch latest market prices from the Idle Clans API.
+
+    Returns:
+        Tuple of (item ID -> lowest sell price, item ID -> average price)
+
+    Raises:
+        Exception: If all retry attempts fail
+    """
+    # Retry logic: 3 attempts with exponential backoff
+    for attempt in range(3):
+        try:
+            timeout = aiohttp.ClientTimeout(total=15)
+            async with aiohttp.ClientSession(
+                timeout=timeout, trace_configs=[api_trace("market_prices")]
+            ) as session:
+                async with session.get(MARKET_PRICES_URL) as response:
+                    if response.status != 200:
+                        logging.warning(
+                            "[market_prices] API returned status %d on attempt %d",
+                            response.status,
+                            attempt + 1,
+                        )
+                        if attempt < 2:
+                            continue
+                        raise Exception(f"API returned status {response.status}")
+
+                    data = await response.json()
+
+                    # Build price maps
+                    price_map = {}
+                    average_map = {}
+                    for item in data:
+                        item_id = item.get("itemId")
+                        lowest_price = item.get("lowestSellPrice")
+                        if item_id is not None and lowest_price is not None:
+                            price_map[item_id] = lowest_price
+                        average_price = item.get(AVERAGE_PRICE_FIELD)
+                        if item_id is not None and average_price is not None:
+                            average_map[item_id] = average_price
+
+                    logging.info(
+                        "[market_prices] fetched prices for %d items", len(price_map)
+                    )
+                    return price_map, average_map
+
+        except Exception as e:
+            logging.warning(
+                "[market_prices] attempt %d failed: %s", attempt + 1, e
+            )
+            if attempt == 2:
+                raise Exception(f"Failed after 3 attempts: {e}")
+
+    raise Exception("Failed to fetch market prices")
+
+
+def _age() -> float | None:
+    if _fetched_at is None:
+        return None
+    return time.monotonic() - _fetched_at
+
+
+async def _refresh() -> dict[int, float]:
+    global _prices, _average_prices, _fetched_at
+
+    _counters["refreshes"] += 1
+    try:
+        prices, average_prices = await _fetch_market_prices()
+    except Exception:
+        _counters["refresh_failures"] += 1
+        raise
+
+    previous = _prices
+    _prices = prices
+    _average_prices = average_prices
+    _fetched_at = time.monotonic()
+
+    for listener in _refresh_listeners:
+        try:
+            listener(previous, prices)
+        except Exception as e:
+            logging.error("[market_prices] refresh listener failed: %s", e, exc_info=True)
+    return prices
+
+
+def _log_refresh_failure(task: asyncio.Task) -> None:
+    # Background refreshes may have no awaiter; retrieve their errors here
+    if not task.cancelled() and task.exception() is not None:
+        logging.warning("[market_prices] refresh failed: %s", task.exception())
+
+
+def _start_refresh() -> asyncio.Task:
+    """Start a refresh unless one is already running, and return it."""
+    global _inflight
+
+    if _inflight is None or _inflight.done():
+        _inflight = asyncio.create_task(_refresh())
+        _inflight.add_done_callback(_log_refresh_failure)
+    return _inflight
+
+
+async def refresh_market_prices() -> dict[int, float]:
+    """Force a refresh, joining one that is already in flight.
+
+    Returns:
+        Dictionary mapping item ID to lowest sell price
+
+    Raises:
+        Exception: If the refresh fails
+    """
+    # Shield so a cancelled caller doesn't cancel the refresh for everyone else
+    return await asyncio.shield(_start_refresh())
+
+
+async def get_market_prices() -> dict[int, float]:
+    """Get market prices, served from the cache whenever possible.
+
+    Returns:
+        Dictionary mapping item ID to lowest sell price (treat as read-only)
+
+    Raises:
+        Exception: If there is no usable cached data and the fetch fails
+    """
+    age = _age()
+    if age is not None and age < PRICE_TTL_SECONDS:
+        _counters["hits"] += 1
+        return _prices
+
+    if age is not None and age < PRICE_MAX_STALE_SECONDS:
+        # Serve slightly stale data now, refresh in the background
+        _counters["stale_hits"] += 1
+        _start_refresh()
+        return _prices
+
+    _counters["misses"] += 1
+    return await refresh_market_prices()
+
+
+def add_refresh_listener(
+    listener: Callable[[dict[int, float], dict[int, float]], None],
+) -> None:
+    """Call listener(previous, current) after every successful refresh.
+
+    Listeners run synchronously inside the refresh, so they should only do
+    cheap bookkeeping and schedule anything slow as a task.
+    """
+    _refresh_listeners.append(listener)
+
+
+def get_average_prices() -> dict[int, float]:
+    """Return the average prices from the last successful fetch (may be empty)."""
+    return _average_prices
+
+
+def get_price_cache_stats() -> PriceCacheStats:
+    """Return hit/miss counters and the age of the cached prices."""
+    return PriceCacheStats(
+        hits=_counters["hits"],
+        stale_hits=_counters["stale_hits"],
+        misses=_counters["misses"],
+        refreshes=_counters["refreshes"],
+        refresh_failures=_counters["refresh_failures"],
+        age_seconds=_age(),
+        item_count=len(_prices),
+    )
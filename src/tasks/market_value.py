@@ -0,0 +1,68 @@
+"""Catalog-wide market value scoring.
+
+A category is scored as a batch: its item IDs, values and prices are handled
+as parallel columns, so one pass over the price map prices the whole category.
+The result for each category is kept until the shared price map is replaced.
+"""
+
+from dataclasses import dataclass
+
+from src.tasks.item_catalog import get_category_columns
+from src.tasks.pareto import pareto_frontier
+
+
+@dataclass
+class ValueResult:
+    """A scored catalog item."""
+
+    name: str
+    value: float
+    price: float
+    cost_per_value: float
+
+
+# category -> (price map it was scored against, non-dominated results)
+_scored: dict[str, tuple[dict[int, float], list[ValueResult]]] = {}
+
+
+def score_category(category: str, price_map: dict[int, float]) -> list[ValueResult]:
+    """Score every priced item of a category and drop the dominated ones.
+
+    Args:
+        category: Catalog category name
+        price_map: Dictionary mapping item ID to lowest sell price
+
+    Returns:
+        Non-dominated ValueResults sorted by cost per value (best first),
+        empty if the category is unknown or has no usable prices
+    """
+    cached = _scored.get(category)
+    # The price cache swaps in a new dict on every refresh, so identity is enough
+    if cached is not None and cached[0] is price_map:
+        return cached[1]
+
+    columns = get_category_columns(category)
+    if columns is None:
+        return []
+
+    prices = [price_map.get(item_id) for item_id in columns.item_ids]
+    valid = [i for i, price in enumerate(prices) if price is not None and price > 0]
+    results = [
+        ValueResult(
+            name=columns.name_ids[i],
+            value=columns.values[i],
+            price=prices[i],
+            cost_per_value=prices[i] / columns.values[i],
+        )
+        for i in valid
+    ]
+
+    results = pareto_frontier(
+        results,
+        value=lambda result: result.value,
+        costs=[lambda result: result.cost_per_value],
+    )
+    results.sort(key=lambda result: result.cost_per_value)
+
+    _scored[category] = (price_map, results)
+    return results
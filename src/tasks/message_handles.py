@@ -0,0 +1,100 @@
+"""Cached Discord message handles for the messages the bot tracks.
+
+Polls and summaries are messages we posted ourselves, so editing or deleting
+them doesn't need a REST fetch first: a PartialMessage built from the stored
+IDs is enough. Full Message objects are kept when we have them (from sends or
+a previous fetch) and refreshed from gateway edit/delete events, so a REST
+fetch only happens on a cache miss when the full message is really needed.
+"""
+
+import logging
+
+import discord
+
+# message ID -> full message, or a partial handle when only the IDs are known
+_handles: dict[int, discord.Message | discord.PartialMessage] = {}
+
+
+def remember_message(message: discord.Message) -> None:
+    """Cache a full message, e.g. right after sending or editing it."""
+    _handles[message.id] = message
+
+
+def forget_message(message_id: int) -> None:
+    """Drop a cached handle, e.g. once the message has been deleted."""
+    _handles.pop(message_id, None)
+
+
+def get_message_handle(
+    channel: discord.abc.Messageable, message_id: int
+) -> discord.Message | discord.PartialMessage:
+    """Return a handle for editing or deleting a message, without any REST call.
+
+    Args:
+        channel: Channel the message lives in
+        message_id: Discord message ID
+
+    Returns:
+        Cached full message if known, otherwise a cached partial message
+    """
+    handle = _handles.get(message_id)
+    if handle is None:
+        handle = channel.get_partial_message(message_id)
+        _handles[message_id] = handle
+    return handle
+
+
+async def fetch_full_message(
+    channel: discord.TextChannel, message_id: int
+) -> discord.Message:
+    """Return the full message, fetching it over REST only on a cache miss.
+
+    Args:
+        channel: Channel the message lives in
+        message_id: Discord message ID
+
+    Returns:
+        Full Discord message
+
+    Raises:
+        discord.NotFound: If the message no longer exists
+        discord.HTTPException: If fetching the message failed
+    """
+    handle = _handles.get(message_id)
+    if isinstance(handle, discord.Message):
+        return handle
+
+    message = await channel.fetch_message(message_id)
+    _handles[message_id] = message
+    return message
+
+
+def prime_message_handles(client: discord.Client, records: list[tuple[str, str]]) -> None:
+    """Create partial handles for the stored (channel_id, message_id) records.
+
+    Args:
+        client: Discord client instance
+        records: (channel_id, message_id) pairs from the scheduled messages
+    """
+    for channel_id, message_id in records:
+        if int(message_id) not in _handles:
+            channel = client.get_partial_messageable(int(channel_id))
+            _handles[int(message_id)] = channel.get_partial_message(int(message_id))
+    logging.info("[message_handles] primed %d message handles", len(records))
+
+
+def apply_message_edit(payload: discord.RawMessageUpdateEvent) -> None:
+    """Refresh a cached message from a gateway edit event."""
+    if payload.message_id in _handles:
+        _handles[payload.message_id] = payload.message
+
+
+def apply_message_delete(payload: discord.RawMessageDeleteEvent) -> None:
+    """Drop a cached message from a gateway delete event."""
+    forget_message(payload.message_id)
+
+
+def apply_bulk_message_delete(payload: discord.RawBulkMessageDeleteEvent) -> None:
+    """Drop cached messages from a gateway bulk delete event."""
+    for message_id in payload.message_ids:
+        forget_message(message_id)
@@ -1,13 +1,16 @@
 import asyncio
 import logging
 import os
+from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 
 import discord
 from discord.ext import tasks
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
 
 from src.db import async_session, ClanLog, ClanLogType
+from src.health import report_task_failure
+from src.metrics import OUTBOX_DEPTH, OUTBOX_OLDEST_AGE, register_collector, track_task
 from src.tasks.gold_donation import check_gold_donation
 from src.tasks.utils import find_channel_by_name
 
@@ -86,10 +89,30 @@ async def _send_pending(client: discord.Client) -> None:
                 await db.commit()
     except Exception as e:
         logging.error("[messagesender] unexpected error in _send_pending: %s", e, exc_info=True)
+        report_task_failure(e)
+
+
+async def _collect_outbox_metrics() -> None:
+    async with async_session() as db:
+        result = await db.execute(
+            select(func.count(ClanLog.id), func.min(ClanLog.timestamp))
+            .where(ClanLog.message_sent == False)  # noqa: E712
+        )
+        depth, oldest = result.one()
+
+    OUTBOX_DEPTH.set(value=depth)
+    if oldest is None:
+        OUTBOX_OLDEST_AGE.set(value=0)
+    else:
+        oldest = oldest if oldest.tzinfo else oldest.replace(tzinfo=timezone.utc)
+        OUTBOX_OLDEST_AGE.set(value=(datetime.now(timezone.utc) - oldest).total_seconds())
 
 
 def create_message_sender(client: discord.Client) -> tasks.Loop:
+    register_collector(_collect_outbox_metrics)
+
     @tasks.loop(seconds=30)
+    @track_task("send_messages")
     async def send_messages():
         await _send_pending(client)
 
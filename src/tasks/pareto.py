@@ -0,0 +1,75 @@
+"""Pareto-frontier filtering for market rankings.
+
+An item is dominated when another item has at least its value, no higher cost
+on any cost objective, and a strictly lower cost on at least one of them. With
+a single cost this is "heals >= HP and costs < per HP", the rule market-food
+has always used.
+
+Items are sorted once by value (highest first) and swept in that order, so
+every candidate dominator of an item has already been seen when the item is
+reached. With one cost objective the sweep only needs a running minimum,
+giving O(n log n) overall; with more it checks each item against the frontier
+built so far.
+"""
+
+from collections.abc import Callable, Sequence
+from itertools import groupby
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def _dominates(costs_a: tuple[float, ...], costs_b: tuple[float, ...]) -> bool:
+    # Values are already known to be >=, so only the costs decide
+    return all(a <= b for a, b in zip(costs_a, costs_b)) and costs_a != costs_b
+
+
+def pareto_frontier(
+    items: Sequence[T],
+    value: Callable[[T], float],
+    costs: Sequence[Callable[[T], float]],
+) -> list[T]:
+    """Return the items that are not dominated by any other item.
+
+    Args:
+        items: Items to filter
+        value: Objective to maximize (e.g. healing)
+        costs: One or more objectives to minimize (e.g. cost per healing)
+
+    Returns:
+        Non-dominated items, in their original order
+    """
+    if not costs:
+        raise ValueError("at least one cost objective is required")
+
+    values = [value(item) for item in items]
+    cost_columns = [[cost(item) for item in items] for cost in costs]
+    order = sorted(range(len(items)), key=values.__getitem__, reverse=True)
+
+    survivors: list[int] = []
+    if len(costs) == 1:
+        column = cost_columns[0]
+        running_min = float("inf")
+        # Items with equal value can dominate each other, so fold each group's
+        # minimum in before testing its members
+        for _, group in groupby(order, key=values.__getitem__):
+            group = list(group)
+            running_min = min(running_min, min(column[i] for i in group))
+            survivors.extend(i for i in group if column[i] <= running_min)
+    else:
+        rows = list(zip(*cost_columns))
+        frontier: list[tuple[float, ...]] = []
+        for _, group in groupby(order, key=values.__getitem__):
+            group = list(group)
+            kept = [
+                i
+                for i in group
+                if not any(_dominates(f, rows[i]) for f in frontier)
+                and not any(_dominates(rows[j], rows[i]) for j in group if j != i)
+            ]
+            # Dominance is transitive, so the frontier alone covers earlier groups
+            frontier.extend(rows[i] for i in kept)
+            survivors.extend(kept)
+
+    survivors.sort()
+    return [items[i] for i in survivors]
@@ -0,0 +1,187 @@
+"""In-memory reaction state for tracked boss poll messages.
+
+Participation is kept current from gateway reaction events so the boss summary
+can be rendered without paging through reaction users over REST. Each poll is
+seeded from REST once, either at startup or the first time it is needed.
+Gateway events that arrive while a poll is being seeded are applied right away
+and journaled, then replayed over the REST results so none are lost.
+"""
+
+import asyncio
+import logging
+import time
+
+import discord
+
+# Max concurrent reaction.users() requests while seeding a poll
+REACTION_FETCH_LIMIT = 4
+
+# message ID -> emoji -> IDs of (non-bot) users who reacted with it
+_poll_reactions: dict[int, dict[str, set[int]]] = {}
+
+# message ID -> (action, emoji, user ID) events seen while the poll is seeding
+_seeding: dict[int, list[tuple[str, str | None, int | None]]] = {}
+
+
+def is_tracked(message_id: int) -> bool:
+    """Return whether reaction state is held for a message."""
+    return message_id in _poll_reactions
+
+
+def track_poll(message_id: int, emojis: list[str]) -> None:
+    """Start tracking a freshly posted poll with no participants yet.
+
+    Args:
+        message_id: Discord message ID of the poll
+        emojis: Emojis offered on the poll
+    """
+    _poll_reactions[message_id] = {emoji: set() for emoji in emojis}
+
+
+def untrack_poll(message_id: int) -> None:
+    """Stop tracking a poll, e.g. once it has been replaced."""
+    _poll_reactions.pop(message_id, None)
+    _seeding.pop(message_id, None)
+
+
+def get_poll_reactions(message_id: int) -> dict[str, set[int]]:
+    """Return emoji -> user IDs for a tracked poll (empty if untracked)."""
+    return _poll_reactions.get(message_id, {})
+
+
+async def seed_poll(message: discord.Message, emojis: tuple[str, ...]) -> dict[str, set[int]]:
+    """Seed reaction state for a poll from REST.
+
+    Every option is tracked even if its reaction is missing from the message
+    (e.g. the bot's own seed reaction failed), so later gateway adds for it
+    aren't dropped. The state is registered before the REST fetch; events
+    received meanwhile are replayed over the fetched users.
+
+    Args:
+        message: Poll message fetched from Discord
+        emojis: Emojis offered on the poll
+
+    Returns:
+        Mapping of emoji to user IDs who reacted with it
+    """
+    start = time.perf_counter()
+    semaphore = asyncio.Semaphore(REACTION_FETCH_LIMIT)
+
+    async def fetch_users(reaction: discord.Reaction) -> set[int]:
+        users = set()
+        async with semaphore:
+            try:
+                async for user in reaction.users():
+                    if not user.bot:
+                        users.add(user.id)
+            except discord.HTTPException as e:
+                logging.error(
+                    "[poll_reactions] failed to fetch users for reaction %s: %s",
+                    reaction.emoji,
+                    e,
+                )
+        return users
+
+    state: dict[str, set[int]] = {emoji: set() for emoji in emojis}
+    for reaction in message.reactions:
+        state.setdefault(str(reaction.emoji), set())
+    _poll_reactions[message.id] = state
+    journal = _seeding[message.id] = []
+
+    try:
+        results = await asyncio.gather(*(fetch_users(r) for r in message.reactions))
+    finally:
+        if _seeding.get(message.id) is journal:
+            del _seeding[message.id]
+
+    for reaction, users in zip(message.reactions, results):
+        state[str(reaction.emoji)].update(users)
+    # A fetched page may predate an event, so events win over the REST results
+    for action, emoji, user_id in journal:
+        _apply(state, action, emoji, user_id)
+
+    logging.info(
+        "[poll_reactions] seeded poll %s with %d reactions in %.0f ms",
+        message.id,
+        len(state),
+        (time.perf_counter() - start) * 1000,
+    )
+    return state
+
+
+def _apply(state: dict[str, set[int]], action: str, emoji: str | None, user_id: int | None) -> bool:
+    """Apply one add/remove/clear event to a poll's state.
+
+    Returns:
+        True if the state changed
+    """
+    if action == "clear" and emoji is None:
+        changed = any(state.values())
+        for users in state.values():
+            users.clear()
+        return changed
+    users = state.get(emoji)
+    if users is None:
+        return False
+    if action == "add":
+        if user_id in users:
+            return False
+        users.add(user_id)
+    elif action == "remove":
+        if user_id not in users:
+            return False
+        users.discard(user_id)
+    else:
+        if not users:
+            return False
+        users.clear()
+    return True
+
+
+def _handle(message_id: int, action: str, emoji: str | None, user_id: int | None) -> bool:
+    state = _poll_reactions.get(message_id)
+    if state is None:
+        return False
+    journal = _seeding.get(message_id)
+    if journal is not None:
+        journal.append((action, emoji, user_id))
+    return _apply(state, action, emoji, user_id)
+
+
+def apply_reaction_add(payload: discord.RawReactionActionEvent) -> bool:
+    """Apply a gateway reaction add to the tracked state.
+
+    Args:
+        payload: Raw reaction event
+
+    Returns:
+        True if the event changed a tracked poll
+    """
+    if payload.member is not None and payload.member.bot:
+        return False
+    return _handle(payload.message_id, "add", str(payload.emoji), payload.user_id)
+
+
+def apply_reaction_remove(payload: discord.RawReactionActionEvent) -> bool:
+    """Apply a gateway reaction removal to the tracked state.
+
+    Args:
+        payload: Raw reaction event
+
+    Returns:
+        True if the event changed a tracked poll
+    """
+    return _handle(payload.message_id, "remove", str(payload.emoji), payload.user_id)
+
+
+def apply_reaction_clear(message_id: int, emoji: str | None = None) -> bool:
+    """Apply a gateway reaction clear (all reactions, or a single emoji).
+
+    Args:
+        message_id: Message whose reactions were cleared
+        emoji: Cleared emoji, or None when every reaction was cleared
+
+    Returns:
+        True if the event changed a tracked poll
+    """
+    return _handle(message_id, "clear", emoji, None)
@@ -0,0 +1,204 @@
+"""Market price alerts.
+
+Members subscribe to "tell me when item X drops below Y gold". Subscriptions
+are stored in the database and held in memory as one sorted threshold list
+per item. Alerts are one-shot and every held threshold is at or below the
+last seen price, so after a refresh only items whose price dropped are looked
+at, and the fired alerts are exactly the tail of that item's list above the
+new price (found by bisection).
+"""
+
+import asyncio
+import bisect
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import discord
+from sqlalchemy import delete, insert, select
+
+from src.db import PriceAlert, async_session
+from src.tasks.item_catalog import ITEM_ID_MAPPING
+from src.tasks.market_prices import add_refresh_listener
+
+ITEM_NAMES = {item_id: name_id for name_id, item_id in ITEM_ID_MAPPING.items()}
+
+
+@dataclass(frozen=True)
+class AlertInfo:
+    """An active price alert."""
+
+    alert_id: int
+    user_id: str
+    item_id: int
+    threshold: float
+
+
+_alerts: dict[int, AlertInfo] = {}
+# item ID -> [(threshold, alert ID)], kept sorted
+_thresholds: dict[int, list[tuple[float, int]]] = {}
+# Delivery tasks in flight, referenced so they aren't garbage collected
+_deliveries: set[asyncio.Task] = set()
+
+
+def _hold(alert: AlertInfo) -> None:
+    _alerts[alert.alert_id] = alert
+    bisect.insort(_thresholds.setdefault(alert.item_id, []), (alert.threshold, alert.alert_id))
+
+
+def _release(alert_id: int) -> AlertInfo | None:
+    alert = _alerts.pop(alert_id, None)
+    if alert is not None:
+        thresholds = _thresholds[alert.item_id]
+        thresholds.remove((alert.threshold, alert.alert_id))
+        if not thresholds:
+            del _thresholds[alert.item_id]
+    return alert
+
+
+async def load_price_alerts() -> None:
+    """Load all stored alerts into memory. Call once on startup."""
+    try:
+        async with async_session() as db:
+            result = await db.execute(
+                select(PriceAlert.id, PriceAlert.user_id, PriceAlert.item_id, PriceAlert.threshold)
+            )
+            rows = result.all()
+    except Exception as e:
+        logging.error("[price_alerts] failed to load price alerts: %s", e, exc_info=True)
+        return
+
+    _alerts.clear()
+    _thresholds.clear()
+    for alert_id, user_id, item_id, threshold in rows:
+        _hold(AlertInfo(alert_id=alert_id, user_id=user_id, item_id=item_id, threshold=threshold))
+    logging.info(
+        "[price_alerts] loaded %d alerts for %d items", len(_alerts), len(_thresholds)
+    )
+
+
+async def add_price_alert(user_id: str, item_id: int, threshold: float) -> AlertInfo:
+    """Store a new alert. The caller checks the price isn't already below it.
+
+    Args:
+        user_id: Discord user ID to notify
+        item_id: Market item ID
+        threshold: Notify once the lowest sell price drops below this
+
+    Returns:
+        The stored alert
+    """
+    async with async_session() as db:
+        result = await db.execute(
+            insert(PriceAlert)
+            .values(
+                user_id=user_id,
+                item_id=item_id,
+                threshold=threshold,
+                created_at=datetime.now(timezone.utc),
+            )
+            .returning(PriceAlert.id)
+        )
+        alert_id = result.scalar_one()
+        await db.commit()
+
+    alert = AlertInfo(alert_id=alert_id, user_id=user_id, item_id=item_id, threshold=threshold)
+    _hold(alert)
+    return alert
+
+
+async def remove_price_alert(user_id: str, alert_id: int) -> bool:
+    """Remove one of a user's alerts.
+
+    Returns:
+        True if the alert existed and belonged to the user
+    """
+    alert = _alerts.get(alert_id)
+    if alert is None or alert.user_id != user_id:
+        return False
+
+    async with async_session() as db:
+        await db.execute(delete(PriceAlert).where(PriceAlert.id == alert_id))
+        await db.commit()
+    _release(alert_id)
+    return True
+
+
+def list_price_alerts(user_id: str) -> list[AlertInfo]:
+    """Return a user's active alerts, grouped by item, lowest threshold first."""
+    return sorted(
+        (alert for alert in _alerts.values() if alert.user_id == user_id),
+        key=lambda alert: (alert.item_id, alert.threshold),
+    )
+
+
+def _crossed_alerts(previous: dict[int, float], current: dict[int, float]) -> list[AlertInfo]:
+    """Pop every alert whose threshold the new prices dropped below."""
+    # Only items that got cheaper (or are newly listed) can cross a threshold
+    dropped = {
+        item_id
+        for item_id, price in current.items()
+        if item_id not in previous or price < previous[item_id]
+    }
+
+    fired = []
+    # Set intersection walks whichever side is smaller
+    for item_id in dropped & _thresholds.keys():
+        price = current[item_id]
+        thresholds = _thresholds[item_id]
+        start = bisect.bisect_right(thresholds, (price, float("inf")))
+        for _, alert_id in thresholds[start:]:
+            fired.append(_alerts.pop(alert_id))
+        del thresholds[start:]
+        if not thresholds:
+            del _thresholds[item_id]
+    return fired
+
+
+def _item_name(item_id: int) -> str:
+    return ITEM_NAMES.get(item_id, str(item_id)).replace("_", " ").title()
+
+
+async def _deliver(client: discord.Client, fired: list[AlertInfo], prices: dict[int, float]) -> None:
+    for alert in fired:
+        try:
+            user = client.get_user(int(alert.user_id)) or await client.fetch_user(int(alert.user_id))
+            await user.send(
+                f"📉 **{_item_name(alert.item_id)}** is now {prices[alert.item_id]:,.0f} g, "
+                f"below your alert at {alert.threshold:,.0f} g."
+            )
+        except discord.HTTPException as e:
+            logging.warning(
+                "[price_alerts] could not notify user %s for alert %d: %s",
+                alert.user_id,
+                alert.alert_id,
+                e,
+            )
+
+    # Alerts are one-shot, so they are removed even if the DM could not be sent
+    try:
+        async with async_session() as db:
+            await db.execute(
+                delete(PriceAlert).where(PriceAlert.id.in_([alert.alert_id for alert in fired]))
+            )
+            await db.commit()
+    except Exception as e:
+        logging.error("[price_alerts] failed to delete delivered alerts: %s", e, exc_info=True)
+    logging.info("[price_alerts] delivered %d alerts", len(fired))
+
+
+def register_price_alert_notifier(client: discord.Client) -> None:
+    """Evaluate alerts after every market price refresh.
+
+    Args:
+        client: Discord client used to DM the subscribers
+    """
+
+    def on_refresh(previous: dict[int, float], current: dict[int, float]) -> None:
+        fired = _crossed_alerts(previous, current)
+        if fired:
+            task = asyncio.create_task(_deliver(client, fired, current))
+            _deliveries.add(task)
+            task.add_done_callback(_deliveries.discard)
+
+    add_refresh_listener(on_refresh)
@@ -2,63 +2,125 @@
 
 This module provides helper functions for managing scheduled message records,
 including upsert, retrieval, and deletion operations.
+
+The table only holds a handful of rows, so it is mirrored in an in-memory
+write-through cache keyed by (type, channel_id): it is loaded once at startup,
+reads never touch the database, and writes update the cache only after the
+database transaction commits.
 """
 
 import logging
 from datetime import datetime, timezone
 
 from sqlalchemy import delete, select
-from sqlalchemy.dialects.sqlite import insert
 
-from src.db import MessageType, ScheduledMessage, async_session
+from src.db import MessageType, ScheduledMessage, async_session, upsert
 
+# (type, channel_id) -> message_id, mirrors the scheduled_messages table
+_cache: dict[tuple[str, str], str] = {}
+_loaded = False
 
-async def upsert_scheduled_message(
-    message_type: MessageType,
-    channel_id: str,
-    message_id: str,
+
+async def load_scheduled_messages() -> None:
+    """Load every scheduled message record into the cache.
+
+    Raises:
+        Exception: If database operation fails
+    """
+    global _loaded
+
+    async with async_session() as db:
+        result = await db.execute(
+            select(ScheduledMessage.type, ScheduledMessage.channel_id, ScheduledMessage.message_id)
+        )
+        rows = result.all()
+
+    _cache.clear()
+    _cache.update({(type_, channel_id): message_id for type_, channel_id, message_id in rows})
+    _loaded = True
+    logging.info("[scheduled_message_ops] loaded %d scheduled message records", len(_cache))
+
+
+async def _ensure_loaded() -> None:
+    if not _loaded:
+        await load_scheduled_messages()
+
+
+async def write_scheduled_messages(
+    upserts: dict[tuple[MessageType, str], str] | None = None,
+    deletes: list[tuple[MessageType, str]] | None = None,
 ) -> None:
-    """Insert or update a scheduled message record.
+    """Apply related record changes in a single transaction.
 
     Args:
-        message_type: Type of scheduled message (DAILY, WEEKLY, BOSS_SUMMARY)
-        channel_id: Discord channel ID where message was posted
-        message_id: Discord message ID of the posted message
+        upserts: (type, channel_id) -> message_id records to insert or update
+        deletes: (type, channel_id) records to remove
 
     Raises:
         Exception: If database operation fails
     """
+    upserts = upserts or {}
+    deletes = deletes or []
+    if not upserts and not deletes:
+        return
+
     try:
+        await _ensure_loaded()
+        now = datetime.now(timezone.utc)
         async with async_session() as db:
-            stmt = (
-                insert(ScheduledMessage)
-                .values(
-                    type=message_type,
-                    channel_id=channel_id,
-                    message_id=message_id,
-                    created_at=datetime.now(timezone.utc),
+            for message_type, channel_id in deletes:
+                await db.execute(
+                    delete(ScheduledMessage).where(
+                        ScheduledMessage.type == message_type,
+                        ScheduledMessage.channel_id == channel_id,
+                    )
                 )
-                .on_conflict_do_update(
-                    index_elements=["type", "channel_id"],
-                    set_={
-                        "message_id": message_id,
-                        "created_at": datetime.now(timezone.utc),
-                    },
+            for (message_type, channel_id), message_id in upserts.items():
+                await db.execute(
+                    upsert(ScheduledMessage, ["type", "channel_id"], ["message_id", "created_at"])
+                    .values(
+                        type=message_type,
+                        channel_id=channel_id,
+                        message_id=message_id,
+                        created_at=now,
+                    )
                 )
-            )
-            await db.execute(stmt)
             await db.commit()
-            logging.info(
-                "[scheduled_message_ops] upserted %s message for channel %s",
-                message_type,
-                channel_id,
-            )
     except Exception as e:
         logging.error(
-            "[scheduled_message_ops] failed to upsert message: %s", e, exc_info=True
+            "[scheduled_message_ops] failed to write messages: %s", e, exc_info=True
         )
         raise
 
+    for message_type, channel_id in deletes:
+        _cache.pop((message_type, channel_id), None)
+    for (message_type, channel_id), message_id in upserts.items():
+        _cache[(message_type, channel_id)] = message_id
+
+    logging.info(
+        "[scheduled_message_ops] wrote %d upserts and %d deletes",
+        len(upserts),
+        len(deletes),
+    )
+
+
+async def upsert_scheduled_message(
+    message_type: MessageType,
+    channel_id: str,
+    message_id: str,
+) -> None:
+    """Insert or update a scheduled message record.
+
+    Args:
+        message_type: Type of scheduled message (DAILY, WEEKLY, BOSS_SUMMARY)
+        channel_id: Discord channel ID where message was posted
+        message_id: Discord message ID of the posted message
+
+    Raises:
+        Exception: If database operation fails
+    """
+    await write_scheduled_messages(upserts={(message_type, channel_id): message_id})
+
 
 async def get_scheduled_message(
     message_type: MessageType,
@@ -66,6 +128,8 @@ async def get_scheduled_message(
 ) -> str | None:
     """Get message ID for a given type and channel.
 
+    Served from the cache; only the very first call may hit the database.
+
     Args:
         message_type: Type of scheduled message to retrieve
         channel_id: Discord channel ID to look up
@@ -74,26 +138,18 @@ async def get_scheduled_message(
         Message ID if found, None otherwise
     """
     try:
-        async with async_session() as db:
-            stmt = select(ScheduledMessage.message_id).where(
-                ScheduledMessage.type == message_type,
-                ScheduledMessage.channel_id == channel_id,
-            )
-            result = await db.execute(stmt)
-            message_id = result.scalar_one_or_none()
-            if message_id:
-                logging.info(
-                    "[scheduled_message_ops] found %s message %s in channel %s",
-                    message_type,
-                    message_id,
-                    channel_id,
-                )
-            return message_id
+        await _ensure_loaded()
     except Exception as e:
         logging.error(
             "[scheduled_message_ops] failed to get message: %s", e, exc_info=True
         )
         return None
+    return _cache.get((message_type, channel_id))
+
+
+def list_scheduled_messages() -> list[tuple[str, str]]:
+    """Return the cached (channel_id, message_id) pairs of every record."""
+    return [(channel_id, message_id) for (_, channel_id), message_id in _cache.items()]
 
 
 async def delete_scheduled_message(
@@ -107,18 +163,7 @@ async def delete_scheduled_message(
         channel_id: Discord channel ID to delete from
     """
     try:
-        async with async_session() as db:
-            stmt = delete(ScheduledMessage).where(
-                ScheduledMessage.type == message_type,
-                ScheduledMessage.channel_id == channel_id,
-            )
-            await db.execute(stmt)
-            await db.commit()
-            logging.info(
-                "[scheduled_message_ops] deleted %s message record for channel %s",
-                message_type,
-                channel_id,
-            )
+        await write_scheduled_messages(deletes=[(message_type, channel_id)])
     except Exception as e:
         logging.error(
             "[scheduled_message_ops] failed to delete message: %s", e, exc_info=True
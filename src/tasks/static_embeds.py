@@ -0,0 +1,33 @@
+"""Pre-rendered embeds for static reference commands.
+
+Commands whose answers only depend on fixed data (/boss, /keys, ...) render
+every answer once at import with render_static_embeds and then just look the
+embed up per call. The cache is a read-only mapping and the embeds in it are
+shared between calls, so handlers must send them as-is and never modify them.
+"""
+
+from collections.abc import Callable, Iterable, Mapping
+from types import MappingProxyType
+from typing import TypeVar
+
+import discord
+
+T = TypeVar("T")
+
+
+def render_static_embeds(
+    entries: Iterable[T],
+    key: Callable[[T], str],
+    render: Callable[[T], discord.Embed],
+) -> Mapping[str, discord.Embed]:
+    """Render an embed for every entry, once.
+
+    Args:
+        entries: Static data entries
+        key: Lookup key of an entry (what the command's option value holds)
+        render: Builds the embed for an entry
+
+    Returns:
+        Read-only mapping of key to pre-rendered embed
+    """
+    return MappingProxyType({key(entry): render(entry) for entry in entries})
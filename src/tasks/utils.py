@@ -1,6 +1,7 @@
 import discord
 
 _channel_cache: dict[str, discord.TextChannel] = {}
+_channels_cache: dict[str, list[discord.TextChannel]] = {}
 
 
 def find_channel_by_name(client: discord.Client, name: str) -> discord.TextChannel | None:
@@ -13,3 +14,42 @@ def find_channel_by_name(client: discord.Client, name: str) -> discord.TextChann
             _channel_cache[name] = channel
             return channel
     return None
+
+
+def find_channels(client: discord.Client, spec: str) -> list[discord.TextChannel]:
+    """Resolve a comma-separated list of channel IDs and/or names.
+
+    Names resolve like find_channel_by_name (first match); use channel IDs to
+    target same-named channels in several guilds.
+
+    Args:
+        client: Discord client instance
+        spec: e.g. "tactical-dispatch,123456789012345678"
+
+    Returns:
+        Resolved text channels, in configuration order, without duplicates
+    """
+    cached = _channels_cache.get(spec)
+    if cached is not None:
+        return cached
+
+    channels: list[discord.TextChannel] = []
+    missing = False
+    for entry in (part.strip() for part in spec.split(",")):
+        if not entry:
+            continue
+        if entry.isdigit():
+            channel = client.get_channel(int(entry))
+            if not isinstance(channel, discord.TextChannel):
+                channel = None
+        else:
+            channel = find_channel_by_name(client, entry)
+        if channel is None:
+            missing = True
+        elif channel not in channels:
+            channels.append(channel)
+
+    # Only cache complete resolutions so channels created later are picked up
+    if not missing:
+        _channels_cache[spec] = channels
+    return channels
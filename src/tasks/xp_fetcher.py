@@ -1,9 +1,11 @@
 import asyncio
 import logging
+import os
 from datetime import datetime, time, timezone
 from zoneinfo import ZoneInfo
 
 import aiohttp
+import discord
 from discord.ext import tasks
 
 EST = ZoneInfo("America/New_York")
@@ -11,6 +13,10 @@ FETCH_TIMES = [time(hour=h, tzinfo=EST) for h in (0, 6, 12, 18)]
 
 from src.db import async_session
 from src.db.models import PlayerXpSnapshot
+from src.health import report_task_failure
+from src.metrics import api_trace, track_task
+from src.tasks.utils import find_channel_by_name
+from src.tasks.xp_tracker import LevelUp, load_history, record_snapshot
 
 _SNAPSHOT_COLUMNS = {c.key for c in PlayerXpSnapshot.__table__.columns}
 
@@ -27,6 +33,8 @@ PLAYER_NAMES = (
 
 API_BASE = "https://query.idleclans.com/api/Player/profile"
 
+DEFAULT_LEVEL_UP_CHANNEL = "general"
+
 
 async def _fetch_player(
     session: aiohttp.ClientSession, player_name: str
@@ -61,41 +69,81 @@ async def _fetch_player(
             continue
 
     logging.error("[xp_fetcher] all attempts failed for %s", player_name)
+    report_task_failure(RuntimeError(f"all attempts failed for {player_name}"))
     return None
 
 
-@tasks.loop(time=FETCH_TIMES)
-async def fetch_player_xp() -> None:
-    fetched_at = datetime.now(timezone.utc)
-    timeout = aiohttp.ClientTimeout(total=15)
-    stored = 0
-
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        for player_name in PLAYER_NAMES:
-            skill_xp = await _fetch_player(session, player_name)
-            if skill_xp is None:
-                continue
-
-            try:
-                filtered_xp = {k: v for k, v in skill_xp.items() if k in _SNAPSHOT_COLUMNS}
-                async with async_session() as db:
-                    db.add(
-                        PlayerXpSnapshot(
-                            player_name=player_name,
-                            fetched_at=fetched_at,
-                            **filtered_xp,
+async def _announce_level_ups(client: discord.Client, level_ups: list[LevelUp]) -> None:
+    channel_name = os.getenv("LEVEL_UP_CHANNEL", DEFAULT_LEVEL_UP_CHANNEL)
+    channel = find_channel_by_name(client, channel_name)
+    if channel is None:
+        logging.warning("[xp_fetcher] channel %s not found, cannot announce level-ups", channel_name)
+        return
+
+    lines = []
+    for level_up in level_ups:
+        line = f"🎉 **{level_up.player_name}** reached **{level_up.skill.capitalize()} {level_up.new_level}**"
+        gained = level_up.new_level - level_up.old_level
+        if gained > 1:
+            line += f" (+{gained} levels)"
+        lines.append(line)
+    try:
+        await channel.send("\n".join(lines))
+        logging.info("[xp_fetcher] announced %d level-ups", len(level_ups))
+    except discord.HTTPException as e:
+        logging.error("[xp_fetcher] failed to announce level-ups: %s", e)
+
+
+async def load_xp_history() -> None:
+    """Seed the level/forecast tracker from stored snapshots."""
+    try:
+        await load_history(PLAYER_NAMES)
+    except Exception as e:
+        logging.error("[xp_fetcher] failed to load XP history: %s", e, exc_info=True)
+
+
+def create_xp_fetcher(client: discord.Client) -> tasks.Loop:
+    @tasks.loop(time=FETCH_TIMES)
+    @track_task("fetch_player_xp")
+    async def fetch_player_xp() -> None:
+        fetched_at = datetime.now(timezone.utc)
+        timeout = aiohttp.ClientTimeout(total=15)
+        stored = 0
+        level_ups: list[LevelUp] = []
+
+        async with aiohttp.ClientSession(timeout=timeout, trace_configs=[api_trace("player_profile")]) as session:
+            for player_name in PLAYER_NAMES:
+                skill_xp = await _fetch_player(session, player_name)
+                if skill_xp is None:
+                    continue
+
+                try:
+                    filtered_xp = {k: v for k, v in skill_xp.items() if k in _SNAPSHOT_COLUMNS}
+                    async with async_session() as db:
+                        db.add(
+                            PlayerXpSnapshot(
+                                player_name=player_name,
+                                fetched_at=fetched_at,
+                                **filtered_xp,
+                            )
                         )
+                        await db.commit()
+                    stored += 1
+                    level_ups.extend(record_snapshot(player_name, fetched_at, filtered_xp))
+                except Exception as e:
+                    logging.error(
+                        "[xp_fetcher] error storing snapshot for %s: %s",
+                        player_name,
+                        e,
+                        exc_info=True,
                     )
-                    await db.commit()
-                stored += 1
-            except Exception as e:
-                logging.error(
-                    "[xp_fetcher] error storing snapshot for %s: %s",
-                    player_name,
-                    e,
-                    exc_info=True,
-                )
-
-    logging.info(
-        "[xp_fetcher] cycle complete: stored %d/%d snapshots", stored, len(PLAYER_NAMES)
-    )
+                    report_task_failure(e)
+
+        logging.info(
+            "[xp_fetcher] cycle complete: stored %d/%d snapshots", stored, len(PLAYER_NAMES)
+        )
+
+        if level_ups:
+            await _announce_level_ups(client, level_ups)
+
+    return fetch_player_xp
@@ -0,0 +1,212 @@
+"""Player XP tracking: level-up detection and time-to-level forecasts.
+
+Keeps a short in-memory window of recent snapshots per player so each fetch
+cycle can be compared with the previous one without going back to the database.
+Forecasts are cached per (player, skill) and only recomputed once a new snapshot
+for that player has been recorded.
+"""
+
+import bisect
+import logging
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from src.db import async_session
+from src.db.models import PlayerXpSnapshot
+
+MAX_LEVEL = 120
+FORECAST_WINDOW = 28  # 7 days of 6-hourly snapshots
+
+
+def _build_level_thresholds(max_level: int) -> tuple[int, ...]:
+    """Build the cumulative XP needed for each level (classic RuneScape curve).
+
+    Args:
+        max_level: Highest reachable level
+
+    Returns:
+        Tuple where index i holds the XP required to reach level i + 1
+    """
+    thresholds = [0]
+    points = 0
+    for level in range(1, max_level):
+        points += int(level + 300 * 2 ** (level / 7))
+        thresholds.append(points // 4)
+    return tuple(thresholds)
+
+
+LEVEL_THRESHOLDS = _build_level_thresholds(MAX_LEVEL)
+
+SKILL_NAMES = tuple(
+    column.key
+    for column in PlayerXpSnapshot.__table__.columns
+    if column.key not in ("id", "player_name", "fetched_at")
+)
+
+
+@dataclass
+class LevelUp:
+    """A skill level gained between two consecutive snapshots."""
+
+    player_name: str
+    skill: str
+    old_level: int
+    new_level: int
+
+
+@dataclass
+class Forecast:
+    """Projected time to the next level for one player skill."""
+
+    player_name: str
+    skill: str
+    level: int
+    xp: int
+    next_level_xp: int | None  # None at max level
+    xp_per_hour: float
+    eta: timedelta | None  # None when max level or no recent progress
+    window_hours: float
+
+
+# player name -> recent (fetched_at, {skill: xp}) snapshots, oldest first
+_history: dict[str, deque[tuple[datetime, dict[str, int]]]] = {}
+_forecast_cache: dict[tuple[str, str], Forecast | None] = {}
+
+
+def level_for_xp(xp: int) -> int:
+    """Return the level reached with the given amount of XP."""
+    return bisect.bisect_right(LEVEL_THRESHOLDS, xp)
+
+
+def xp_for_level(level: int) -> int:
+    """Return the XP required to reach the given level."""
+    return LEVEL_THRESHOLDS[level - 1]
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes even for timezone-aware columns
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _skill_xp(snapshot: PlayerXpSnapshot) -> dict[str, int]:
+    return {
+        skill: getattr(snapshot, skill)
+        for skill in SKILL_NAMES
+        if getattr(snapshot, skill) is not None
+    }
+
+
+async def load_history(player_names: tuple[str, ...]) -> None:
+    """Seed the in-memory history with each player's most recent snapshots.
+
+    Args:
+        player_names: Players to load history for
+    """
+    async with async_session() as db:
+        for player_name in player_names:
+            stmt = (
+                select(PlayerXpSnapshot)
+                .where(PlayerXpSnapshot.player_name == player_name)
+                .order_by(PlayerXpSnapshot.fetched_at.desc())
+                .limit(FORECAST_WINDOW)
+            )
+            result = await db.execute(stmt)
+            rows = result.scalars().all()
+            _history[player_name] = deque(
+                ((_as_utc(row.fetched_at), _skill_xp(row)) for row in reversed(rows)),
+                maxlen=FORECAST_WINDOW,
+            )
+            _invalidate_forecasts(player_name)
+
+    logging.info("[xp_tracker] loaded XP history for %d players", len(player_names))
+
+
+def _invalidate_forecasts(player_name: str) -> None:
+    for key in [key for key in _forecast_cache if key[0] == player_name]:
+        del _forecast_cache[key]
+
+
+def record_snapshot(
+    player_name: str, fetched_at: datetime, skill_xp: dict[str, int]
+) -> list[LevelUp]:
+    """Record a new snapshot and report the levels gained since the previous one.
+
+    Args:
+        player_name: Player the snapshot belongs to
+        fetched_at: When the snapshot was fetched
+        skill_xp: Mapping of skill name to total XP
+
+    Returns:
+        List of level-ups, empty on the first snapshot for a player
+    """
+    history = _history.setdefault(player_name, deque(maxlen=FORECAST_WINDOW))
+    level_ups = []
+
+    if history:
+        _, previous_xp = history[-1]
+        for skill, xp in skill_xp.items():
+            old_xp = previous_xp.get(skill)
+            if old_xp is None or xp is None or xp <= old_xp:
+                continue
+            old_level = level_for_xp(old_xp)
+            new_level = level_for_xp(xp)
+            if new_level > old_level:
+                level_ups.append(LevelUp(player_name, skill, old_level, new_level))
+
+    history.append((_as_utc(fetched_at), {k: v for k, v in skill_xp.items() if v is not None}))
+    _invalidate_forecasts(player_name)
+    return level_ups
+
+
+def _compute_forecast(player_name: str, skill: str) -> Forecast | None:
+    history = _history.get(player_name)
+    if not history:
+        return None
+
+    points = [(at, xp[skill]) for at, xp in history if skill in xp]
+    if not points:
+        return None
+
+    first_at, first_xp = points[0]
+    last_at, last_xp = points[-1]
+    window_hours = (last_at - first_at).total_seconds() / 3600
+    xp_per_hour = (last_xp - first_xp) / window_hours if window_hours > 0 else 0.0
+
+    level = level_for_xp(last_xp)
+    next_level_xp = xp_for_level(level + 1) if level < MAX_LEVEL else None
+
+    eta = None
+    if next_level_xp is not None and xp_per_hour > 0:
+        eta = timedelta(hours=(next_level_xp - last_xp) / xp_per_hour)
+
+    return Forecast(
+        player_name=player_name,
+        skill=skill,
+        level=level,
+        xp=last_xp,
+        next_level_xp=next_level_xp,
+        xp_per_hour=xp_per_hour,
+        eta=eta,
+        window_hours=window_hours,
+    )
+
+
+def get_forecast(player_name: str, skill: str) -> Forecast | None:
+    """Return the time-to-next-level forecast for a player skill.
+
+    Args:
+        player_name: Player to forecast
+        skill: Skill name (snapshot column)
+
+    Returns:
+        Forecast, or None if there is no history for that player skill
+    """
+    key = (player_name, skill)
+    if key not in _forecast_cache:
+        _forecast_cache[key] = _compute_forecast(player_name, skill)
+    return _forecast_cache[key]